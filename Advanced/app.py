@@ -1,1027 +1,1336 @@
-import flet as ft
-import random
-import os
-import pandas as pd
-import polars as pl
-import plotly.express as px
-import io
-import base64
-from datetime import datetime
-
-def main(page: ft.Page):
-    # Page setup
-    page.title = "Rock Paper Scissors Game"
-    page.padding = 0
-    page.theme_mode = ft.ThemeMode.LIGHT
-    page.bgcolor = ft.Colors.BLUE_GREY_50
-    
-    # Excel file path
-    excel_file = os.path.join(os.path.dirname(__file__), "rps_data.xlsx")
-    
-    # Game state variables
-    user_score = 0
-    computer_score = 0
-    choices = ["rock", "paper", "scissors"]
-    current_view = "dashboard"  # Changed default view to dashboard
-    username = "Prithika"  # Add username
-    
-    # Create references properly
-    score_text_ref = ft.Ref[ft.Text]()
-    status_message_ref = ft.Ref[ft.Text]()
-    user_choice_text_ref = ft.Ref[ft.Text]()
-    computer_choice_text_ref = ft.Ref[ft.Text]()
-    stats_content_ref = ft.Ref[ft.Column]()
-    history_table_ref = ft.Ref[ft.DataTable]()
-    content_area_ref = ft.Ref[ft.Container]()
-    dashboard_content_ref = ft.Ref[ft.Column]()  # Add new reference for dashboard content
-    
-    # Create logo for sidebar - Added this definition
-    logo_container = ft.Container(
-        content=ft.Column([
-            ft.Container(
-                content=ft.Icon(
-                    ft.Icons.SPORTS_ESPORTS,
-                    size=50,
-                    color=ft.Colors.BLUE_700,
-                ),
-                padding=10,
-                border_radius=50,
-                bgcolor=ft.Colors.BLUE_50,
-            ),
-            ft.Text("RPS Game", size=18, weight=ft.FontWeight.BOLD),
-        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5),
-        margin=ft.margin.only(bottom=30, top=20),
-    )
-    
-    # Initialize Excel file if it doesn't exist
-    def init_excel_file():
-        if not os.path.exists(excel_file):
-            # Create game history sheet
-            history_df = pd.DataFrame(columns=["timestamp", "user_choice", "computer_choice", "result"])
-            # Create game stats sheet
-            stats_df = pd.DataFrame({
-                "metric": ["user_wins", "computer_wins", "ties", "total_games"],
-                "value": [0, 0, 0, 0]
-            })
-            
-            # Save to Excel with multiple sheets
-            with pd.ExcelWriter(excel_file) as writer:
-                history_df.to_excel(writer, sheet_name="history", index=False)
-                stats_df.to_excel(writer, sheet_name="stats", index=False)
-
-    # Game logic functions
-    def determine_winner(user_pick, computer_pick):
-        nonlocal user_score, computer_score
-        
-        if user_pick == computer_pick:
-            return "It's a tie!"
-        
-        if (user_pick == "rock" and computer_pick == "scissors") or \
-           (user_pick == "paper" and computer_pick == "rock") or \
-           (user_pick == "scissors" and computer_pick == "paper"):
-            user_score += 1
-            return "You win!"
-        else:
-            computer_score += 1
-            return "Computer wins!"
-    
-    # Save game result to Excel
-    def save_game_result(user_choice, computer_choice, result):
-        # Read existing data
-        try:
-            history_df = pd.read_excel(excel_file, sheet_name="history")
-            stats_df = pd.read_excel(excel_file, sheet_name="stats")
-        except:
-            init_excel_file()
-            history_df = pd.DataFrame(columns=["timestamp", "user_choice", "computer_choice", "result"])
-            stats_df = pd.DataFrame({
-                "metric": ["user_wins", "computer_wins", "ties", "total_games"],
-                "value": [0, 0, 0, 0]
-            })
-        
-        # Add new game to history
-        new_game = pd.DataFrame({
-            "timestamp": [datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
-            "user_choice": [user_choice],
-            "computer_choice": [computer_choice],
-            "result": [result]
-        })
-        history_df = pd.concat([history_df, new_game], ignore_index=True)
-        
-        # Update stats
-        stats_df.loc[stats_df["metric"] == "total_games", "value"] += 1
-        
-        if result == "You win!":
-            stats_df.loc[stats_df["metric"] == "user_wins", "value"] += 1
-        elif result == "Computer wins!":
-            stats_df.loc[stats_df["metric"] == "computer_wins", "value"] += 1
-        else:  # Tie
-            stats_df.loc[stats_df["metric"] == "ties", "value"] += 1
-        
-        # Save updated data
-        with pd.ExcelWriter(excel_file) as writer:
-            history_df.to_excel(writer, sheet_name="history", index=False)
-            stats_df.to_excel(writer, sheet_name="stats", index=False)
-            
-        # Update stats page if it's currently displayed
-        if current_view == "stats":
-            update_stats_view()
-
-    # Button click handler
-    def handle_choice(e, choice):
-        # Get computer's choice
-        computer_choice = random.choice(choices)
-        
-        # Update choice displays
-        user_choice_text_ref.current.value = f"Your choice: {choice.capitalize()}"
-        computer_choice_text_ref.current.value = f"Computer's choice: {computer_choice.capitalize()}"
-        
-        # Determine winner and update score
-        result = determine_winner(choice, computer_choice)
-        status_message_ref.current.value = result
-        score_text_ref.current.value = f"You: {user_score}  |  Computer: {computer_score}"
-        
-        # Save to Excel
-        save_game_result(choice, computer_choice, result)
-        
-        # Update UI
-        page.update()
-    
-    # Reset game function
-    def reset_game(e):
-        nonlocal user_score, computer_score
-        user_score = computer_score = 0
-        
-        score_text_ref.current.value = f"You: {user_score}  |  Computer: {computer_score}"
-        status_message_ref.current.value = "Choose your move!"
-        user_choice_text_ref.current.value = "Your choice: "
-        computer_choice_text_ref.current.value = "Computer's choice: "
-        page.update()
-    
-    # Update stats view function
-    def update_stats_view():
-        try:
-            # Get reference to stats content
-            stats_content = stats_content_ref.current
-            stats_content.controls.clear()
-            
-            # Read stats from Excel using polars
-            # Check if file exists first
-            if not os.path.exists(excel_file):
-                init_excel_file()
-                
-            stats_df = pl.read_excel(excel_file, sheet_name="stats")
-            history_df = pl.read_excel(excel_file, sheet_name="history")
-            
-            # Extract metrics
-            metrics = stats_df.to_dict(as_series=False)
-            total_games = metrics["value"][metrics["metric"].index("total_games")]
-            user_wins = metrics["value"][metrics["metric"].index("user_wins")]
-            computer_wins = metrics["value"][metrics["metric"].index("computer_wins")]
-            ties = metrics["value"][metrics["metric"].index("ties")]
-            
-            # Add summary text
-            stats_content.controls.append(
-                ft.Text(f"Total Games: {total_games}", size=24, weight=ft.FontWeight.BOLD)
-            )
-            stats_content.controls.append(
-                ft.Text(f"Your Wins: {user_wins} ({user_wins/total_games*100:.1f}% win rate)" if total_games > 0 else "Your Wins: 0", 
-                       size=20, color=ft.Colors.GREEN)
-            )
-            stats_content.controls.append(
-                ft.Text(f"Computer Wins: {computer_wins} ({computer_wins/total_games*100:.1f}% win rate)" if total_games > 0 else "Computer Wins: 0", 
-                       size=20, color=ft.Colors.RED)
-            )
-            stats_content.controls.append(
-                ft.Text(f"Ties: {ties} ({ties/total_games*100:.1f}% tie rate)" if total_games > 0 else "Ties: 0", 
-                       size=20, color=ft.Colors.BLUE)
-            )
-            
-            # Only create visualizations if there's data
-            if total_games > 0:
-                # Create pie chart data for win distribution
-                pie_data = {"Category": ["You", "Computer", "Ties"], 
-                           "Count": [user_wins, computer_wins, ties]}
-                pie_df = pd.DataFrame(pie_data)
-                
-                # Add win distribution chart
-                stats_content.controls.append(
-                    ft.Text("Win Distribution", size=22, weight=ft.FontWeight.W_500, 
-                           text_align=ft.TextAlign.CENTER)
-                )
-                
-                # Add pie chart container
-                win_chart = ft.Container(
-                    content=ft.Row([
-                        ft.Container(
-                            content=ft.Text(f"You: {user_wins}", color=ft.Colors.GREEN, size=16),
-                            padding=10,
-                            bgcolor=ft.Colors.GREEN_50,
-                            border_radius=5,
-                            width=120,
-                        ),
-                        ft.Container(
-                            content=ft.Text(f"Computer: {computer_wins}", color=ft.Colors.RED, size=16),
-                            padding=10,
-                            bgcolor=ft.Colors.RED_50,
-                            border_radius=5,
-                            width=120,
-                        ),
-                        ft.Container(
-                            content=ft.Text(f"Ties: {ties}", color=ft.Colors.BLUE, size=16),
-                            padding=10,
-                            bgcolor=ft.Colors.BLUE_50,
-                            border_radius=5,
-                            width=120,
-                        ),
-                    ], alignment=ft.MainAxisAlignment.CENTER, spacing=20),
-                    margin=ft.margin.only(top=10, bottom=20),
-                )
-                stats_content.controls.append(win_chart)
-                
-                # Create win percentage by choice chart if enough data
-                if total_games >= 5 and len(history_df) > 0:
-                    # Add choice analysis header
-                    stats_content.controls.append(
-                        ft.Text("Performance by Choice", size=22, weight=ft.FontWeight.W_500,
-                               text_align=ft.TextAlign.CENTER)
-                    )
-                    
-                    # Process data for each choice
-                    choice_stats = {}
-                    for choice in choices:
-                        # Filter games with this choice
-                        choice_games = history_df.filter(pl.col("user_choice") == choice)
-                        if len(choice_games) > 0:
-                            # Calculate wins
-                            choice_wins = choice_games.filter(pl.col("result") == "You win!").height
-                            win_rate = (choice_wins / len(choice_games)) * 100
-                            choice_stats[choice] = {
-                                "total": len(choice_games),
-                                "wins": choice_wins,
-                                "win_rate": win_rate
-                            }
-                    
-                    # Create choice performance chart
-                    choice_chart = ft.Row(
-                        [
-                            ft.Container(
-                                content=ft.Column([
-                                    ft.Icon(ft.Icons.CIRCLE, size=40, color=ft.Colors.BLUE_700),
-                                    ft.Text("Rock", size=16, weight=ft.FontWeight.BOLD),
-                                    ft.Text(f"{choice_stats.get('rock', {}).get('total', 0)} games", size=14),
-                                    ft.Text(f"{choice_stats.get('rock', {}).get('win_rate', 0):.1f}% wins", 
-                                           size=16, 
-                                           color=ft.Colors.GREEN if choice_stats.get('rock', {}).get('win_rate', 0) > 50 else ft.Colors.RED),
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5),
-                                padding=15,
-                                bgcolor=ft.Colors.BLUE_GREY_50,
-                                border_radius=10,
-                                width=150,
-                            ),
-                            ft.Container(
-                                content=ft.Column([
-                                    ft.Icon(ft.Icons.SQUARE_OUTLINED, size=40, color=ft.Colors.TEAL_700),
-                                    ft.Text("Paper", size=16, weight=ft.FontWeight.BOLD),
-                                    ft.Text(f"{choice_stats.get('paper', {}).get('total', 0)} games", size=14),
-                                    ft.Text(f"{choice_stats.get('paper', {}).get('win_rate', 0):.1f}% wins", 
-                                           size=16, 
-                                           color=ft.Colors.GREEN if choice_stats.get('paper', {}).get('win_rate', 0) > 50 else ft.Colors.RED),
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5),
-                                padding=15,
-                                bgcolor=ft.Colors.BLUE_GREY_50,
-                                border_radius=10,
-                                width=150,
-                            ),
-                            ft.Container(
-                                content=ft.Column([
-                                    ft.Icon(ft.Icons.CONTENT_CUT, size=40, color=ft.Colors.PURPLE_700),
-                                    ft.Text("Scissors", size=16, weight=ft.FontWeight.BOLD),
-                                    ft.Text(f"{choice_stats.get('scissors', {}).get('total', 0)} games", size=14),
-                                    ft.Text(f"{choice_stats.get('scissors', {}).get('win_rate', 0):.1f}% wins", 
-                                           size=16, 
-                                           color=ft.Colors.GREEN if choice_stats.get('scissors', {}).get('win_rate', 0) > 50 else ft.Colors.RED),
-                                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5),
-                                padding=15,
-                                bgcolor=ft.Colors.BLUE_GREY_50,
-                                border_radius=10,
-                                width=150,
-                            ),
-                        ],
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        spacing=15,
-                    )
-                    stats_content.controls.append(choice_chart)
-            
-            page.update()
-        except Exception as e:
-            print(f"Error updating stats: {e}")
-            stats_content_ref.current.controls.clear()
-            stats_content_ref.current.controls.append(ft.Text(f"Error loading statistics: {str(e)}"))
-            page.update()
-    
-    # Update history view function
-    def update_history_view():
-        try:
-            # Get reference to history table
-            history_table = history_table_ref.current
-            history_table.rows.clear()
-            
-            # Read history from Excel
-            if os.path.exists(excel_file):
-                history_df = pd.read_excel(excel_file, sheet_name="history")
-                
-                # Add rows to table (most recent first)
-                for idx, row in history_df.iloc[::-1].iterrows():
-                    history_table.rows.append(
-                        ft.DataRow(
-                            cells=[
-                                ft.DataCell(ft.Text(row["timestamp"])),
-                                ft.DataCell(ft.Text(row["user_choice"].capitalize())),
-                                ft.DataCell(ft.Text(row["computer_choice"].capitalize())),
-                                ft.DataCell(ft.Text(row["result"]))
-                            ]
-                        )
-                    )
-            
-            page.update()
-        except Exception as e:
-            print(f"Error updating history: {e}")
-            history_table_ref.current.rows.append(
-                ft.DataRow(
-                    cells=[ft.DataCell(ft.Text(f"Error loading history: {str(e)}"))]
-                )
-            )
-            page.update()
-    
-    # Tab navigation function
-    def change_tab(e):
-        nonlocal current_view
-        selected_tab = e.control.selected_index
-        
-        if selected_tab == 0:  # Dashboard tab
-            current_view = "dashboard"
-            content_area_ref.current.content = dashboard_view
-            update_dashboard_view()
-        elif selected_tab == 1:  # Game tab
-            current_view = "game"
-            content_area_ref.current.content = game_view
-        elif selected_tab == 2:  # Stats tab
-            current_view = "stats"
-            content_area_ref.current.content = stats_view
-            update_stats_view()
-        elif selected_tab == 3:  # History tab
-            current_view = "history"
-            content_area_ref.current.content = history_view
-            update_history_view()
-        
-        page.update()
-    
-    # Get time-based greeting
-    def get_greeting():
-        current_hour = datetime.now().hour
-        
-        if 5 <= current_hour < 12:
-            return "Good morning"
-        elif 12 <= current_hour < 17:
-            return "Good afternoon"
-        elif 17 <= current_hour < 21:
-            return "Good evening"
-        else:
-            return "Good night"
-    
-    # Update dashboard view function
-    def update_dashboard_view():
-        try:
-            # Get reference to dashboard content
-            dashboard_content = dashboard_content_ref.current
-            dashboard_content.controls.clear()
-            
-            # Update greeting based on time
-            greeting = get_greeting()
-            
-            # Add welcome card
-            welcome_card = ft.Card(
-                content=ft.Container(
-                    width=1600,expand=True,
-                    content=ft.Column([
-                        ft.Text(f"{greeting}, {username}!", 
-                               size=28, 
-                               weight=ft.FontWeight.BOLD,
-                               color=ft.Colors.BLUE_700),
-                        ft.Text(f"Welcome to your Rock Paper Scissors dashboard",
-                               size=16,
-                               color=ft.Colors.BLUE_GREY_800),
-                        ft.Text(f"Today: {datetime.now().strftime('%A, %B %d, %Y')}",
-                               size=14,
-                               color=ft.Colors.BLUE_GREY_600),
-                    ]),
-                    padding=20,
-                    gradient=ft.LinearGradient(
-                        begin=ft.alignment.top_left,
-                        end=ft.alignment.bottom_right,
-                        colors=[ft.Colors.BLUE_50, ft.Colors.INDIGO_50],
-                    ),
-                ),
-                elevation=4,
-                margin=ft.margin.only(bottom=25, top=10),
-            )
-            dashboard_content.controls.append(welcome_card)
-            
-            # Check if we have game data to show
-            if not os.path.exists(excel_file):
-                init_excel_file()
-                
-            stats_df = pl.read_excel(excel_file, sheet_name="stats")
-            history_df = pl.read_excel(excel_file, sheet_name="history")
-            
-            # Extract metrics more safely
-            metrics = stats_df.to_dict(as_series=False)
-            
-            # Handle case when DataFrame might be empty
-            if "metric" not in metrics or "value" not in metrics or len(metrics["metric"]) == 0:
-                total_games = 0
-                user_wins = 0
-                computer_wins = 0
-                ties = 0
-            else:
-                # Find indices safely with default values
-                total_games_idx = metrics["metric"].index("total_games") if "total_games" in metrics["metric"] else 0
-                user_wins_idx = metrics["metric"].index("user_wins") if "user_wins" in metrics["metric"] else 0
-                computer_wins_idx = metrics["metric"].index("computer_wins") if "computer_wins" in metrics["metric"] else 0
-                ties_idx = metrics["metric"].index("ties") if "ties" in metrics["metric"] else 0
-                
-                total_games = metrics["value"][total_games_idx]
-                user_wins = metrics["value"][user_wins_idx]
-                computer_wins = metrics["value"][computer_wins_idx]
-                ties = metrics["value"][ties_idx]
-            
-            # Add quick stats cards
-            dashboard_content.controls.append(
-                ft.Text("Game Overview", size=20, weight=ft.FontWeight.W_600)
-            )
-            
-            # Stats cards row
-            stats_row = ft.Row(
-                controls=[
-                    ft.Card(
-                        content=ft.Container(
-                            content=ft.Column([
-                                ft.Text("Total Games", size=16, color=ft.Colors.BLUE_GREY_700),
-                                ft.Text(f"{total_games}", size=32, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-                            ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            padding=15,
-                            width=150,
-                            height=120,
-                        ),
-                        elevation=3,
-                    ),
-                    ft.Card(
-                        content=ft.Container(
-                            content=ft.Column([
-                                ft.Text("Win Rate", size=16, color=ft.Colors.BLUE_GREY_700),
-                                ft.Text(f"{(user_wins/total_games*100):.1f}%" if total_games > 0 else "0%", 
-                                      size=32, 
-                                      weight=ft.FontWeight.BOLD, 
-                                      color=ft.Colors.GREEN),
-                            ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            padding=15,
-                            width=150,
-                            height=120,
-                        ),
-                        elevation=3,
-                    ),
-                    ft.Card(
-                        content=ft.Container(
-                            content=ft.Column([
-                                ft.Text("Best Choice", size=16, color=ft.Colors.BLUE_GREY_700),
-                                ft.Text(get_best_choice(history_df) if total_games > 5 else "Play more!",
-                                      size=22 if total_games > 5 else 18, 
-                                      weight=ft.FontWeight.BOLD, 
-                                      color=ft.Colors.BLUE_700),
-                            ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            padding=15,
-                            width=150,
-                            height=120,
-                        ),
-                        elevation=3,
-                    ),
-                ],
-                alignment=ft.MainAxisAlignment.CENTER,
-                spacing=20,
-            )
-            dashboard_content.controls.append(stats_row)
-            
-            # Add recent games section if there are games
-            if total_games > 0:
-                dashboard_content.controls.append(
-                    ft.Container(height=30)  # Spacer
-                )
-                dashboard_content.controls.append(
-                    ft.Text("Recent Activity", size=20, weight=ft.FontWeight.W_600)
-                )
-                
-                # Recent games list
-                recent_games = ft.ListView(
-                    height=180,
-                    spacing=2,
-                    padding=10,
-                    divider_thickness=1,
-                )
-                
-                # Get the most recent 5 games - use a safer approach
-                recent_history = history_df.head(min(5, len(history_df)))
-                
-                for row in recent_history.iter_rows(named=True):
-                    # Process each row safely
-                    user_choice = row.get("user_choice", "unknown")
-                    computer_choice = row.get("computer_choice", "unknown")
-                    result = row.get("result", "unknown")
-                    
-                    # Determine icon based on user choice
-                    if user_choice == "rock":
-                        icon = ft.Icon(ft.Icons.CIRCLE, color=ft.Colors.BLUE_700, size=20)
-                    elif user_choice == "paper":
-                        icon = ft.Icon(ft.Icons.SQUARE_OUTLINED, color=ft.Colors.TEAL_700, size=20)
-                    else:  # scissors or unknown
-                        icon = ft.Icon(ft.Icons.CONTENT_CUT, color=ft.Colors.PURPLE_700, size=20)
-                    
-                    # Determine result color
-                    if result == "You win!":
-                        result_color = ft.Colors.GREEN
-                    elif result == "Computer wins!":
-                        result_color = ft.Colors.RED
-                    else:
-                        result_color = ft.Colors.BLUE
-                    
-                    # Add to recent games list
-                    recent_games.controls.append(
-                        ft.Container(
-                            content=ft.Row([
-                                icon,
-                                ft.Text(f"{user_choice.capitalize()} vs {computer_choice.capitalize()}", 
-                                      expand=True),
-                                ft.Text(result, color=result_color),
-                            ]),
-                            padding=ft.padding.symmetric(vertical=8, horizontal=15),
-                            border_radius=5,
-                            bgcolor=ft.Colors.WHITE,
-                        )
-                    )
-                
-                dashboard_content.controls.append(
-                    ft.Container(
-                        content=recent_games,
-                        border=ft.border.all(1, ft.Colors.BLUE_GREY_200),
-                        border_radius=10,
-                        padding=ft.padding.only(top=10, bottom=10),
-                        margin=ft.margin.only(bottom=20),
-                    )
-                )
-                
-                # Add trend analysis if enough games
-                if total_games >= 10:
-                    dashboard_content.controls.append(
-                        ft.Text("Performance Trend", size=20, weight=ft.FontWeight.W_600)
-                    )
-                    
-                    # Create a visual trend indicator
-                    trend_container = create_trend_visualization(history_df)
-                    dashboard_content.controls.append(trend_container)
-            
-            page.update()
-        except Exception as e:
-            print(f"Error updating dashboard: {e}")
-            import traceback
-            traceback.print_exc()  # Add detailed error logging
-            dashboard_content_ref.current.controls.clear()
-            dashboard_content_ref.current.controls.append(
-                ft.Text(f"Error loading dashboard: {str(e)}")
-            )
-            page.update()
-    
-    # Helper function to get the best choice based on win rate
-    def get_best_choice(history_df):
-        if len(history_df) == 0:
-            return "N/A"
-        
-        choice_stats = {}
-        for choice in choices:
-            choice_games = history_df.filter(pl.col("user_choice") == choice)
-            if len(choice_games) > 0:
-                wins = choice_games.filter(pl.col("result") == "You win!").height
-                win_rate = (wins / len(choice_games)) * 100
-                choice_stats[choice] = win_rate
-        
-        if not choice_stats:
-            return "Play more!"
-            
-        # Get the choice with highest win rate
-        best_choice = max(choice_stats.items(), key=lambda x: x[1])
-        return f"{best_choice[0].capitalize()}"
-    
-    # Helper function to create trend visualization
-    def create_trend_visualization(history_df):
-        # Transform data to get cumulative win rate over time
-        wins = []
-        current_wins = 0
-        total = 0
-        win_rates = []
-        
-        # Process each game and calculate running win rate
-        for idx, row in history_df.iter_rows(named=True):
-            total += 1
-            if row["result"] == "You win!":
-                current_wins += 1
-            win_rate = (current_wins / total) * 100
-            win_rates.append(win_rate)
-        
-        # Create a simplified trend visualization
-        trend_container = ft.Container(
-            content=ft.Row([
-                ft.Column([
-                    ft.Container(
-                        content=ft.Row([
-                            ft.Container(
-                                bgcolor=ft.Colors.BLUE_200 if i < len(win_rates) else ft.Colors.GREY_300,
-                                height=max(5, min(70, win_rates[i] if i < len(win_rates) else 0)),
-                                width=10,
-                                border_radius=ft.border_radius.only(top_left=5, top_right=5),
-                                tooltip=f"{win_rates[i]:.1f}%" if i < len(win_rates) else "No data",
-                            ) for i in range(min(15, total))
-                        ], alignment=ft.MainAxisAlignment.CENTER, spacing=5),
-                        padding=10,
-                    ),
-                    ft.Text("Game History Trend (Win Rate %)", size=14, color=ft.Colors.BLUE_GREY_600),
-                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER)
-            ], alignment=ft.MainAxisAlignment.CENTER),
-            margin=ft.margin.only(bottom=20, top=10),
-        )
-        
-        return trend_container
-    
-    # Create a function to create header with user icon for all tabs
-    def create_tab_header(title):
-        return ft.Container(
-            content=ft.Row(
-                [
-                    ft.Text(
-                        title,
-                        size=32, 
-                        weight=ft.FontWeight.BOLD,
-                        color=ft.Colors.BLUE_700,
-                    ),
-                    ft.Container(width=20),  # Spacer
-                    ft.Container(
-                        content=ft.PopupMenuButton(
-                            icon=ft.Icons.ACCOUNT_CIRCLE,
-                            icon_size=36,
-                            icon_color=ft.Colors.BLUE_700,
-                            tooltip="User Options",
-                            items=[
-                                ft.PopupMenuItem(
-                                    text="My Profile",
-                                    icon=ft.Icons.PERSON,
-                                    on_click=lambda _: show_profile_dialog(page)
-                                ),
-                                ft.PopupMenuItem(
-                                    text="Logout",
-                                    icon=ft.Icons.LOGOUT,
-                                    on_click=lambda _: show_logout_snackbar(page)
-                                ),
-                            ],
-                        ),
-                        alignment=ft.alignment.center_right,
-                    ),
-                ],
-                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-            ),
-            padding=ft.padding.only(left=15, right=15, top=15, bottom=5),
-            border_radius=ft.border_radius.only(bottom_left=10, bottom_right=10),
-            bgcolor=ft.Colors.BLUE_50,
-            width=float("inf"),
-            border=ft.border.only(bottom=ft.BorderSide(3, ft.Colors.BLUE_200)),
-            shadow=ft.BoxShadow(
-                spread_radius=1,
-                blur_radius=10,
-                color=ft.Colors.with_opacity(0.15, ft.Colors.BLACK),
-                offset=ft.Offset(0, 3),
-            )
-        )
-    
-    # Add functions to handle menu item clicks
-    def show_profile_dialog(page):
-        # Create profile dialog
-        profile_dialog = ft.AlertDialog(
-            title=ft.Text("User Profile", size=20, weight=ft.FontWeight.BOLD),
-            content=ft.Column([
-                ft.Container(
-                    content=ft.CircleAvatar(
-                        content=ft.Icon(ft.Icons.PERSON, size=40),
-                        radius=40,
-                        bgcolor=ft.Colors.BLUE_100,
-                    ),
-                    alignment=ft.alignment.center,
-                    margin=ft.margin.only(bottom=20),
-                ),
-                ft.Text("Username: Player1", size=16),
-                ft.Text("Games Played: Coming soon", size=16),
-                ft.Text("Win Rate: Coming soon", size=16),
-            ], tight=True, spacing=10, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-            actions=[
-                ft.TextButton("Close", on_click=lambda _: close_dialog(page))
-            ],
-            actions_alignment=ft.MainAxisAlignment.END,
-        )
-        
-        # Show the dialog
-        page.dialog = profile_dialog
-        profile_dialog.open = True
-        page.update()
-        
-    def close_dialog(page):
-        # Close the dialog
-        page.dialog.open = False
-        page.update()
-    
-    def show_logout_snackbar(page):
-        # Display logout message
-        page.snack_bar = ft.SnackBar(
-            content=ft.Text("Logout feature coming soon!"),
-            action="OK",
-        )
-        page.snack_bar.open = True
-        page.update()
-    
-    # Dashboard view
-    dashboard_view = ft.Container(
-        content=ft.Column(
-            [
-                # Add header with user icon
-                create_tab_header("DASHBOARD"),
-                
-                # Content container
-                ft.Container(
-                    content=ft.Column([], ref=dashboard_content_ref),
-                    padding=ft.padding.all(20),
-                    expand=True,
-                )
-            ],
-            spacing=0,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-        ),
-        padding=0,
-        expand=True
-    )
-    
-    # Stats view
-    stats_view = ft.Container(
-        content=ft.Column(
-            [
-                # Add header with user icon
-                create_tab_header("GAME STATISTICS"),
-                
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            ft.Container(
-                                content=ft.Column([], ref=stats_content_ref),
-                                expand=True
-                            )
-                        ],
-                        spacing=20,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
-                    ),
-                    padding=ft.padding.all(20),
-                    expand=True
-                )
-            ],
-            spacing=0,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-        ),
-        padding=0,
-        expand=True
-    )
-    
-    # History view
-    history_view = ft.Container(
-        content=ft.Column(
-            [
-                # Add header with user icon
-                create_tab_header("GAME HISTORY"),
-                
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            ft.Container(
-                                content=ft.DataTable(
-                                    ref=history_table_ref,
-                                    columns=[
-                                        ft.DataColumn(ft.Text("Time")),
-                                        ft.DataColumn(ft.Text("Your Choice")),
-                                        ft.DataColumn(ft.Text("Computer's Choice")),
-                                        ft.DataColumn(ft.Text("Result"))
-                                    ],
-                                    rows=[]
-                                ),
-                                expand=True
-                            )
-                        ],
-                        spacing=20,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
-                    ),
-                    padding=ft.padding.all(20),
-                    expand=True
-                )
-            ],
-            spacing=0,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-        ),
-        padding=0,
-        expand=True
-    )
-    
-    # Game content area
-    game_view = ft.Container(
-        content=ft.Column(
-            [
-                # Add header with user icon
-                create_tab_header("ROCK PAPER SCISSORS"),
-                
-                # Content container
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            # Score display
-                            ft.Container(
-                                content=ft.Text(f"You: {user_score}  |  Computer: {computer_score}", 
-                                            size=24, 
-                                            weight=ft.FontWeight.W_500,
-                                            color=ft.Colors.BLUE_800,
-                                            ref=score_text_ref),
-                                alignment=ft.alignment.center,
-                                margin=ft.margin.only(bottom=30, top=20)
-                            ),
-                            
-                            # Game status message
-                            ft.Container(
-                                content=ft.Text("Choose your move!",
-                                            size=20, 
-                                            color=ft.Colors.BLACK87,
-                                            text_align=ft.TextAlign.CENTER,
-                                            ref=status_message_ref),
-                                alignment=ft.alignment.center,
-                                margin=ft.margin.symmetric(vertical=15),
-                                height=50
-                            ),
-                            
-                            # Choice display
-                            ft.Row(
-                                controls=[
-                                    ft.Column(
-                                        [ft.Text("Your choice: ", size=18, ref=user_choice_text_ref)],
-                                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                                        expand=True
-                                    ),
-                                    ft.Column(
-                                        [ft.Text("Computer's choice: ", size=18, ref=computer_choice_text_ref)],
-                                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                                        expand=True
-                                    )
-                                ],
-                                alignment=ft.MainAxisAlignment.CENTER
-                            ),
-                            
-                            ft.Container(height=30),  # Spacer
-                            
-                            # Button row
-                            ft.Row(
-                                [
-                                    ft.ElevatedButton(
-                                        content=ft.Row([
-                                            ft.Icon(ft.Icons.CIRCLE),
-                                            ft.Text("Rock", size=16)
-                                        ], alignment=ft.MainAxisAlignment.CENTER),
-                                        style=ft.ButtonStyle(
-                                            shape=ft.RoundedRectangleBorder(radius=10),
-                                            padding=15
-                                        ),
-                                        on_click=lambda e: handle_choice(e, "rock"),
-                                        width=150,
-                                        height=60
-                                    ),
-                                    ft.ElevatedButton(
-                                        content=ft.Row([
-                                            ft.Icon(ft.Icons.SQUARE_OUTLINED),
-                                            ft.Text("Paper", size=16)
-                                        ], alignment=ft.MainAxisAlignment.CENTER),
-                                        style=ft.ButtonStyle(
-                                            shape=ft.RoundedRectangleBorder(radius=10),
-                                            padding=15
-                                        ),
-                                        on_click=lambda e: handle_choice(e, "paper"),
-                                        width=150,
-                                        height=60
-                                    ),
-                                    ft.ElevatedButton(
-                                        content=ft.Row([
-                                            ft.Icon(ft.Icons.CONTENT_CUT),
-                                            ft.Text("Scissors", size=16)
-                                        ], alignment=ft.MainAxisAlignment.CENTER),
-                                        style=ft.ButtonStyle(
-                                            shape=ft.RoundedRectangleBorder(radius=10),
-                                            padding=15
-                                        ),
-                                        on_click=lambda e: handle_choice(e, "scissors"),
-                                        width=150,
-                                        height=60
-                                    )
-                                ],
-                                alignment=ft.MainAxisAlignment.CENTER,
-                                spacing=20
-                            ),
-                            
-                            ft.Container(height=30),  # Spacer
-                            
-                            # Reset button
-                            ft.Row(
-                                [
-                                    ft.OutlinedButton(
-                                        "Reset Game",
-                                        icon=ft.Icons.REFRESH,
-                                        on_click=reset_game
-                                    )
-                                ], 
-                                alignment=ft.MainAxisAlignment.CENTER
-                            )
-                        ],
-                        spacing=0,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    padding=ft.padding.all(20),
-                    expand=True,
-                )
-            ],
-            spacing=0,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-        ),
-        padding=0,
-        expand=True
-    )
-    
-    # Define the content area container properly
-    content_area = ft.Container(
-        content=dashboard_view,  # Default to dashboard view
-        expand=True,
-        ref=content_area_ref
-    )
-    
-    # Fix the sidebar definition to include all necessary properties
-    sidebar = ft.NavigationRail(
-        selected_index=0,  # Default to Dashboard tab
-        label_type=ft.NavigationRailLabelType.ALL,
-        min_width=150,
-        min_extended_width=250,
-        group_alignment=-0.9,
-        leading=logo_container,
-        destinations=[
-            ft.NavigationRailDestination(
-                icon=ft.Icons.DASHBOARD,
-                selected_icon=ft.Icons.DASHBOARD,
-                label="Dashboard",
-            ),
-            ft.NavigationRailDestination(
-                icon=ft.Icons.SPORTS_ESPORTS,
-                selected_icon=ft.Icons.SPORTS_ESPORTS,
-                label="Game",
-            ),
-            ft.NavigationRailDestination(
-                icon=ft.Icons.BAR_CHART,
-                selected_icon=ft.Icons.BAR_CHART,
-                label="Stats",
-            ),
-            ft.NavigationRailDestination(
-                icon=ft.Icons.HISTORY,
-                selected_icon=ft.Icons.HISTORY,
-                label="History",
-            ),
-        ],
-        on_change=change_tab,
-    )
-    
-    # Initialize the dashboard view first
-    update_dashboard_view()
-    
-    # Main layout with sidebar and content
-    page.add(
-        ft.Row(
-            [
-                sidebar,
-                ft.VerticalDivider(width=1),
-                content_area,
-            ],
-            expand=True,
-        )
-    )
-
-ft.app(target=main)
+import flet as ft
+import asyncio
+import os
+import sys
+import threading
+from datetime import datetime
+
+# Make the shared rps package importable when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps import charts, engine, memprofile, metrics, tournament
+from rps.excel_store import HISTORY_COLUMNS, PartitionedGameStore
+from rps.lazy import lazy_import, warm_up
+from rps.leaderboard import Leaderboard
+from rps.leaderboard_view import LeaderboardView
+from rps.move_icons import DEFAULT_ICON, move_icon
+from rps.opponents import DEFAULT_OPPONENT, OPPONENTS, make_opponent
+from rps.profiles import Profiles
+from rps.recent import RecentGames
+from rps.replay import SessionIndex
+from rps.replay_view import ReplayView
+from rps.rng import SessionLog, SessionRandom
+from rps.scheduler import scheduler_for
+from rps.viewmodel import ViewModel
+
+# Loaded on first use so the first frame only needs flet
+pd = lazy_import("pandas")
+pl = lazy_import("polars")
+
+# Every player's games are in a workbook of their own, keyed by user id
+partitions = PartitionedGameStore(os.path.join(os.path.dirname(__file__), "users"))
+profiles = Profiles(os.path.join(os.path.dirname(__file__), "profiles.csv"))
+result_outcomes = {"You win!": engine.WIN, "Computer wins!": engine.LOSS, "It's a tie!": engine.TIE}
+
+# Older versions kept every game in one workbook, under this player unless
+# the game has one
+legacy_excel_file = os.path.join(os.path.dirname(__file__), "rps_data.xlsx")
+DEFAULT_PLAYER = "Prithika"
+migration_lock = threading.Lock()
+
+# Results of `python -m rps.tournament` run from the repository root, shown
+# with the stats when there are some
+tournament_file = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tournament.parquet")
+
+def stats_frame(results):
+    wins = int((results == "You win!").sum())
+    losses = int((results == "Computer wins!").sum())
+    return pd.DataFrame({
+        "metric": ["user_wins", "computer_wins", "ties", "total_games"],
+        "value": [wins, losses, len(results) - wins - losses, len(results)]
+    })
+
+def write_workbook(path, history_df, stats_df):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with pd.ExcelWriter(path) as writer:
+        history_df.to_excel(writer, sheet_name="history", index=False)
+        stats_df.to_excel(writer, sheet_name="stats", index=False)
+
+# Split the single workbook into partitions the first time the app runs
+def split_legacy_workbook():
+    with migration_lock:
+        if profiles.exists() or not os.path.exists(legacy_excel_file):
+            return
+        history_df = pd.read_excel(legacy_excel_file, sheet_name="history", dtype=str)
+        if "user" in history_df:
+            players = history_df["user"].fillna(DEFAULT_PLAYER)
+        else:
+            players = pd.Series(DEFAULT_PLAYER, index=history_df.index)
+        user_ids = {name: profiles.create(name)["user_id"] for name in players.unique()}
+        for user_id, games in history_df.groupby(players.map(user_ids), sort=False):
+            games = games.reindex(columns=HISTORY_COLUMNS)
+            write_workbook(partitions.path(user_id), games, stats_frame(games["result"]))
+        if not user_ids:
+            profiles.create(DEFAULT_PLAYER)
+
+# Rankings of every player, shared by all sessions and built from the
+# partitions on first use
+def read_user_outcomes():
+    for user_id in partitions.user_ids():
+        for result in partitions.partition(user_id).read_column("result"):
+            yield user_id, result_outcomes.get(result, engine.TIE)
+
+leaderboard = Leaderboard(read_user_outcomes)
+
+def main(page: ft.Page):
+    # Page setup
+    page.title = "Rock Paper Scissors Game"
+    page.padding = 0
+    page.theme_mode = ft.ThemeMode.LIGHT
+    page.bgcolor = ft.Colors.BLUE_GREY_50
+
+    # Page updates are coalesced to at most one per frame
+    updates = scheduler_for(page)
+    
+    # The logged in player and their partition, set at login
+    user = None
+    game_store = None
+    
+    # Seed and opponents of every session, for replaying its games
+    session_log = SessionLog(os.path.join(os.path.dirname(__file__), "sessions.csv"))
+    session_id = datetime.now().strftime("%Y%m%d%H%M%S%f")
+    # RPS_RULES picks the rule set, every move gets a button
+    rules = engine.RULES
+    session_rng = SessionRandom(choices=rules.size)
+    session_moves = 0
+    
+    # Game state variables
+    user_score = 0
+    computer_score = 0
+    choices = list(rules.moves)
+    choice_colors = [ft.Colors.BLUE_700, ft.Colors.TEAL_700, ft.Colors.PURPLE_700]
+    opponent_name = DEFAULT_OPPONENT
+    opponent = make_opponent(opponent_name, session_rng, rules)
+    opponent_logged = False
+    current_view = "dashboard"  # Changed default view to dashboard
+    
+    # Create references properly
+    score_text_ref = ft.Ref[ft.Text]()
+    status_message_ref = ft.Ref[ft.Text]()
+    user_choice_text_ref = ft.Ref[ft.Text]()
+    computer_choice_text_ref = ft.Ref[ft.Text]()
+    stats_content_ref = ft.Ref[ft.Column]()
+    history_list_ref = ft.Ref[ft.ListView]()
+    content_area_ref = ft.Ref[ft.Container]()
+    dashboard_content_ref = ft.Ref[ft.Column]()  # Add new reference for dashboard content
+    
+    # Create logo for sidebar - Added this definition
+    logo_container = ft.Container(
+        content=ft.Column([
+            ft.Container(
+                content=ft.Icon(
+                    ft.Icons.SPORTS_ESPORTS,
+                    size=50,
+                    color=ft.Colors.BLUE_700,
+                ),
+                padding=10,
+                border_radius=50,
+                bgcolor=ft.Colors.BLUE_50,
+            ),
+            ft.Text("RPS Game", size=18, weight=ft.FontWeight.BOLD),
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=5),
+        margin=ft.margin.only(bottom=30, top=20),
+    )
+    
+    # Initialize the player's Excel file if it doesn't exist
+    def init_excel_file():
+        if not os.path.exists(game_store.path):
+            # Empty game history and stats sheets
+            history_df = pd.DataFrame(columns=HISTORY_COLUMNS)
+            write_workbook(game_store.path, history_df, stats_frame(history_df["result"]))
+
+    # Game logic functions
+    def determine_winner(user_pick, computer_pick):
+        nonlocal user_score, computer_score
+        
+        outcome = rules.resolve(rules.move_index[user_pick], rules.move_index[computer_pick])
+        if outcome == engine.TIE:
+            return "It's a tie!"
+        
+        if outcome == engine.WIN:
+            user_score += 1
+            return "You win!"
+        else:
+            computer_score += 1
+            return "Computer wins!"
+    
+    # Save game results to the player's Excel file, games are (timestamp,
+    # user_choice, computer_choice, result, session_id) tuples
+    @metrics.timed("save")
+    def save_game_results(games):
+        # Read existing data
+        try:
+            with metrics.span("save.read"):
+                history_df = pd.read_excel(game_store.path, sheet_name="history", dtype={"session_id": str})
+                stats_df = pd.read_excel(game_store.path, sheet_name="stats")
+        except FileNotFoundError:
+            # Any other error is raised, a workbook that exists is never
+            # replaced by an empty one
+            init_excel_file()
+            history_df = pd.DataFrame(columns=HISTORY_COLUMNS)
+            stats_df = pd.DataFrame({
+                "metric": ["user_wins", "computer_wins", "ties", "total_games"],
+                "value": [0, 0, 0, 0]
+            })
+        
+        # Add new games to history
+        new_games = pd.DataFrame(games, columns=HISTORY_COLUMNS)
+        history_df = pd.concat([history_df, new_games], ignore_index=True)
+        memprofile.frame("save.history", history_df)
+        
+        # Update stats
+        stats_df.loc[stats_df["metric"] == "total_games", "value"] += len(games)
+        
+        for _, _, _, result, _ in games:
+            if result == "You win!":
+                stats_df.loc[stats_df["metric"] == "user_wins", "value"] += 1
+            elif result == "Computer wins!":
+                stats_df.loc[stats_df["metric"] == "computer_wins", "value"] += 1
+            else:  # Tie
+                stats_df.loc[stats_df["metric"] == "ties", "value"] += 1
+        
+        # Save updated data
+        with metrics.span("save.write"):
+            write_workbook(game_store.path, history_df, stats_df)
+        recent_games.extend(new_games.to_dict("records"))
+        session_index.extend(len(history_df) - len(games), [game[4] for game in games])
+        leaderboard.extend(user["user_id"], len(history_df) - len(games),
+                           [result_outcomes[game[3]] for game in games])
+
+    # Games are written by a single background task, games played while it
+    # is writing go into its next batch
+    pending_games = []
+    save_task = None
+
+    async def save_pending_games():
+        while pending_games:
+            games = pending_games[:]
+            pending_games.clear()
+            try:
+                await asyncio.to_thread(save_game_results, games)
+            except Exception as e:
+                # Ahead of the games played during the save, they are tried
+                # again with the next move's save
+                pending_games[:0] = games
+                print(f"Error saving game results: {e}")
+                page.open(ft.SnackBar(ft.Text(f"Failed to save {len(pending_games)} games, "
+                                              f"they will be saved with the next move")))
+                updates.request()
+                return
+
+    def save_in_background(user_choice, computer_choice, result):
+        nonlocal save_task
+        pending_games.append((datetime.now().strftime("%Y-%m-%d %H:%M:%S"), user_choice, computer_choice, result,
+                              session_id))
+        if save_task is None or save_task.done():
+            save_task = asyncio.create_task(save_pending_games())
+
+    async def games_saved():
+        # The views read the workbook, so let pending games reach it first
+        if save_task is not None:
+            await save_task
+
+    # Button click handler
+    @metrics.timed("move")
+    async def handle_choice(e, choice):
+        nonlocal session_moves, opponent_logged
+        # The first move against each opponent is logged, so the session
+        # can be replayed from its seed
+        if not opponent_logged:
+            with metrics.span("move.log"):
+                session_log.record(session_id, session_rng.seed, opponent_name, session_moves, rules.name)
+            opponent_logged = True
+        
+        # Get computer's choice from the selected opponent
+        with metrics.span("move.rng"):
+            computer_choice = rules.moves[opponent.choose()]
+        session_moves += 1
+        
+        # Determine winner and update score
+        with metrics.span("move.resolve"):
+            result = determine_winner(choice, computer_choice)
+            opponent.observe(rules.move_index[choice], rules.move_index[computer_choice])
+        
+        # Update choice displays and score
+        with metrics.span("move.controls"):
+            user_choice_text_ref.current.value = f"Your choice: {choice.capitalize()}"
+            computer_choice_text_ref.current.value = f"Computer's choice: {computer_choice.capitalize()}"
+            status_message_ref.current.value = result
+            score_text_ref.current.value = f"You: {user_score}  |  Computer: {computer_score}"
+        
+        # Update UI, the game is saved to Excel in the background
+        updates.request()
+        save_in_background(choice, computer_choice, result)
+    
+    # Opponent picker, changing it starts a fresh opponent
+    async def change_opponent(e):
+        nonlocal opponent, opponent_name, opponent_logged
+        opponent_name = e.control.value
+        opponent = make_opponent(opponent_name, session_rng, rules)
+        opponent_logged = False
+    
+    opponent_dropdown = ft.Dropdown(
+        label="Opponent",
+        value=DEFAULT_OPPONENT,
+        options=[ft.dropdown.Option(key, strategy.name) for key, strategy in OPPONENTS.items()],
+        on_change=change_opponent,
+        width=250,
+    )
+    
+    def choice_click(choice):
+        async def handle_click(e):
+            await handle_choice(e, choice)
+        return handle_click
+    
+    # Reset game function
+    async def reset_game(e):
+        nonlocal user_score, computer_score
+        user_score = computer_score = 0
+        
+        score_text_ref.current.value = f"You: {user_score}  |  Computer: {computer_score}"
+        status_message_ref.current.value = "Choose your move!"
+        user_choice_text_ref.current.value = "Your choice: "
+        computer_choice_text_ref.current.value = "Computer's choice: "
+        updates.request()
+    
+    # Stats view controls are built once, refreshes only change their values
+    stats_vm = ViewModel()
+    
+    def rate_text(label, count, total, rate_name):
+        if total > 0:
+            return f"{label}: {count} ({count/total*100:.1f}% {rate_name})"
+        return f"{label}: 0"
+    
+    win_distribution_chart = charts.pie_chart(
+        [("You", 0), ("Computer", 0), ("Ties", 0)],
+        colors=[ft.Colors.GREEN, ft.Colors.RED, ft.Colors.BLUE],
+    )
+    choice_performance_chart = charts.bar_chart(
+        [(choice.capitalize(), 0) for choice in choices],
+        colors=choice_colors,
+        bar_width=min(40, 240 // len(choices)),
+    )
+    
+    tournament_rows = ft.Column(spacing=4)
+    
+    stats_controls = [
+        # Summary text
+        stats_vm.bind("total_games", ft.Text(size=24, weight=ft.FontWeight.BOLD), format="Total Games: {}"),
+        stats_vm.bind("user_wins", ft.Text(size=20, color=ft.Colors.GREEN)),
+        stats_vm.bind("computer_wins", ft.Text(size=20, color=ft.Colors.RED)),
+        stats_vm.bind("ties", ft.Text(size=20, color=ft.Colors.BLUE)),
+        
+        # Win distribution chart, only shown once there's data
+        stats_vm.bind("has_games", ft.Column([
+            ft.Text("Win Distribution", size=22, weight=ft.FontWeight.W_500, 
+                   text_align=ft.TextAlign.CENTER),
+            ft.Container(
+                content=win_distribution_chart,
+                alignment=ft.alignment.center,
+                margin=ft.margin.only(top=10, bottom=20),
+            ),
+        ], visible=False), "visible"),
+        
+        # Win percentage by choice chart, only shown with enough data
+        stats_vm.bind("has_choice_stats", ft.Column([
+            ft.Text("Performance by Choice", size=22, weight=ft.FontWeight.W_500,
+                   text_align=ft.TextAlign.CENTER),
+            ft.Container(
+                content=choice_performance_chart,
+                alignment=ft.alignment.center,
+            ),
+        ], visible=False), "visible"),
+        
+        # Opponents' win rates from the last tournament, if one was run
+        stats_vm.bind("has_tournament", ft.Column([
+            ft.Text("Computer Opponents", size=22, weight=ft.FontWeight.W_500,
+                   text_align=ft.TextAlign.CENTER),
+            ft.Text("Win rate against the other opponents in the last tournament, with its 95% interval",
+                    size=14, color=ft.Colors.GREY_700),
+            tournament_rows,
+        ], visible=False), "visible"),
+    ]
+    
+    # Read the stats from Excel, runs in a worker thread
+    @metrics.timed("view.stats.read")
+    def read_stats_data():
+        # Read stats from Excel using polars
+        # Check if file exists first
+        if not os.path.exists(game_store.path):
+            init_excel_file()
+            
+        stats_df = pl.read_excel(game_store.path, sheet_name="stats")
+        history_df = pl.read_excel(game_store.path, sheet_name="history", read_options={"dtypes": "string"})
+        memprofile.frame("view.stats.history", history_df)
+        
+        # Extract metrics
+        stats = stats_df.to_dict(as_series=False)
+        data = {
+            name: stats["value"][stats["metric"].index(name)]
+            for name in ["total_games", "user_wins", "computer_wins", "ties"]
+        }
+        data["has_choice_stats"] = data["total_games"] >= 5 and len(history_df) > 0
+        
+        if data["has_choice_stats"]:
+            # Process data for each choice
+            choice_stats = {}
+            for choice in choices:
+                # Filter games with this choice
+                choice_games = history_df.filter(pl.col("user_choice") == choice)
+                if len(choice_games) > 0:
+                    # Calculate wins
+                    choice_wins = choice_games.filter(pl.col("result") == "You win!").height
+                    win_rate = (choice_wins / len(choice_games)) * 100
+                    choice_stats[choice] = {
+                        "total": len(choice_games),
+                        "wins": choice_wins,
+                        "win_rate": win_rate
+                    }
+            data["choice_stats"] = choice_stats
+        data["tournament"] = read_tournament()
+        return data
+    
+    # The tournament file only changes when a tournament is run
+    tournament_cache = (None, None)
+    
+    def read_tournament():
+        nonlocal tournament_cache
+        try:
+            mtime = os.path.getmtime(tournament_file)
+        except FileNotFoundError:
+            return []
+        if tournament_cache[0] != mtime:
+            try:
+                results = tournament.load_results(tournament_file).filter(pl.col("rules") == rules.name)
+            except Exception as e:
+                # The rest of the stats are still shown
+                print(f"Error reading tournament results: {e}")
+                return []
+            tournament_cache = (mtime, tournament.standings(results))
+        return tournament_cache[1]
+    
+    # Update stats view function
+    @metrics.timed("view.stats")
+    async def update_stats_view():
+        try:
+            # Get reference to stats content
+            stats_content = stats_content_ref.current
+            stats_content.controls = stats_controls
+            
+            await games_saved()
+            data = await asyncio.to_thread(read_stats_data)
+            total_games = data["total_games"]
+            user_wins = data["user_wins"]
+            computer_wins = data["computer_wins"]
+            ties = data["ties"]
+            
+            with metrics.span("view.stats.controls"):
+                stats_vm.update(
+                    total_games=total_games,
+                    user_wins=rate_text("Your Wins", user_wins, total_games, "win rate"),
+                    computer_wins=rate_text("Computer Wins", computer_wins, total_games, "win rate"),
+                    ties=rate_text("Ties", ties, total_games, "tie rate"),
+                    has_games=total_games > 0,
+                    has_choice_stats=data["has_choice_stats"],
+                    has_tournament=bool(data["tournament"]),
+                )
+                
+                standings = data["tournament"]
+                if len(tournament_rows.controls) != len(standings):
+                    tournament_rows.controls = [ft.Text(size=16) for _ in standings]
+                for text, row in zip(tournament_rows.controls, standings):
+                    opponent = OPPONENTS.get(row["player"])
+                    text.value = (f"{opponent.name if opponent else row['player']}: {row['win_rate']:.1%} "
+                                  f"({row['win_low']:.1%}-{row['win_high']:.1%}) over {row['rounds']:,} rounds")
+            
+                # Only update visualizations if there's data
+                if total_games > 0:
+                    charts.update_pie_chart(
+                        win_distribution_chart,
+                        [("You", user_wins), ("Computer", computer_wins), ("Ties", ties)],
+                    )
+                
+                if data["has_choice_stats"]:
+                    choice_stats = data["choice_stats"]
+                    charts.update_bar_chart(choice_performance_chart, [
+                        (choice.capitalize(), round(choice_stats.get(choice, {}).get("win_rate", 0), 1))
+                        for choice in choices
+                    ])
+            
+            updates.request()
+        except Exception as e:
+            print(f"Error updating stats: {e}")
+            stats_content_ref.current.controls = [ft.Text(f"Error loading statistics: {str(e)}")]
+            updates.request()
+    
+    # History is shown in pages so only the rows scrolled into view are
+    # read from the workbook and sent to the client
+    HISTORY_PAGE_SIZE = 50
+    HISTORY_ROW_HEIGHT = 44
+    
+    # The newest games are kept in memory for the dashboard, seeded from the
+    # end of the history sheet. Like the rows of every session for the
+    # replay view, they're the logged in player's
+    recent_games = None
+    session_index = None
+    history_loaded = 0
+    history_total = 0
+    # Bumped whenever the list is cleared, so a page read for the list
+    # before that is dropped instead of appended to the new one
+    history_generation = 0
+    # Generation of the page being read, if any
+    history_loading = None
+    
+    def reset_history(total):
+        nonlocal history_loaded, history_total, history_generation
+        history_list_ref.current.controls.clear()
+        history_loaded = 0
+        history_total = total
+        history_generation += 1
+    
+    def history_row_layout(cells):
+        for cell in cells:
+            cell.expand = True
+        return ft.Row(cells, spacing=10)
+    
+    def history_row(row):
+        return ft.Container(
+            content=history_row_layout([
+                ft.Text(row["timestamp"]),
+                ft.Text(row["user_choice"].capitalize()),
+                ft.Text(row["computer_choice"].capitalize()),
+                ft.Text(row["result"]),
+            ]),
+            padding=ft.padding.symmetric(horizontal=15),
+            height=HISTORY_ROW_HEIGHT,
+            border=ft.border.only(bottom=ft.BorderSide(1, ft.Colors.GREY_300)),
+        )
+    
+    @metrics.timed("view.history.rows")
+    async def load_history_page():
+        nonlocal history_loaded, history_loading
+        # Skip if a page is already being loaded by another scroll event
+        if history_loading == history_generation or history_loaded >= history_total:
+            return
+        generation = history_loading = history_generation
+        try:
+            # Every page, the first one too, comes from the workbook and is
+            # counted from the same total, so pages never overlap or skip
+            # games, even ones played in another session
+            rows = await asyncio.to_thread(
+                game_store.read_history_page, history_loaded, HISTORY_PAGE_SIZE, history_total)
+            if generation != history_generation:
+                return
+            history_list_ref.current.controls.extend(history_row(row) for row in rows)
+            history_loaded += len(rows)
+            updates.request()
+        finally:
+            if history_loading == generation:
+                history_loading = None
+    
+    async def on_history_scroll(e):
+        # Fetch the next page when the user gets close to the bottom
+        if e.max_scroll_extent is not None and e.pixels >= e.max_scroll_extent - 5 * HISTORY_ROW_HEIGHT:
+            await load_history_page()
+    
+    # Update history view function
+    @metrics.timed("view.history")
+    async def update_history_view():
+        try:
+            await games_saved()
+            with metrics.span("view.history.read"):
+                total = await asyncio.to_thread(game_store.count_games)
+            
+            # Start again from the most recent game
+            reset_history(total)
+            await load_history_page()
+            
+            updates.request()
+        except Exception as e:
+            print(f"Error updating history: {e}")
+            history_list_ref.current.controls.append(
+                ft.Text(f"Error loading history: {str(e)}")
+            )
+            updates.request()
+    
+    # Tab navigation function
+    def show_view(view_name):
+        nonlocal current_view
+        current_view = view_name
+        # Views stay mounted, switching tabs only toggles their visibility
+        for name, view in views.items():
+            view.visible = name == view_name
+    
+    async def change_tab(e):
+        selected_tab = e.control.selected_index
+        
+        # Switch views right away, their data is filled in once it's read
+        view_name = ["dashboard", "game", "stats", "history", "replay", "leaderboard"][selected_tab]
+        show_view(view_name)
+        updates.request()
+        
+        if selected_tab == 0:  # Dashboard tab
+            await update_dashboard_view()
+        elif selected_tab == 2:  # Stats tab
+            await update_stats_view()
+        elif selected_tab == 3:  # History tab
+            await update_history_view()
+        elif selected_tab == 4:  # Replay tab
+            await games_saved()
+            await replay.refresh()
+        elif selected_tab == 5:  # Leaderboard tab
+            await games_saved()
+            await board.refresh()
+    
+    # Get time-based greeting
+    def get_greeting():
+        current_hour = datetime.now().hour
+        
+        if 5 <= current_hour < 12:
+            return "Good morning"
+        elif 12 <= current_hour < 17:
+            return "Good afternoon"
+        elif 17 <= current_hour < 21:
+            return "Good evening"
+        else:
+            return "Good night"
+    
+    # Dashboard controls are built once, refreshes only change their values
+    dashboard_vm = ViewModel()
+    
+    def stat_card(title, value_text):
+        return ft.Card(
+            content=ft.Container(
+                content=ft.Column([
+                    ft.Text(title, size=16, color=ft.Colors.BLUE_GREY_700),
+                    value_text,
+                ], alignment=ft.MainAxisAlignment.CENTER, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                padding=15,
+                width=150,
+                height=120,
+            ),
+            elevation=3,
+        )
+    
+    # Icon and color for each choice, and color for each result
+    classic_icons = {"rock": ft.Icons.CIRCLE, "paper": ft.Icons.SQUARE_OUTLINED, "scissors": ft.Icons.CONTENT_CUT}
+    choice_icons = {
+        choice: (classic_icons.get(choice, move_icon(choice)), choice_colors[i % len(choice_colors)])
+        for i, choice in enumerate(choices)
+    }
+    result_colors = {"You win!": ft.Colors.GREEN, "Computer wins!": ft.Colors.RED}
+    
+    # Fixed slots for the recent games list, hidden until filled
+    RECENT_GAMES = 5
+    recent_slots = [
+        ft.Container(
+            content=ft.Row([
+                ft.Icon(ft.Icons.CIRCLE, size=20),
+                ft.Text("", expand=True),
+                ft.Text(""),
+            ]),
+            padding=ft.padding.symmetric(vertical=8, horizontal=15),
+            border_radius=5,
+            bgcolor=ft.Colors.WHITE,
+            visible=False,
+        )
+        for _ in range(RECENT_GAMES)
+    ]
+    
+    def show_recent_game(slot, row):
+        slot.visible = row is not None
+        if row is None:
+            return
+        icon, matchup, result = slot.content.controls
+        user_choice = row.get("user_choice", "unknown")
+        computer_choice = row.get("computer_choice", "unknown")
+        
+        # Generic icon for moves outside the rule set
+        icon.name, icon.color = choice_icons.get(user_choice, (DEFAULT_ICON, ft.Colors.GREY_700))
+        matchup.value = f"{user_choice.capitalize()} vs {computer_choice.capitalize()}"
+        result.value = row.get("result", "unknown")
+        result.color = result_colors.get(result.value, ft.Colors.BLUE)
+    
+    trend_chart = charts.line_chart([], color=ft.Colors.BLUE_400)
+    
+    dashboard_controls = [
+        # Welcome card
+        ft.Card(
+            content=ft.Container(
+                width=1600,expand=True,
+                content=ft.Column([
+                    dashboard_vm.bind("greeting", ft.Text("", 
+                           size=28, 
+                           weight=ft.FontWeight.BOLD,
+                           color=ft.Colors.BLUE_700)),
+                    ft.Text(f"Welcome to your Rock Paper Scissors dashboard",
+                           size=16,
+                           color=ft.Colors.BLUE_GREY_800),
+                    dashboard_vm.bind("today", ft.Text("",
+                           size=14,
+                           color=ft.Colors.BLUE_GREY_600)),
+                ]),
+                padding=20,
+                gradient=ft.LinearGradient(
+                    begin=ft.alignment.top_left,
+                    end=ft.alignment.bottom_right,
+                    colors=[ft.Colors.BLUE_50, ft.Colors.INDIGO_50],
+                ),
+            ),
+            elevation=4,
+            margin=ft.margin.only(bottom=25, top=10),
+        ),
+        
+        # Quick stats cards
+        ft.Text("Game Overview", size=20, weight=ft.FontWeight.W_600),
+        ft.Row(
+            controls=[
+                stat_card("Total Games", dashboard_vm.bind("total_games", ft.Text(
+                    "0", size=32, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700))),
+                stat_card("Win Rate", dashboard_vm.bind("win_rate", ft.Text(
+                    "0%", size=32, weight=ft.FontWeight.BOLD, color=ft.Colors.GREEN))),
+                stat_card("Best Choice", dashboard_vm.bind("best_choice_size", dashboard_vm.bind("best_choice", ft.Text(
+                    "Play more!", size=18, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700)), "size")),
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            spacing=20,
+        ),
+        
+        # Recent games section, shown once there are games
+        dashboard_vm.bind("has_games", ft.Column([
+            ft.Container(height=30),  # Spacer
+            ft.Text("Recent Activity", size=20, weight=ft.FontWeight.W_600),
+            ft.Container(
+                content=ft.ListView(
+                    controls=recent_slots,
+                    height=180,
+                    spacing=2,
+                    padding=10,
+                    divider_thickness=1,
+                ),
+                border=ft.border.all(1, ft.Colors.BLUE_GREY_200),
+                border_radius=10,
+                padding=ft.padding.only(top=10, bottom=10),
+                margin=ft.margin.only(bottom=20),
+            ),
+        ], visible=False), "visible"),
+        
+        # Trend analysis, shown once there are enough games
+        dashboard_vm.bind("has_trend", ft.Column([
+            ft.Text("Performance Trend", size=20, weight=ft.FontWeight.W_600),
+            ft.Container(
+                content=ft.Column([
+                    trend_chart,
+                    ft.Text("Game History Trend (Win Rate %)", size=14, color=ft.Colors.BLUE_GREY_600),
+                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                alignment=ft.alignment.center,
+                margin=ft.margin.only(bottom=20, top=10),
+            ),
+        ], visible=False), "visible"),
+    ]
+    
+    # Read the dashboard data from Excel, runs in a worker thread
+    @metrics.timed("view.dashboard.read")
+    def read_dashboard_data():
+        # Check if we have game data to show
+        if not os.path.exists(game_store.path):
+            init_excel_file()
+            
+        stats_df = pl.read_excel(game_store.path, sheet_name="stats")
+        history_df = pl.read_excel(game_store.path, sheet_name="history", read_options={"dtypes": "string"})
+        memprofile.frame("view.dashboard.history", history_df)
+        
+        # Extract metrics more safely
+        stats = stats_df.to_dict(as_series=False)
+        
+        # Handle case when DataFrame might be empty
+        if "metric" not in stats or "value" not in stats or len(stats["metric"]) == 0:
+            total_games = 0
+            user_wins = 0
+        else:
+            # Find indices safely with default values
+            total_games_idx = stats["metric"].index("total_games") if "total_games" in stats["metric"] else 0
+            user_wins_idx = stats["metric"].index("user_wins") if "user_wins" in stats["metric"] else 0
+            
+            total_games = stats["value"][total_games_idx]
+            user_wins = stats["value"][user_wins_idx]
+        
+        data = {"total_games": total_games, "user_wins": user_wins, "recent_history": []}
+        if total_games > 5:
+            data["best_choice"] = get_best_choice(history_df)
+        if total_games > 0:
+            data["recent_history"] = recent_games.newest(RECENT_GAMES)
+        if total_games >= 10:
+            data["trend"] = trend_win_rates(history_df)
+        return data
+    
+    # Update dashboard view function
+    @metrics.timed("view.dashboard")
+    async def update_dashboard_view():
+        try:
+            # Get reference to dashboard content
+            dashboard_content = dashboard_content_ref.current
+            dashboard_content.controls = dashboard_controls
+            
+            # Update greeting based on time
+            dashboard_vm.update(
+                greeting=f"{get_greeting()}, {user['name']}!",
+                today=f"Today: {datetime.now().strftime('%A, %B %d, %Y')}",
+            )
+            
+            await games_saved()
+            data = await asyncio.to_thread(read_dashboard_data)
+            total_games = data["total_games"]
+            user_wins = data["user_wins"]
+            
+            with metrics.span("view.dashboard.controls"):
+                dashboard_vm.update(
+                    total_games=f"{total_games}",
+                    win_rate=f"{(user_wins/total_games*100):.1f}%" if total_games > 0 else "0%",
+                    best_choice=data.get("best_choice", "Play more!"),
+                    best_choice_size=22 if total_games > 5 else 18,
+                    has_games=total_games > 0,
+                    has_trend=total_games >= 10,
+                )
+                
+                # Fill the recent games slots
+                if total_games > 0:
+                    recent_history = data["recent_history"]
+                    for i, slot in enumerate(recent_slots):
+                        show_recent_game(slot, recent_history[i] if i < len(recent_history) else None)
+                    
+                # Update trend analysis if enough games
+                if total_games >= 10:
+                    charts.update_line_chart(trend_chart, data["trend"])
+            
+            updates.request()
+        except Exception as e:
+            print(f"Error updating dashboard: {e}")
+            import traceback
+            traceback.print_exc()  # Add detailed error logging
+            dashboard_content_ref.current.controls = [
+                ft.Text(f"Error loading dashboard: {str(e)}")
+            ]
+            updates.request()
+    
+    # Helper function to get the best choice based on win rate
+    def get_best_choice(history_df):
+        if len(history_df) == 0:
+            return "N/A"
+        
+        choice_stats = {}
+        for choice in choices:
+            choice_games = history_df.filter(pl.col("user_choice") == choice)
+            if len(choice_games) > 0:
+                wins = choice_games.filter(pl.col("result") == "You win!").height
+                win_rate = (wins / len(choice_games)) * 100
+                choice_stats[choice] = win_rate
+        
+        if not choice_stats:
+            return "Play more!"
+            
+        # Get the choice with highest win rate
+        best_choice = max(choice_stats.items(), key=lambda x: x[1])
+        return f"{best_choice[0].capitalize()}"
+    
+    # Helper function to get the running win rate for the trend chart
+    def trend_win_rates(history_df):
+        # Transform data to get cumulative win rate over time
+        wins = (pl.col("result") == "You win!").cast(pl.Int64).cum_sum()
+        games = pl.int_range(1, pl.len() + 1)
+        win_rates = history_df.select((wins / games * 100).alias("win_rate"))["win_rate"]
+        
+        # Only the latest games are plotted so the chart stays small
+        return [round(rate, 1) for rate in win_rates.tail(50).to_list()]
+    
+    # Create a function to create header with user icon for all tabs
+    def create_tab_header(title):
+        return ft.Container(
+            content=ft.Row(
+                [
+                    ft.Text(
+                        title,
+                        size=32, 
+                        weight=ft.FontWeight.BOLD,
+                        color=ft.Colors.BLUE_700,
+                    ),
+                    ft.Container(width=20),  # Spacer
+                    ft.Container(
+                        content=ft.PopupMenuButton(
+                            icon=ft.Icons.ACCOUNT_CIRCLE,
+                            icon_size=36,
+                            icon_color=ft.Colors.BLUE_700,
+                            tooltip="User Options",
+                            items=[
+                                ft.PopupMenuItem(
+                                    text="My Profile",
+                                    icon=ft.Icons.PERSON,
+                                    on_click=show_profile_dialog
+                                ),
+                                ft.PopupMenuItem(
+                                    text="Logout",
+                                    icon=ft.Icons.LOGOUT,
+                                    on_click=log_out
+                                ),
+                            ],
+                        ),
+                        alignment=ft.alignment.center_right,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            ),
+            padding=ft.padding.only(left=15, right=15, top=15, bottom=5),
+            border_radius=ft.border_radius.only(bottom_left=10, bottom_right=10),
+            bgcolor=ft.Colors.BLUE_50,
+            width=float("inf"),
+            border=ft.border.only(bottom=ft.BorderSide(3, ft.Colors.BLUE_200)),
+            shadow=ft.BoxShadow(
+                spread_radius=1,
+                blur_radius=10,
+                color=ft.Colors.with_opacity(0.15, ft.Colors.BLACK),
+                offset=ft.Offset(0, 3),
+            )
+        )
+    
+    # Add functions to handle menu item clicks
+    async def show_profile_dialog(e):
+        # The player's totals come from the stats sheet of their partition
+        stats = await asyncio.to_thread(game_store.read_stats)
+        total_games = int(stats.get("total_games", 0))
+        win_rate = f"{stats.get('user_wins', 0) / total_games * 100:.1f}%" if total_games > 0 else "No games yet"
+        
+        # Create profile dialog
+        profile_dialog = ft.AlertDialog(
+            title=ft.Text("User Profile", size=20, weight=ft.FontWeight.BOLD),
+            content=ft.Column([
+                ft.Container(
+                    content=ft.CircleAvatar(
+                        content=ft.Icon(ft.Icons.PERSON, size=40),
+                        radius=40,
+                        bgcolor=ft.Colors.BLUE_100,
+                    ),
+                    alignment=ft.alignment.center,
+                    margin=ft.margin.only(bottom=20),
+                ),
+                ft.Text(f"Username: {user['name']}", size=16),
+                ft.Text(f"Player ID: {user['user_id']}", size=16),
+                ft.Text(f"Member since: {user['created'][:10]}", size=16),
+                ft.Text(f"Games Played: {total_games}", size=16),
+                ft.Text(f"Win Rate: {win_rate}", size=16),
+            ], tight=True, spacing=10, horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+            actions=[
+                ft.TextButton("Close", on_click=lambda _: page.close(profile_dialog))
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+        
+        # Show the dialog
+        page.open(profile_dialog)
+    
+    # Login dialog, every session starts by picking or creating a profile
+    login_dropdown = ft.Dropdown(label="Player", width=300)
+    login_name_field = ft.TextField(label="Or a new player", width=300)
+    login_error_text = ft.Text("", color=ft.Colors.RED_700)
+    
+    async def show_login():
+        await asyncio.to_thread(split_legacy_workbook)
+        known = await asyncio.to_thread(profiles.all)
+        login_dropdown.options = [ft.dropdown.Option(profile["user_id"], profile["name"]) for profile in known]
+        login_dropdown.value = user["user_id"] if user else (known[0]["user_id"] if known else None)
+        login_name_field.value = ""
+        login_error_text.value = ""
+        page.open(login_dialog)
+    
+    async def submit_login(e):
+        name = login_name_field.value.strip()
+        if name:
+            profile = await asyncio.to_thread(profiles.create, name)
+        elif login_dropdown.value:
+            profile = profiles.get(login_dropdown.value)
+        else:
+            login_error_text.value = "Pick a player or enter a name"
+            updates.request()
+            return
+        # Unsaved games belong to the current player, who stays logged in
+        # until they are in their partition
+        await games_saved()
+        if pending_games:
+            await save_pending_games()
+        if pending_games:
+            login_error_text.value = "The last games couldn't be saved, try again"
+            updates.request()
+            return
+        page.close(login_dialog)
+        await log_in(profile)
+    
+    login_name_field.on_submit = submit_login
+    login_dialog = ft.AlertDialog(
+        modal=True,
+        title=ft.Text("Who's playing?", size=20, weight=ft.FontWeight.BOLD),
+        content=ft.Column([login_dropdown, login_name_field, login_error_text], tight=True, spacing=10),
+        actions=[ft.ElevatedButton("Log in", on_click=submit_login)],
+        actions_alignment=ft.MainAxisAlignment.END,
+    )
+    
+    # Switch every view over to the player's partition
+    async def log_in(profile):
+        nonlocal user, game_store, recent_games, session_index
+        # Games of the previous player go to their partition first
+        await games_saved()
+        user = profile
+        game_store = partitions.partition(profile["user_id"])
+        store = game_store
+        recent_games = RecentGames(RECENT_GAMES, lambda k: store.read_history_page(0, k)[::-1])
+        session_index = SessionIndex(store.read_session_ids)
+        reset_history(0)
+        await reset_game(None)
+        
+        sidebar.selected_index = 0
+        show_view("dashboard")
+        await update_dashboard_view()
+    
+    async def log_out(e):
+        await show_login()
+    
+    # Dashboard view
+    dashboard_view = ft.Container(
+        content=ft.Column(
+            [
+                # Add header with user icon
+                create_tab_header("DASHBOARD"),
+                
+                # Content container
+                ft.Container(
+                    content=ft.Column([], ref=dashboard_content_ref),
+                    padding=ft.padding.all(20),
+                    expand=True,
+                )
+            ],
+            spacing=0,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        ),
+        padding=0,
+        expand=True
+    )
+    
+    # Stats view
+    stats_view = ft.Container(
+        content=ft.Column(
+            [
+                # Add header with user icon
+                create_tab_header("GAME STATISTICS"),
+                
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            ft.Container(
+                                content=ft.Column([], ref=stats_content_ref),
+                                expand=True
+                            )
+                        ],
+                        spacing=20,
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                    ),
+                    padding=ft.padding.all(20),
+                    expand=True
+                )
+            ],
+            spacing=0,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        ),
+        padding=0,
+        expand=True
+    )
+    
+    # History view
+    history_view = ft.Container(
+        content=ft.Column(
+            [
+                # Add header with user icon
+                create_tab_header("GAME HISTORY"),
+                
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            # Column headers, the rows below scroll under them
+                            ft.Container(
+                                content=history_row_layout(
+                                    [ft.Text(title, weight=ft.FontWeight.BOLD)
+                                     for title in ["Time", "Your Choice", "Computer's Choice", "Result"]]
+                                ),
+                                padding=ft.padding.symmetric(vertical=10, horizontal=15),
+                                bgcolor=ft.Colors.BLUE_GREY_100,
+                                border_radius=ft.border_radius.only(top_left=10, top_right=10),
+                            ),
+                            ft.ListView(
+                                ref=history_list_ref,
+                                controls=[],
+                                spacing=0,
+                                item_extent=HISTORY_ROW_HEIGHT,
+                                on_scroll=on_history_scroll,
+                                on_scroll_interval=100,
+                                expand=True,
+                            ),
+                        ],
+                        spacing=0,
+                        expand=True,
+                    ),
+                    padding=ft.padding.all(20),
+                    expand=True
+                )
+            ],
+            spacing=0,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            expand=True,
+        ),
+        padding=0,
+        expand=True
+    )
+    
+    # Replay view, a session's games are found through the index and read
+    # by row ranges
+    def read_session_games(session_id):
+        games = []
+        for start, stop in session_index.runs(session_id):
+            for row in game_store.read_history_rows(start, stop - start):
+                games.append((row["timestamp"], row["user_choice"], row["computer_choice"],
+                              result_outcomes.get(row["result"], engine.TIE)))
+        return games
+    
+    async def load_sessions():
+        return await asyncio.to_thread(session_index.sessions)
+    
+    async def load_session_games(session_id):
+        return await asyncio.to_thread(read_session_games, session_id)
+    
+    replay = ReplayView(load_sessions, load_session_games, updates.request)
+    replay_view = ft.Container(
+        content=ft.Column(
+            [
+                create_tab_header("SESSION REPLAY"),
+                ft.Container(content=replay.control, padding=ft.padding.all(20), expand=True),
+            ],
+            spacing=0,
+            expand=True,
+        ),
+        padding=0,
+        expand=True
+    )
+    
+    # Leaderboard view
+    board = LeaderboardView(leaderboard, lambda: user["user_id"], updates.request, profiles.name)
+    leaderboard_view = ft.Container(
+        content=ft.Column(
+            [
+                create_tab_header("LEADERBOARD"),
+                ft.Container(content=board.control, padding=ft.padding.all(20), expand=True),
+            ],
+            spacing=0,
+            expand=True,
+        ),
+        padding=0,
+        expand=True
+    )
+    
+    # Game content area
+    game_view = ft.Container(
+        content=ft.Column(
+            [
+                # Add header with user icon
+                create_tab_header("ROCK PAPER SCISSORS"),
+                
+                # Content container
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            # Score display
+                            ft.Container(
+                                content=ft.Text(f"You: {user_score}  |  Computer: {computer_score}", 
+                                            size=24, 
+                                            weight=ft.FontWeight.W_500,
+                                            color=ft.Colors.BLUE_800,
+                                            ref=score_text_ref),
+                                alignment=ft.alignment.center,
+                                margin=ft.margin.only(bottom=30, top=20)
+                            ),
+                            
+                            # Game status message
+                            ft.Container(
+                                content=ft.Text("Choose your move!",
+                                            size=20, 
+                                            color=ft.Colors.BLACK87,
+                                            text_align=ft.TextAlign.CENTER,
+                                            ref=status_message_ref),
+                                alignment=ft.alignment.center,
+                                margin=ft.margin.symmetric(vertical=15),
+                                height=50
+                            ),
+                            
+                            # Choice display
+                            ft.Row(
+                                controls=[
+                                    ft.Column(
+                                        [ft.Text("Your choice: ", size=18, ref=user_choice_text_ref)],
+                                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                                        expand=True
+                                    ),
+                                    ft.Column(
+                                        [ft.Text("Computer's choice: ", size=18, ref=computer_choice_text_ref)],
+                                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                                        expand=True
+                                    )
+                                ],
+                                alignment=ft.MainAxisAlignment.CENTER
+                            ),
+                            
+                            ft.Container(height=30),  # Spacer
+                            
+                            # Opponent picker
+                            ft.Row([opponent_dropdown], alignment=ft.MainAxisAlignment.CENTER),
+                            
+                            ft.Container(height=20),  # Spacer
+                            
+                            # Button row, one button per move of the rule set
+                            ft.Row(
+                                [
+                                    ft.ElevatedButton(
+                                        content=ft.Row([
+                                            ft.Icon(choice_icons[choice][0]),
+                                            ft.Text(choice.capitalize(), size=16)
+                                        ], alignment=ft.MainAxisAlignment.CENTER),
+                                        style=ft.ButtonStyle(
+                                            shape=ft.RoundedRectangleBorder(radius=10),
+                                            padding=15
+                                        ),
+                                        on_click=choice_click(choice),
+                                        width=150,
+                                        height=60
+                                    )
+                                    for choice in choices
+                                ],
+                                alignment=ft.MainAxisAlignment.CENTER,
+                                spacing=20,
+                                wrap=True
+                            ),
+                            
+                            ft.Container(height=30),  # Spacer
+                            
+                            # Reset button
+                            ft.Row(
+                                [
+                                    ft.OutlinedButton(
+                                        "Reset Game",
+                                        icon=ft.Icons.REFRESH,
+                                        on_click=reset_game
+                                    )
+                                ], 
+                                alignment=ft.MainAxisAlignment.CENTER
+                            )
+                        ],
+                        spacing=0,
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    padding=ft.padding.all(20),
+                    expand=True,
+                )
+            ],
+            spacing=0,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        ),
+        padding=0,
+        expand=True
+    )
+    
+    views = {
+        "dashboard": dashboard_view,
+        "game": game_view,
+        "stats": stats_view,
+        "history": history_view,
+        "replay": replay_view,
+        "leaderboard": leaderboard_view,
+    }
+    show_view(current_view)  # Default to dashboard view
+    
+    # Define the content area container properly
+    content_area = ft.Container(
+        content=ft.Column(list(views.values()), spacing=0, expand=True),
+        expand=True,
+        ref=content_area_ref
+    )
+    
+    # Fix the sidebar definition to include all necessary properties
+    sidebar = ft.NavigationRail(
+        selected_index=0,  # Default to Dashboard tab
+        label_type=ft.NavigationRailLabelType.ALL,
+        min_width=150,
+        min_extended_width=250,
+        group_alignment=-0.9,
+        leading=logo_container,
+        destinations=[
+            ft.NavigationRailDestination(
+                icon=ft.Icons.DASHBOARD,
+                selected_icon=ft.Icons.DASHBOARD,
+                label="Dashboard",
+            ),
+            ft.NavigationRailDestination(
+                icon=ft.Icons.SPORTS_ESPORTS,
+                selected_icon=ft.Icons.SPORTS_ESPORTS,
+                label="Game",
+            ),
+            ft.NavigationRailDestination(
+                icon=ft.Icons.BAR_CHART,
+                selected_icon=ft.Icons.BAR_CHART,
+                label="Stats",
+            ),
+            ft.NavigationRailDestination(
+                icon=ft.Icons.HISTORY,
+                selected_icon=ft.Icons.HISTORY,
+                label="History",
+            ),
+            ft.NavigationRailDestination(
+                icon=ft.Icons.REPLAY,
+                selected_icon=ft.Icons.REPLAY,
+                label="Replay",
+            ),
+            ft.NavigationRailDestination(
+                icon=ft.Icons.LEADERBOARD,
+                selected_icon=ft.Icons.LEADERBOARD,
+                label="Leaderboard",
+            ),
+        ],
+        on_change=change_tab,
+    )
+    
+    # Show the layout right away, the dashboard fills in once a player has
+    # logged in, while the data libraries load in the background
+    dashboard_content_ref.current.controls.append(
+        ft.Row([ft.ProgressRing(width=24, height=24), ft.Text("Loading your dashboard...")],
+               alignment=ft.MainAxisAlignment.CENTER)
+    )
+    
+    # Main layout with sidebar and content
+    page.add(
+        ft.Row(
+            [
+                sidebar,
+                ft.VerticalDivider(width=1),
+                content_area,
+            ],
+            expand=True,
+        )
+    )
+    
+    page.run_task(show_login)
+    warm_up(pl, pd, session_rng.fill)
+
+if __name__ == "__main__":
+    ft.app(target=main)
@@ -1,732 +1,997 @@
-import flet as ft
-import random
-import os
-import datetime
-import polars as pl
-import matplotlib
-# Set matplotlib to use non-GUI backend to prevent thread warnings
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-from io import BytesIO
-import base64
-
-# Create data directory if it doesn't exist
-data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-os.makedirs(data_dir, exist_ok=True)
-data_file = os.path.join(data_dir, "game_data.csv")
-
-# Initialize or load game data with better error handling
-try:
-    if os.path.exists(data_file):
-        try:
-            # Load CSV with explicit schema to ensure consistent data types
-            df = pl.read_csv(data_file, dtypes={
-                "timestamp": pl.Utf8,
-                "player_choice": pl.Utf8,
-                "computer_choice": pl.Utf8,
-                "result": pl.Utf8,
-                "session_id": pl.Utf8
-            })
-            
-            # Verify required columns exist
-            required_cols = ["timestamp", "player_choice", "computer_choice", "result", "session_id"]
-            if not all(col in df.columns for col in required_cols):
-                raise ValueError("CSV file is missing required columns")
-        except Exception as e:
-            print(f"Error loading game data: {e}")
-            df = pl.DataFrame({
-                "timestamp": [],
-                "player_choice": [],
-                "computer_choice": [],
-                "result": [],
-                "session_id": []
-            }, schema={
-                "timestamp": pl.Utf8,
-                "player_choice": pl.Utf8,
-                "computer_choice": pl.Utf8,
-                "result": pl.Utf8,
-                "session_id": pl.Utf8
-            })
-    else:
-        df = pl.DataFrame({
-            "timestamp": [],
-            "player_choice": [],
-            "computer_choice": [],
-            "result": [],
-            "session_id": []
-        }, schema={
-            "timestamp": pl.Utf8,
-            "player_choice": pl.Utf8,
-            "computer_choice": pl.Utf8,
-            "result": pl.Utf8,
-            "session_id": pl.Utf8
-        })
-except Exception as e:
-    print(f"Error initializing data: {e}")
-    df = pl.DataFrame({
-        "timestamp": [],
-        "player_choice": [],
-        "computer_choice": [],
-        "result": [],
-        "session_id": []
-    }, schema={
-        "timestamp": pl.Utf8,
-        "player_choice": pl.Utf8,
-        "computer_choice": pl.Utf8,
-        "result": pl.Utf8,
-        "session_id": pl.Utf8
-    })
-
-def main(page: ft.Page):
-    page.title = "Rock Paper Scissors Dashboard"
-    page.theme_mode = ft.ThemeMode.LIGHT
-    page.window_width = 1000
-    page.window_height = 800
-    page.padding = 10
-    page.bgcolor = ft.Colors.WHITE
-    page.scroll = ft.ScrollMode.AUTO
-
-    # Create a unique session ID
-    session_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-
-    # Game variables
-    player_score = 0
-    computer_score = 0
-    ties = 0
-    choices = ["rock", "paper", "scissors"]
-    
-    # Header
-    header = ft.Container(
-        content=ft.Column([
-            ft.Text("Rock Paper Scissors Dashboard", size=30, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-            ft.Text("Play, track your progress, and analyze your performance", size=16, italic=True)
-        ]),
-        padding=10,
-        margin=ft.margin.only(bottom=20),
-    )
-    
-    # Initialize tabs
-    tab_bar = ft.Tabs(
-        selected_index=0,
-        animation_duration=300,
-        tabs=[
-            ft.Tab(text="Play Game"),
-            ft.Tab(text="Statistics"),
-            ft.Tab(text="History")
-        ],
-        expand=True,
-    )
-
-    # Game Tab Content
-    # Score display
-    score_text = ft.Text(f"Player: {player_score} - Computer: {computer_score} - Ties: {ties}", 
-                         size=18, weight=ft.FontWeight.BOLD)
-
-    # Result display
-    result_text = ft.Text("", size=22, color=ft.Colors.PRIMARY)
-
-    # Choice icons
-    rock_icon = ft.Icon(ft.Icons.SPORTS_HANDBALL, size=60)
-    paper_icon = ft.Icon(ft.Icons.INSERT_DRIVE_FILE, size=60)
-    scissors_icon = ft.Icon(ft.Icons.CONTENT_CUT, size=60)
-
-    player_choice_display = ft.Container(
-        content=ft.Column([
-            ft.Text("You chose:", color=ft.Colors.BLUE_700),
-            ft.Container(width=80, height=80, border_radius=40, bgcolor=ft.Colors.BLUE_50, 
-                        content=ft.Icon(ft.Icons.QUESTION_MARK, size=40), alignment=ft.alignment.center)
-        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-        visible=False
-    )
-    
-    computer_choice_display = ft.Container(
-        content=ft.Column([
-            ft.Text("Computer chose:", color=ft.Colors.RED_700),
-            ft.Container(width=80, height=80, border_radius=40, bgcolor=ft.Colors.RED_50, 
-                        content=ft.Icon(ft.Icons.QUESTION_MARK, size=40), alignment=ft.alignment.center)
-        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-        visible=False
-    )
-
-    # Stats containers
-    stats_container = ft.Container(
-        content=None,
-        padding=20,
-        expand=True
-    )
-    
-    history_container = ft.Container(
-        content=None,
-        padding=20,
-        expand=True
-    )
-
-    # Fixed visualization functions with error handling
-    def generate_pie_chart():
-        try:
-            # Calculate win statistics
-            if not os.path.exists(data_file) or df.shape[0] == 0:
-                return ft.Text("No game data available yet. Play some games first!")
-                
-            results_count = df.group_by("result").agg(pl.count().alias("count"))
-            
-            # Create pie chart using non-interactive backend
-            plt.figure(figsize=(8, 6))
-            labels = results_count['result'].to_list()
-            values = results_count['count'].to_list()
-            colors = ['#4CAF50', '#F44336', '#2196F3']  # Green, Red, Blue for wins, losses, ties
-            
-            plt.pie(values, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            plt.axis('equal')
-            plt.title('Game Results Distribution')
-            
-            # Save to BytesIO
-            buf = BytesIO()
-            plt.savefig(buf, format='png')
-            plt.close()
-            buf.seek(0)
-            
-            # Convert to base64 for embedding in flet
-            img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-            
-            return ft.Image(
-                src_base64=img_base64,
-                width=400,
-                height=300,
-                fit=ft.ImageFit.CONTAIN
-            )
-        except Exception as e:
-            print(f"Error generating pie chart: {e}")
-            return ft.Text("Could not generate chart. Error occurred.")
-
-    def generate_bar_chart():
-        try:
-            if not os.path.exists(data_file) or df.shape[0] == 0:
-                return ft.Text("No game data available yet. Play some games first!")
-            
-            # Count choices
-            player_choices = df.group_by("player_choice").agg(pl.count().alias("count"))
-            
-            # Create bar chart
-            plt.figure(figsize=(8, 6))
-            choices = player_choices['player_choice'].to_list()
-            counts = player_choices['count'].to_list()
-            
-            bars = plt.bar(choices, counts, color=['#2196F3', '#4CAF50', '#F44336'])
-            
-            plt.xlabel('Choice')
-            plt.ylabel('Frequency')
-            plt.title('Your Choice Distribution')
-            
-            # Save to BytesIO
-            buf = BytesIO()
-            plt.savefig(buf, format='png')
-            plt.close()
-            buf.seek(0)
-            
-            # Convert to base64 for embedding in flet
-            img_base64 = base64.b64encode(buf.read()).decode('utf-8')
-            
-            return ft.Image(
-                src_base64=img_base64,
-                width=400,
-                height=300,
-                fit=ft.ImageFit.CONTAIN
-            )
-        except Exception as e:
-            print(f"Error generating bar chart: {e}")
-            return ft.Text("Could not generate chart. Error occurred.")
-
-    def calculate_win_ratio():
-        if not os.path.exists(data_file) or df.shape[0] == 0:
-            return None, None, None
-        
-        total_games = df.shape[0]
-        wins = df.filter(pl.col("result") == "Win").shape[0]
-        losses = df.filter(pl.col("result") == "Loss").shape[0]
-        ties = df.filter(pl.col("result") == "Tie").shape[0]
-        
-        win_ratio = wins / total_games if total_games > 0 else 0
-        loss_ratio = losses / total_games if total_games > 0 else 0
-        tie_ratio = ties / total_games if total_games > 0 else 0
-        
-        return win_ratio, loss_ratio, tie_ratio
-
-    def update_stats_view():
-        win_ratio, loss_ratio, tie_ratio = calculate_win_ratio()
-        
-        if win_ratio is None:
-            stats_container.content = ft.Column([
-                ft.Text("No game data available yet. Play some games first!", size=18)
-            ])
-            return
-        
-        pie_chart = generate_pie_chart()
-        bar_chart = generate_bar_chart()
-        
-        # Create stats view
-        stats_container.content = ft.Column([
-            ft.Text("Game Statistics", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-            ft.Divider(),
-            
-            ft.Row([
-                ft.Container(
-                    content=ft.Column([
-                        ft.Text("Win Ratio", size=18, weight=ft.FontWeight.BOLD),
-                        ft.ProgressBar(value=win_ratio, width=200, color=ft.Colors.GREEN_500),
-                        ft.Text(f"{win_ratio:.1%}", size=16)
-                    ]),
-                    padding=10,
-                    border_radius=10,
-                    bgcolor=ft.Colors.GREEN_50
-                ),
-                ft.Container(
-                    content=ft.Column([
-                        ft.Text("Loss Ratio", size=18, weight=ft.FontWeight.BOLD),
-                        ft.ProgressBar(value=loss_ratio, width=200, color=ft.Colors.RED_500),
-                        ft.Text(f"{loss_ratio:.1%}", size=16)
-                    ]),
-                    padding=10,
-                    border_radius=10,
-                    bgcolor=ft.Colors.RED_50
-                ),
-                ft.Container(
-                    content=ft.Column([
-                        ft.Text("Tie Ratio", size=18, weight=ft.FontWeight.BOLD),
-                        ft.ProgressBar(value=tie_ratio, width=200, color=ft.Colors.BLUE_500),
-                        ft.Text(f"{tie_ratio:.1%}", size=16)
-                    ]),
-                    padding=10,
-                    border_radius=10,
-                    bgcolor=ft.Colors.BLUE_50
-                ),
-            ], alignment=ft.MainAxisAlignment.SPACE_EVENLY),
-            
-            ft.Divider(),
-            
-            ft.Text("Results Distribution", size=20, weight=ft.FontWeight.BOLD),
-            ft.Row([pie_chart], alignment=ft.MainAxisAlignment.CENTER),
-            
-            ft.Divider(),
-            
-            ft.Text("Your Choice Patterns", size=20, weight=ft.FontWeight.BOLD),
-            ft.Row([bar_chart], alignment=ft.MainAxisAlignment.CENTER),
-            
-            # Additional stats
-            ft.Divider(),
-            
-            ft.Text("Total Games Played", size=20, weight=ft.FontWeight.BOLD),
-            ft.Text(f"{df.shape[0]}", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-        ], spacing=20, scroll=ft.ScrollMode.AUTO)
-        
-        page.update()
-
-    def update_history_view():
-        if not os.path.exists(data_file) or df.shape[0] == 0:
-            history_container.content = ft.Column([
-                ft.Text("No game history available yet. Play some games first!", size=18)
-            ])
-            page.update()
-            return
-        
-        # Create DataTable for history
-        history_data = []
-        
-        # Sort by timestamp descending
-        sorted_df = df.sort("timestamp", descending=True)
-        
-        # Get the last 30 games or all if less than 30
-        recent_games = sorted_df.head(30)
-        
-        # Create table rows
-        for row in recent_games.iter_rows(named=True):
-            history_data.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(row["timestamp"])),
-                        ft.DataCell(ft.Text(row["player_choice"].capitalize())),
-                        ft.DataCell(ft.Text(row["computer_choice"].capitalize())),
-                        ft.DataCell(
-                            ft.Text(
-                                row["result"], 
-                                color=ft.Colors.GREEN_700 if row["result"] == "Win" else 
-                                      ft.Colors.RED_700 if row["result"] == "Loss" else 
-                                      ft.Colors.BLUE_700
-                            )
-                        ),
-                    ]
-                )
-            )
-        
-        history_table = ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Time")),
-                ft.DataColumn(ft.Text("Your Choice")),
-                ft.DataColumn(ft.Text("Computer's Choice")),
-                ft.DataColumn(ft.Text("Result")),
-            ],
-            rows=history_data,
-            border=ft.border.all(1, ft.Colors.GREY_400),
-            border_radius=10,
-            vertical_lines=ft.border.BorderSide(1, ft.Colors.GREY_300),
-            horizontal_lines=ft.border.BorderSide(1, ft.Colors.GREY_300),
-            sort_column_index=0,
-            sort_ascending=False,
-        )
-        
-        # Create export button
-        def export_to_excel(e):
-            export_path = os.path.join(data_dir, "game_history.xlsx")
-            df.write_excel(export_path)
-            page.snack_bar = ft.SnackBar(
-                content=ft.Text(f"Exported to {export_path}"),
-                action="OK"
-            )
-            page.snack_bar.open = True
-            page.update()
-        
-        export_button = ft.ElevatedButton(
-            "Export to Excel",
-            icon=ft.Icons.DOWNLOAD,
-            on_click=export_to_excel,
-            style=ft.ButtonStyle(
-                color=ft.Colors.WHITE,
-                bgcolor=ft.Colors.BLUE_700,
-            )
-        )
-        
-        # Fix the Row with padding error by using Container instead
-        history_container.content = ft.Column([
-            ft.Text("Game History", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-            ft.Text("Recent Games (Last 30)", size=16, italic=True),
-            history_table,
-            ft.Container(
-                content=ft.Row(
-                    [export_button], 
-                    alignment=ft.MainAxisAlignment.END
-                ),
-                padding=20
-            )
-        ], spacing=20, scroll=ft.ScrollMode.AUTO)
-        
-        page.update()
-
-    # Function to handle game logic
-    def play_game(player_choice):
-        try:
-            nonlocal player_score, computer_score, ties
-            global df
-            
-            # Computer makes a random choice
-            computer_choice = random.choice(choices)
-            
-            # Update icons
-            choice_to_icon = {
-                "rock": ft.Icons.SPORTS_HANDBALL,
-                "paper": ft.Icons.INSERT_DRIVE_FILE,
-                "scissors": ft.Icons.CONTENT_CUT
-            }
-            
-            player_choice_display.visible = True
-            player_choice_display.content.controls[1].content = ft.Icon(choice_to_icon[player_choice], size=40, color=ft.Colors.BLUE_700)
-            
-            computer_choice_display.visible = True
-            computer_choice_display.content.controls[1].content = ft.Icon(choice_to_icon[computer_choice], size=40, color=ft.Colors.RED_700)
-            
-            # Determine the winner
-            result = ""
-            if player_choice == computer_choice:
-                result_text.value = "It's a tie!"
-                result_text.color = ft.Colors.BLUE_500
-                ties += 1
-                result = "Tie"
-            elif ((player_choice == "rock" and computer_choice == "scissors") or
-                  (player_choice == "paper" and computer_choice == "rock") or
-                  (player_choice == "scissors" and computer_choice == "paper")):
-                result_text.value = "You win!"
-                result_text.color = ft.Colors.GREEN_500
-                player_score += 1
-                result = "Win"
-            else:
-                result_text.value = "Computer wins!"
-                result_text.color = ft.Colors.RED_500
-                computer_score += 1
-                result = "Loss"
-            
-            # Update score
-            score_text.value = f"Player: {player_score} - Computer: {computer_score} - Ties: {ties}"
-            
-            # Record the game data
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            new_row = pl.DataFrame({
-                "timestamp": [timestamp],
-                "player_choice": [player_choice],
-                "computer_choice": [computer_choice],
-                "result": [result],
-                "session_id": [session_id]
-            }, schema={
-                "timestamp": pl.Utf8,
-                "player_choice": pl.Utf8,
-                "computer_choice": pl.Utf8,
-                "result": pl.Utf8,
-                "session_id": pl.Utf8
-            })
-            
-            # Append to the dataframe
-            df = pl.concat([df, new_row])
-            
-            # Save to CSV
-            try:
-                df.write_csv(data_file)
-            except Exception as e:
-                print(f"Error saving game data: {e}")
-                # Show error message to user
-                page.snack_bar = ft.SnackBar(
-                    content=ft.Text("Failed to save game data"),
-                    action="OK"
-                )
-                page.snack_bar.open = True
-            
-            # Update the stats views (but don't refresh them yet)
-            if tab_bar.selected_index != 0:
-                if tab_bar.selected_index == 1:
-                    update_stats_view()
-                elif tab_bar.selected_index == 2:
-                    update_history_view()
-        
-            page.update()
-        except Exception as e:
-            print(f"Error in play_game: {e}")
-            # Show error message to user
-            page.snack_bar = ft.SnackBar(
-                content=ft.Text(f"Game error: {str(e)}"),
-                action="OK"
-            )
-            page.snack_bar.open = True
-            page.update()
-
-    # Button click handlers
-    def image_click(choice):
-        def handle_click(e):
-            play_game(choice)
-        return handle_click
-
-    def reset_click(e):
-        nonlocal player_score, computer_score, ties
-        player_score = 0
-        computer_score = 0
-        ties = 0
-        result_text.value = ""
-        score_text.value = f"Player: {player_score} - Computer: {computer_score} - Ties: {ties}"
-        player_choice_display.visible = False
-        computer_choice_display.visible = False
-        page.update()
-
-    # Choice buttons with icons
-    rock_btn = ft.Container(
-        content=ft.Column([
-            rock_icon,
-            ft.Text("Rock")
-        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-        on_click=image_click("rock"),
-        ink=True,
-        padding=20,
-        margin=10,
-        border_radius=10,
-        bgcolor=ft.Colors.BLUE_50,
-        shadow=ft.BoxShadow(
-            spread_radius=1,
-            blur_radius=8,
-            color=ft.Colors.BLUE_GREY_100,
-            offset=ft.Offset(2, 2),
-        )
-    )
-    
-    paper_btn = ft.Container(
-        content=ft.Column([
-            paper_icon,
-            ft.Text("Paper")
-        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-        on_click=image_click("paper"),
-        ink=True,
-        padding=20,
-        margin=10,
-        border_radius=10,
-        bgcolor=ft.Colors.GREEN_50,
-        shadow=ft.BoxShadow(
-            spread_radius=1,
-            blur_radius=8,
-            color=ft.Colors.BLUE_GREY_100,
-            offset=ft.Offset(2, 2),
-        )
-    )
-    
-    scissors_btn = ft.Container(
-        content=ft.Column([
-            scissors_icon,
-            ft.Text("Scissors")
-        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-        on_click=image_click("scissors"),
-        ink=True,
-        padding=20,
-        margin=10,
-        border_radius=10,
-        bgcolor=ft.Colors.ORANGE_50,
-        shadow=ft.BoxShadow(
-            spread_radius=1,
-            blur_radius=8,
-            color=ft.Colors.BLUE_GREY_100,
-            offset=ft.Offset(2, 2),
-        )
-    )
-    
-    choice_row = ft.Row(
-        [rock_btn, paper_btn, scissors_btn],
-        alignment=ft.MainAxisAlignment.SPACE_EVENLY
-    )
-    
-    # Results display
-    result_display = ft.Column(
-        [
-            ft.Row([player_choice_display, computer_choice_display], 
-                  alignment=ft.MainAxisAlignment.SPACE_EVENLY),
-            result_text
-        ],
-        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-        spacing=20
-    )
-    
-    # Reset button
-    reset_btn = ft.ElevatedButton(
-        "Reset Game", 
-        on_click=reset_click, 
-        icon=ft.Icons.REFRESH,
-        style=ft.ButtonStyle(
-            color=ft.Colors.WHITE,
-            bgcolor=ft.Colors.BLUE_700,
-            padding=15
-        )
-    )
-
-    # Game tab content
-    game_content = ft.Container(
-        content=ft.Column(
-            [
-                ft.Text("Let's play!", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
-                ft.Divider(),
-                score_text,
-                ft.Divider(),
-                ft.Text("Choose your move:", size=16),
-                choice_row,
-                ft.Divider(),
-                result_display,
-                ft.Divider(),
-                reset_btn
-            ],
-            alignment=ft.MainAxisAlignment.CENTER,
-            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            spacing=20
-        ),
-        padding=30,
-        border_radius=10,
-        expand=True,
-    )
-
-    # Tab change handler
-    def on_tab_change(e):
-        try:
-            selected_index = e.control.selected_index
-            
-            # Update visibility
-            game_content.visible = selected_index == 0
-            stats_container.visible = selected_index == 1
-            history_container.visible = selected_index == 2
-            
-            # Load content for the selected tab
-            if selected_index == 1:  # Stats tab
-                update_stats_view()
-            elif selected_index == 2:  # History tab
-                update_history_view()
-                
-            page.update()
-        except Exception as e:
-            print(f"Error changing tabs: {e}")
-
-    tab_bar.on_change = on_tab_change
-
-    # Set up tab content
-    tab_content = ft.Container(
-        content=ft.Stack([
-            game_content,       # Tab 0
-            stats_container,    # Tab 1
-            history_container,  # Tab 2
-        ]),
-        expand=True,
-        padding=10,
-    )
-
-    # Update visibility based on selected tab
-    def update_tab_visibility():
-        selected_index = tab_bar.selected_index
-        game_content.visible = selected_index == 0
-        stats_container.visible = selected_index == 1
-        history_container.visible = selected_index == 2
-        page.update()
-
-    tab_bar.on_change = lambda e: (on_tab_change(e), update_tab_visibility())
-
-    # Initialize tab visibility explicitly
-    game_content.visible = True
-    stats_container.visible = False
-    history_container.visible = False
-
-    # Add debug button to help identify issues
-    def debug_info(e):
-        info = f"""
-        Tab index: {tab_bar.selected_index}
-        Game content visible: {game_content.visible}
-        Stats visible: {stats_container.visible}
-        History visible: {history_container.visible}
-        Data rows: {df.shape[0]}
-        """
-        # Create a function to close the dialog
-        def close_dialog(e):
-            page.dialog.open = False
-            page.update()
-            
-        page.dialog = ft.AlertDialog(
-            title=ft.Text("Debug Info"),
-            content=ft.Text(info),
-            actions=[
-                ft.TextButton("OK", on_click=close_dialog)
-            ]
-        )
-        page.dialog.open = True
-        page.update()
-
-    debug_btn = ft.ElevatedButton(
-        "Debug",
-        on_click=debug_info,
-        icon=ft.Icons.BUG_REPORT,
-        style=ft.ButtonStyle(
-            color=ft.Colors.WHITE,
-            bgcolor=ft.Colors.GREY_700,
-        )
-    )
-
-    # Add all components to the page
-    page.add(
-        header,
-        ft.Card(
-            content=ft.Column([
-                tab_bar,
-                tab_content,
-                ft.Row([debug_btn], alignment=ft.MainAxisAlignment.END)
-            ]),
-            elevation=5,
-            expand=True,
-        )
-    )
-
-if __name__ == "__main__":
-    ft.app(target=main)
+import flet as ft
+import asyncio
+import os
+import sys
+import datetime
+import threading
+import time
+
+# Make the shared rps package importable when this file is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps import charts, engine, memprofile, metrics, raster_charts
+from rps.assets import ChartAssetCache
+from rps.lazy import lazy_import, warm_up
+from rps.move_icons import button_color, move_icon
+from rps.multiplayer import Lobby
+from rps.multiplayer_view import MultiplayerView
+from rps.opponents import DEFAULT_OPPONENT, OPPONENTS, make_opponent
+from rps.perf_view import PerfPanel
+from rps.recent import RecentGames
+from rps.replay import SessionIndex
+from rps.replay_view import ReplayView
+from rps.rng import SessionLog, SessionRandom
+from rps.scheduler import scheduler_for
+from rps.viewmodel import ViewModel
+
+pl = lazy_import("polars")
+
+# "native" draws Flet charts, "raster" renders PNG images with matplotlib
+CHART_MODE = os.environ.get("RPS_CHARTS", "native")
+
+# Raster charts are served by URL from the Flet assets directory
+assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+chart_assets = None
+if CHART_MODE == "raster":
+    chart_assets = ChartAssetCache(assets_dir)
+    chart_assets.collect_garbage()
+
+# Create data directory if it doesn't exist
+data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+os.makedirs(data_dir, exist_ok=True)
+data_file = os.path.join(data_dir, "game_data.csv")
+
+# Seed and opponents of every session, for replaying its games
+session_log = SessionLog(os.path.join(data_dir, "sessions.csv"))
+
+# Game data is loaded on first use (or by the warm-up thread) so the play
+# screen does not wait for polars and the CSV
+df = None
+df_lock = threading.Lock()
+
+def load_game_data():
+    global df, saved_rows
+    with df_lock:
+        if df is None:
+            df = read_game_data()
+            saved_rows = df.shape[0]
+    return df
+
+# Every move appends a chunk to df, its size is read at each memory snapshot
+memprofile.watch("df", lambda: df)
+
+# Players of every session are matched against each other here
+lobby = Lobby()
+
+# The history tab lists the newest games from this buffer, filled as games
+# are played and seeded from the end of the data
+RECENT_GAMES = 30
+recent_games = RecentGames(RECENT_GAMES, lambda k: load_game_data().tail(k).to_dicts())
+
+# Rows of every session, for the replay tab
+session_index = SessionIndex(lambda: load_game_data()["session_id"].to_list())
+
+async def load_game_data_async():
+    # Reading the CSV happens off the event loop
+    if df is None:
+        await asyncio.to_thread(load_game_data)
+    return df
+
+# Games are appended to df in memory and written to the CSV in the
+# background, saved_rows is how many of them the file already has
+saved_rows = 0
+save_lock = threading.Lock()
+# Seconds the last write took, for the performance panel
+last_save_seconds = None
+
+# Writes the rows of data (df by default) that the file doesn't have yet
+@metrics.timed("save.write")
+def save_game_data(data=None):
+    global saved_rows, last_save_seconds
+    with save_lock:
+        if data is None:
+            data = df
+        if data.shape[0] != saved_rows:
+            started = time.perf_counter()
+            if saved_rows and os.path.exists(data_file):
+                # Rows only ever get appended, so only the new ones are written
+                with open(data_file, "ab") as f:
+                    data.slice(saved_rows).write_csv(f, include_header=False)
+            else:
+                data.write_csv(data_file)
+            saved_rows = data.shape[0]
+            last_save_seconds = time.perf_counter() - started
+
+# Initialize or load game data with better error handling
+def read_game_data():
+    try:
+        if os.path.exists(data_file):
+            try:
+                # Load CSV with explicit schema to ensure consistent data types
+                df = pl.read_csv(data_file, dtypes={
+                    "timestamp": pl.Utf8,
+                    "player_choice": pl.Utf8,
+                    "computer_choice": pl.Utf8,
+                    "result": pl.Utf8,
+                    "session_id": pl.Utf8
+                })
+            
+                # Verify required columns exist
+                required_cols = ["timestamp", "player_choice", "computer_choice", "result", "session_id"]
+                if not all(col in df.columns for col in required_cols):
+                    raise ValueError("CSV file is missing required columns")
+            except Exception as e:
+                print(f"Error loading game data: {e}")
+                df = pl.DataFrame({
+                    "timestamp": [],
+                    "player_choice": [],
+                    "computer_choice": [],
+                    "result": [],
+                    "session_id": []
+                }, schema={
+                    "timestamp": pl.Utf8,
+                    "player_choice": pl.Utf8,
+                    "computer_choice": pl.Utf8,
+                    "result": pl.Utf8,
+                    "session_id": pl.Utf8
+                })
+        else:
+            df = pl.DataFrame({
+                "timestamp": [],
+                "player_choice": [],
+                "computer_choice": [],
+                "result": [],
+                "session_id": []
+            }, schema={
+                "timestamp": pl.Utf8,
+                "player_choice": pl.Utf8,
+                "computer_choice": pl.Utf8,
+                "result": pl.Utf8,
+                "session_id": pl.Utf8
+            })
+    except Exception as e:
+        print(f"Error initializing data: {e}")
+        df = pl.DataFrame({
+            "timestamp": [],
+            "player_choice": [],
+            "computer_choice": [],
+            "result": [],
+            "session_id": []
+        }, schema={
+            "timestamp": pl.Utf8,
+            "player_choice": pl.Utf8,
+            "computer_choice": pl.Utf8,
+            "result": pl.Utf8,
+            "session_id": pl.Utf8
+        })
+    return df
+
+def main(page: ft.Page):
+    page.title = "Rock Paper Scissors Dashboard"
+    page.theme_mode = ft.ThemeMode.LIGHT
+    page.window_width = 1000
+    page.window_height = 800
+    page.padding = 10
+    page.bgcolor = ft.Colors.WHITE
+    page.scroll = ft.ScrollMode.AUTO
+
+    # Page updates are coalesced to at most one per frame
+    updates = scheduler_for(page)
+
+    # Create a unique session ID
+    session_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+    # RPS_RULES picks the rule set, every move gets a button
+    rules = engine.RULES
+    session_rng = SessionRandom(choices=rules.size)
+    session_moves = 0
+
+    # Game variables
+    player_score = 0
+    computer_score = 0
+    ties = 0
+    choices = list(rules.moves)
+    opponent_name = DEFAULT_OPPONENT
+    opponent = make_opponent(opponent_name, session_rng, rules)
+    opponent_logged = False
+    
+    # Header
+    header = ft.Container(
+        content=ft.Column([
+            ft.Text("Rock Paper Scissors Dashboard", size=30, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+            ft.Text("Play, track your progress, and analyze your performance", size=16, italic=True)
+        ]),
+        padding=10,
+        margin=ft.margin.only(bottom=20),
+    )
+    
+    # Initialize tabs
+    tab_bar = ft.Tabs(
+        selected_index=0,
+        animation_duration=300,
+        tabs=[
+            ft.Tab(text="Play Game"),
+            ft.Tab(text="Statistics"),
+            ft.Tab(text="History"),
+            ft.Tab(text="Replay"),
+            ft.Tab(text="Multiplayer")
+        ],
+        expand=True,
+    )
+
+    # Game Tab Content
+    # Score display
+    score_text = ft.Text(f"Player: {player_score} - Computer: {computer_score} - Ties: {ties}", 
+                         size=18, weight=ft.FontWeight.BOLD)
+
+    # Result display
+    result_text = ft.Text("", size=22, color=ft.Colors.PRIMARY)
+
+    # Icons shown for each move, updated in place on every game
+    player_choice_icon = ft.Icon(ft.Icons.QUESTION_MARK, size=40, color=ft.Colors.BLUE_700)
+    computer_choice_icon = ft.Icon(ft.Icons.QUESTION_MARK, size=40, color=ft.Colors.RED_700)
+
+    player_choice_display = ft.Container(
+        content=ft.Column([
+            ft.Text("You chose:", color=ft.Colors.BLUE_700),
+            ft.Container(width=80, height=80, border_radius=40, bgcolor=ft.Colors.BLUE_50, 
+                        content=player_choice_icon, alignment=ft.alignment.center)
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+        visible=False
+    )
+    
+    computer_choice_display = ft.Container(
+        content=ft.Column([
+            ft.Text("Computer chose:", color=ft.Colors.RED_700),
+            ft.Container(width=80, height=80, border_radius=40, bgcolor=ft.Colors.RED_50, 
+                        content=computer_choice_icon, alignment=ft.alignment.center)
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+        visible=False
+    )
+
+    # Stats containers
+    stats_container = ft.Container(
+        content=None,
+        padding=20,
+        expand=True
+    )
+    
+    history_container = ft.Container(
+        content=None,
+        padding=20,
+        expand=True
+    )
+
+    # Chart colors: green, red, blue for wins, losses, ties
+    result_colors = ['#4CAF50', '#F44336', '#2196F3']
+    choice_colors = ['#2196F3', '#4CAF50', '#F44336']
+
+    # Charts are created once and then updated in place
+    results_chart = None
+    choices_chart = None
+
+    def results_data():
+        results_count = df.group_by("result").agg(pl.len().alias("count"))
+        counts = dict(zip(results_count['result'].to_list(), results_count['count'].to_list()))
+        return [(result, counts.get(result, 0)) for result in ["Win", "Loss", "Tie"]]
+
+    def choices_data():
+        player_choices = df.group_by("player_choice").agg(pl.len().alias("count"))
+        counts = dict(zip(player_choices['player_choice'].to_list(), player_choices['count'].to_list()))
+        return [(choice, counts.get(choice, 0)) for choice in choices]
+
+    async def raster_image(chart, data, render):
+        # Only render again when the data behind the image has changed
+        if chart is not None and chart.data == data:
+            return chart
+        src = await asyncio.to_thread(lambda: chart_assets.store(render()))
+        if chart is None:
+            chart = ft.Image(src=src, width=400, height=300, fit=ft.ImageFit.CONTAIN)
+        else:
+            chart.src = src
+        chart.data = data
+        return chart
+
+    # Fixed visualization functions with error handling
+    async def generate_pie_chart(data):
+        nonlocal results_chart
+        try:
+            if CHART_MODE == "raster":
+                results_chart = await raster_image(
+                    results_chart, data,
+                    lambda: raster_charts.render_pie_png(data, result_colors, 'Game Results Distribution'))
+            elif results_chart is None:
+                results_chart = charts.pie_chart(data, colors=result_colors)
+            else:
+                charts.update_pie_chart(results_chart, data)
+            return results_chart
+        except Exception as e:
+            print(f"Error generating pie chart: {e}")
+            return ft.Text("Could not generate chart. Error occurred.")
+
+    async def generate_bar_chart(data):
+        nonlocal choices_chart
+        try:
+            if CHART_MODE == "raster":
+                choices_chart = await raster_image(
+                    choices_chart, data,
+                    lambda: raster_charts.render_bar_png(data, choice_colors, 'Your Choice Distribution',
+                                                         'Choice', 'Frequency'))
+            elif choices_chart is None:
+                choices_chart = charts.bar_chart(data, colors=choice_colors, bar_width=min(40, 240 // len(choices)))
+            else:
+                charts.update_bar_chart(choices_chart, data)
+            return choices_chart
+        except Exception as e:
+            print(f"Error generating bar chart: {e}")
+            return ft.Text("Could not generate chart. Error occurred.")
+
+    def calculate_win_ratio():
+        # The views read the games in memory, which include those not saved yet
+        if df.shape[0] == 0:
+            return None, None, None
+        
+        total_games = df.shape[0]
+        wins = df.filter(pl.col("result") == "Win").shape[0]
+        losses = df.filter(pl.col("result") == "Loss").shape[0]
+        ties = df.filter(pl.col("result") == "Tie").shape[0]
+        
+        win_ratio = wins / total_games if total_games > 0 else 0
+        loss_ratio = losses / total_games if total_games > 0 else 0
+        tie_ratio = ties / total_games if total_games > 0 else 0
+        
+        return win_ratio, loss_ratio, tie_ratio
+
+    @metrics.timed("view.stats.read")
+    def stats_summary():
+        # Runs in a worker thread, the event loop only applies the results
+        win_ratio, loss_ratio, tie_ratio = calculate_win_ratio()
+        if win_ratio is None:
+            return None
+        return {
+            "win_ratio": win_ratio,
+            "loss_ratio": loss_ratio,
+            "tie_ratio": tie_ratio,
+            "total_games": df.shape[0],
+            "results": results_data(),
+            "choices": choices_data(),
+        }
+
+    # The stats layout is built once, refreshes only change control values
+    # so Flet sends small property diffs instead of a new control tree
+    stats_vm = ViewModel()
+
+    def ratio_card(label, name, color, bgcolor):
+        return ft.Container(
+            content=ft.Column([
+                ft.Text(label, size=18, weight=ft.FontWeight.BOLD),
+                stats_vm.bind(name, ft.ProgressBar(value=0, width=200, color=color)),
+                stats_vm.bind(name, ft.Text("", size=16), format="{:.1%}")
+            ]),
+            padding=10,
+            border_radius=10,
+            bgcolor=bgcolor
+        )
+
+    pie_chart_row = ft.Row([], alignment=ft.MainAxisAlignment.CENTER)
+    bar_chart_row = ft.Row([], alignment=ft.MainAxisAlignment.CENTER)
+    stats_layout = ft.Column([
+        ft.Text("Game Statistics", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+        ft.Divider(),
+
+        ft.Row([
+            ratio_card("Win Ratio", "win_ratio", ft.Colors.GREEN_500, ft.Colors.GREEN_50),
+            ratio_card("Loss Ratio", "loss_ratio", ft.Colors.RED_500, ft.Colors.RED_50),
+            ratio_card("Tie Ratio", "tie_ratio", ft.Colors.BLUE_500, ft.Colors.BLUE_50),
+        ], alignment=ft.MainAxisAlignment.SPACE_EVENLY),
+
+        ft.Divider(),
+
+        ft.Text("Results Distribution", size=20, weight=ft.FontWeight.BOLD),
+        pie_chart_row,
+
+        ft.Divider(),
+
+        ft.Text("Your Choice Patterns", size=20, weight=ft.FontWeight.BOLD),
+        bar_chart_row,
+
+        # Additional stats
+        ft.Divider(),
+
+        ft.Text("Total Games Played", size=20, weight=ft.FontWeight.BOLD),
+        stats_vm.bind("total_games", ft.Text("0", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+                      format="{}"),
+    ], spacing=20, scroll=ft.ScrollMode.AUTO)
+
+    # Number of games each view was last built from, so a tab that is
+    # already up to date is only shown
+    stats_rows = None
+    history_rows = None
+
+    @metrics.timed("view.stats")
+    async def update_stats_view():
+        nonlocal stats_rows
+        await load_game_data_async()
+        rows = df.shape[0]
+        summary = await asyncio.to_thread(stats_summary)
+        
+        if summary is None:
+            stats_container.content = ft.Column([
+                ft.Text("No game data available yet. Play some games first!", size=18)
+            ])
+            stats_rows = rows
+            return
+        
+        with metrics.span("view.stats.charts"):
+            pie_chart_row.controls = [await generate_pie_chart(summary["results"])]
+            bar_chart_row.controls = [await generate_bar_chart(summary["choices"])]
+        
+        # Update stats view
+        with metrics.span("view.stats.controls"):
+            stats_vm.update(
+                win_ratio=summary["win_ratio"],
+                loss_ratio=summary["loss_ratio"],
+                tie_ratio=summary["tie_ratio"],
+                total_games=summary["total_games"],
+            )
+        stats_container.content = stats_layout
+        stats_rows = rows
+        
+        updates.request()
+
+    @metrics.timed("view.history")
+    async def update_history_view():
+        nonlocal history_rows
+        await load_game_data_async()
+        rows = df.shape[0]
+        if rows == 0:
+            history_container.content = ft.Column([
+                ft.Text("No game history available yet. Play some games first!", size=18)
+            ])
+            history_rows = rows
+            updates.request()
+            return
+        
+        # Create DataTable for history
+        history_data = []
+        
+        # Create table rows for the last 30 games or all if less than 30
+        for row in recent_games.newest():
+            history_data.append(
+                ft.DataRow(
+                    cells=[
+                        ft.DataCell(ft.Text(row["timestamp"])),
+                        ft.DataCell(ft.Text(row["player_choice"].capitalize())),
+                        ft.DataCell(ft.Text(row["computer_choice"].capitalize())),
+                        ft.DataCell(
+                            ft.Text(
+                                row["result"], 
+                                color=ft.Colors.GREEN_700 if row["result"] == "Win" else 
+                                      ft.Colors.RED_700 if row["result"] == "Loss" else 
+                                      ft.Colors.BLUE_700
+                            )
+                        ),
+                    ]
+                )
+            )
+        
+        history_table = ft.DataTable(
+            columns=[
+                ft.DataColumn(ft.Text("Time")),
+                ft.DataColumn(ft.Text("Your Choice")),
+                ft.DataColumn(ft.Text("Computer's Choice")),
+                ft.DataColumn(ft.Text("Result")),
+            ],
+            rows=history_data,
+            border=ft.border.all(1, ft.Colors.GREY_400),
+            border_radius=10,
+            vertical_lines=ft.border.BorderSide(1, ft.Colors.GREY_300),
+            horizontal_lines=ft.border.BorderSide(1, ft.Colors.GREY_300),
+            sort_column_index=0,
+            sort_ascending=False,
+        )
+        
+        # Create export button
+        async def export_to_excel(e):
+            export_path = os.path.join(data_dir, "game_history.xlsx")
+            await asyncio.to_thread(df.write_excel, export_path)
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text(f"Exported to {export_path}"),
+                action="OK"
+            )
+            page.snack_bar.open = True
+            updates.request()
+        
+        export_button = ft.ElevatedButton(
+            "Export to Excel",
+            icon=ft.Icons.DOWNLOAD,
+            on_click=export_to_excel,
+            style=ft.ButtonStyle(
+                color=ft.Colors.WHITE,
+                bgcolor=ft.Colors.BLUE_700,
+            )
+        )
+        
+        # Fix the Row with padding error by using Container instead
+        history_container.content = ft.Column([
+            ft.Text("Game History", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+            ft.Text("Recent Games (Last 30)", size=16, italic=True),
+            history_table,
+            ft.Container(
+                content=ft.Row(
+                    [export_button], 
+                    alignment=ft.MainAxisAlignment.END
+                ),
+                padding=20
+            )
+        ], spacing=20, scroll=ft.ScrollMode.AUTO)
+        history_rows = rows
+        
+        updates.request()
+
+    # The stats and history tabs are rebuilt in the background once the
+    # player pauses, so switching to them only has to show them
+    PREFETCH_DELAY = 0.3
+    prefetch_handle = None
+    prefetch_task = None
+    # Switches to the stats and history tabs, and how many found them prefetched
+    view_switches = 0
+    views_prefetched_hits = 0
+
+    def views_current():
+        if df is None:
+            return False, False
+        return stats_rows == df.shape[0], history_rows == df.shape[0]
+
+    async def prefetch_views():
+        stats_current, history_current = views_current()
+        if not stats_current:
+            await update_stats_view()
+        if not history_current:
+            await update_history_view()
+
+    def start_prefetch():
+        nonlocal prefetch_handle, prefetch_task
+        prefetch_handle = None
+        if prefetch_task is not None and not prefetch_task.done():
+            # Try again once the running prefetch has finished
+            schedule_prefetch()
+            return
+        prefetch_task = asyncio.create_task(prefetch_views())
+
+    def schedule_prefetch():
+        nonlocal prefetch_handle
+        # Debounced, every move pushes the prefetch back
+        if prefetch_handle is not None:
+            prefetch_handle.cancel()
+        prefetch_handle = asyncio.get_running_loop().call_later(PREFETCH_DELAY, start_prefetch)
+
+    async def views_prefetched():
+        if prefetch_task is not None:
+            await prefetch_task
+
+    # The CSV is written by a single background task, games played while it
+    # is writing are picked up by its next pass
+    save_task = None
+
+    async def save_games():
+        try:
+            while saved_rows != df.shape[0]:
+                await asyncio.to_thread(save_game_data)
+        except Exception as e:
+            print(f"Error saving game data: {e}")
+            # Show error message to user
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text("Failed to save game data"),
+                action="OK"
+            )
+            page.snack_bar.open = True
+            updates.request()
+
+    def save_in_background():
+        nonlocal save_task
+        if save_task is None or save_task.done():
+            save_task = asyncio.create_task(save_games())
+
+    # Function to handle game logic
+    @metrics.timed("move")
+    async def play_game(player_choice):
+        try:
+            nonlocal player_score, computer_score, ties, session_moves, opponent_logged
+            global df
+            await load_game_data_async()
+            
+            # The first move against each opponent is logged, so the
+            # session can be replayed from its seed
+            if not opponent_logged:
+                with metrics.span("move.log"):
+                    session_log.record(session_id, session_rng.seed, opponent_name, session_moves, rules.name)
+                opponent_logged = True
+            
+            # Computer picks its move with the selected opponent
+            with metrics.span("move.rng"):
+                computer_choice = rules.moves[opponent.choose()]
+            session_moves += 1
+            
+            # Determine the winner
+            with metrics.span("move.resolve"):
+                outcome = rules.resolve(rules.move_index[player_choice], rules.move_index[computer_choice])
+                opponent.observe(rules.move_index[player_choice], rules.move_index[computer_choice])
+            
+            with metrics.span("move.controls"):
+                # Update icons
+                player_choice_display.visible = True
+                player_choice_icon.name = move_icon(player_choice)
+                
+                computer_choice_display.visible = True
+                computer_choice_icon.name = move_icon(computer_choice)
+                
+                result = ""
+                if outcome == engine.TIE:
+                    result_text.value = "It's a tie!"
+                    result_text.color = ft.Colors.BLUE_500
+                    ties += 1
+                    result = "Tie"
+                elif outcome == engine.WIN:
+                    result_text.value = "You win!"
+                    result_text.color = ft.Colors.GREEN_500
+                    player_score += 1
+                    result = "Win"
+                else:
+                    result_text.value = "Computer wins!"
+                    result_text.color = ft.Colors.RED_500
+                    computer_score += 1
+                    result = "Loss"
+                
+                # Update score
+                score_text.value = f"Player: {player_score} - Computer: {computer_score} - Ties: {ties}"
+            
+            # Record the game data
+            with metrics.span("move.append"):
+                timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                new_row = pl.DataFrame({
+                    "timestamp": [timestamp],
+                    "player_choice": [player_choice],
+                    "computer_choice": [computer_choice],
+                    "result": [result],
+                    "session_id": [session_id]
+                }, schema={
+                    "timestamp": pl.Utf8,
+                    "player_choice": pl.Utf8,
+                    "computer_choice": pl.Utf8,
+                    "result": pl.Utf8,
+                    "session_id": pl.Utf8
+                })
+                
+                # Append to the dataframe
+                df = pl.concat([df, new_row])
+                recent_games.append(new_row.row(0, named=True))
+                session_index.extend(df.shape[0] - 1, [session_id])
+            
+            # Save to CSV without holding up the next event
+            save_in_background()
+            schedule_prefetch()
+            
+            # Update the stats views (but don't refresh them yet)
+            if tab_bar.selected_index != 0:
+                if tab_bar.selected_index == 1:
+                    await update_stats_view()
+                elif tab_bar.selected_index == 2:
+                    await update_history_view()
+        
+            updates.request()
+        except Exception as e:
+            print(f"Error in play_game: {e}")
+            # Show error message to user
+            page.snack_bar = ft.SnackBar(
+                content=ft.Text(f"Game error: {str(e)}"),
+                action="OK"
+            )
+            page.snack_bar.open = True
+            updates.request()
+
+    # Opponent picker, changing it starts a fresh opponent
+    async def change_opponent(e):
+        nonlocal opponent, opponent_name, opponent_logged
+        opponent_name = e.control.value
+        opponent = make_opponent(opponent_name, session_rng, rules)
+        opponent_logged = False
+
+    opponent_dropdown = ft.Dropdown(
+        label="Opponent",
+        value=DEFAULT_OPPONENT,
+        options=[ft.dropdown.Option(key, strategy.name) for key, strategy in OPPONENTS.items()],
+        on_change=change_opponent,
+        width=250,
+    )
+
+    # Button click handlers
+    def image_click(choice):
+        async def handle_click(e):
+            await play_game(choice)
+        return handle_click
+
+    async def reset_click(e):
+        nonlocal player_score, computer_score, ties
+        player_score = 0
+        computer_score = 0
+        ties = 0
+        result_text.value = ""
+        score_text.value = f"Player: {player_score} - Computer: {computer_score} - Ties: {ties}"
+        player_choice_display.visible = False
+        computer_choice_display.visible = False
+        updates.request()
+
+    # Choice buttons with icons, one per move of the rule set
+    def choice_button(index, move):
+        return ft.Container(
+            content=ft.Column([
+                ft.Icon(move_icon(move), size=60),
+                ft.Text(move.capitalize())
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+            on_click=image_click(move),
+            ink=True,
+            padding=20,
+            margin=10,
+            border_radius=10,
+            bgcolor=button_color(index),
+            shadow=ft.BoxShadow(
+                spread_radius=1,
+                blur_radius=8,
+                color=ft.Colors.BLUE_GREY_100,
+                offset=ft.Offset(2, 2),
+            )
+        )
+    
+    choice_row = ft.Row(
+        [choice_button(index, move) for index, move in enumerate(rules.moves)],
+        alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+        wrap=True
+    )
+    
+    # Results display
+    result_display = ft.Column(
+        [
+            ft.Row([player_choice_display, computer_choice_display], 
+                  alignment=ft.MainAxisAlignment.SPACE_EVENLY),
+            result_text
+        ],
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        spacing=20
+    )
+    
+    # Reset button
+    reset_btn = ft.ElevatedButton(
+        "Reset Game", 
+        on_click=reset_click, 
+        icon=ft.Icons.REFRESH,
+        style=ft.ButtonStyle(
+            color=ft.Colors.WHITE,
+            bgcolor=ft.Colors.BLUE_700,
+            padding=15
+        )
+    )
+
+    # Game tab content
+    game_content = ft.Container(
+        content=ft.Column(
+            [
+                ft.Text("Let's play!", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+                ft.Divider(),
+                score_text,
+                ft.Divider(),
+                opponent_dropdown,
+                ft.Text("Choose your move:", size=16),
+                choice_row,
+                ft.Divider(),
+                result_display,
+                ft.Divider(),
+                reset_btn
+            ],
+            alignment=ft.MainAxisAlignment.CENTER,
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=20
+        ),
+        padding=30,
+        border_radius=10,
+        expand=True,
+    )
+
+    # Replay tab, a session's games are found through the index and read
+    # by row ranges
+    result_outcomes = {"Win": engine.WIN, "Loss": engine.LOSS, "Tie": engine.TIE}
+
+    async def load_sessions():
+        await load_game_data_async()
+        return await asyncio.to_thread(session_index.sessions)
+
+    async def load_session_games(session_id):
+        data = await load_game_data_async()
+        games = []
+        for start, stop in session_index.runs(session_id):
+            rows = data.slice(start, stop - start)
+            games.extend(zip(
+                rows["timestamp"].to_list(),
+                rows["player_choice"].to_list(),
+                rows["computer_choice"].to_list(),
+                [result_outcomes.get(result, engine.TIE) for result in rows["result"].to_list()],
+            ))
+        return games
+
+    replay_view = ReplayView(load_sessions, load_session_games, updates.request)
+    replay_container = ft.Container(
+        content=replay_view.control,
+        padding=20,
+        expand=True
+    )
+
+    # Multiplayer tab, moves between sessions go through the lobby
+    multiplayer_view = MultiplayerView(lobby, page.pubsub, session_id, f"Player {session_id[-4:]}",
+                                       updates.request)
+    multiplayer_container = ft.Container(
+        content=multiplayer_view.control,
+        padding=20,
+        expand=True
+    )
+    # A closed browser tab forfeits the match rather than leave the opponent waiting
+    page.on_disconnect = lambda e: multiplayer_view.client.leave()
+    page.on_close = lambda e: multiplayer_view.close()
+
+    # Tab change handler
+    async def on_tab_change(e):
+        nonlocal view_switches, views_prefetched_hits
+        try:
+            selected_index = e.control.selected_index
+            
+            # Update visibility
+            game_content.visible = selected_index == 0
+            stats_container.visible = selected_index == 1
+            history_container.visible = selected_index == 2
+            replay_container.visible = selected_index == 3
+            multiplayer_container.visible = selected_index == 4
+            
+            # Load content for the selected tab, unless it was prefetched
+            if selected_index in (1, 2):
+                await views_prefetched()
+                stats_current, history_current = views_current()
+                view_switches += 1
+                views_prefetched_hits += stats_current if selected_index == 1 else history_current
+                if selected_index == 1 and not stats_current:  # Stats tab
+                    await update_stats_view()
+                elif selected_index == 2 and not history_current:  # History tab
+                    await update_history_view()
+            elif selected_index == 3:  # Replay tab
+                await replay_view.refresh()
+            elif selected_index == 4:  # Multiplayer tab
+                multiplayer_view.refresh()
+                
+            updates.request()
+        except Exception as e:
+            print(f"Error changing tabs: {e}")
+
+    tab_bar.on_change = on_tab_change
+
+    # Set up tab content
+    tab_content = ft.Container(
+        content=ft.Stack([
+            game_content,       # Tab 0
+            stats_container,    # Tab 1
+            history_container,  # Tab 2
+            replay_container,   # Tab 3
+            multiplayer_container,  # Tab 4
+        ]),
+        expand=True,
+        padding=10,
+    )
+
+    # Update visibility based on selected tab
+    def update_tab_visibility():
+        selected_index = tab_bar.selected_index
+        game_content.visible = selected_index == 0
+        stats_container.visible = selected_index == 1
+        history_container.visible = selected_index == 2
+        replay_container.visible = selected_index == 3
+        multiplayer_container.visible = selected_index == 4
+        updates.request()
+
+    async def handle_tab_change(e):
+        await on_tab_change(e)
+        update_tab_visibility()
+
+    tab_bar.on_change = handle_tab_change
+
+    # Initialize tab visibility explicitly
+    game_content.visible = True
+    stats_container.visible = False
+    history_container.visible = False
+    replay_container.visible = False
+    multiplayer_container.visible = False
+
+    # Performance panel, refreshed while it is open
+    def perf_stats():
+        data = df
+        caches = [
+            ("Tabs prefetched", views_prefetched_hits, view_switches),
+            ("Page updates coalesced", updates.coalesced, updates.requested),
+        ]
+        if chart_assets is not None:
+            caches.append(("Chart images reused", chart_assets.hits, chart_assets.stores))
+        return {
+            "rows": 0 if data is None else data.shape[0],
+            "frame_bytes": None if data is None else data.estimated_size(),
+            "pending_writes": 0 if data is None else data.shape[0] - saved_rows,
+            "last_save": last_save_seconds,
+            "caches": caches,
+        }
+
+    perf_panel = PerfPanel(perf_stats, updates.request)
+
+    async def show_perf_panel(e):
+        perf_panel.open(page)
+
+    perf_btn = ft.ElevatedButton(
+        "Performance",
+        on_click=show_perf_panel,
+        icon=ft.Icons.SPEED,
+        style=ft.ButtonStyle(
+            color=ft.Colors.WHITE,
+            bgcolor=ft.Colors.GREY_700,
+        )
+    )
+
+    # Add all components to the page
+    page.add(
+        header,
+        ft.Card(
+            content=ft.Column([
+                tab_bar,
+                tab_content,
+                ft.Row([perf_btn], alignment=ft.MainAxisAlignment.END)
+            ]),
+            elevation=5,
+            expand=True,
+        )
+    )
+
+    # Load analytics in the background now that the first frame is up
+    # and build the other tabs ahead of time
+    prefetch = lambda: page.loop.call_soon_threadsafe(start_prefetch)
+    if CHART_MODE == "raster":
+        warm_up(load_game_data, session_rng.fill, raster_charts.preload, prefetch)
+    else:
+        warm_up(load_game_data, session_rng.fill, prefetch)
+
+# Headless play API, games go to the same CSV and session log as the app
+RESULT_LABELS = {engine.WIN: "Win", engine.LOSS: "Loss", engine.TIE: "Tie"}
+
+async def save_api_games(games):
+    global df
+    await load_game_data_async()
+    rows = [(timestamp, player, computer, RESULT_LABELS[outcome], game_session)
+            for timestamp, game_session, player, computer, outcome in games]
+    # The games join df once they are written, so a batch the server
+    # retries after a failed save is not added twice
+    data = pl.concat([df, pl.DataFrame(rows, schema=df.schema, orient="row")])
+    await asyncio.to_thread(save_game_data, data)
+    df = data
+
+def serve_api(host, port):
+    from rps.play_server import PlayServer
+
+    counts = dict(load_game_data()["result"].value_counts().iter_rows())
+    totals = {"games": df.shape[0], "wins": counts.get("Win", 0),
+              "losses": counts.get("Loss", 0), "ties": counts.get("Tie", 0)}
+    server = PlayServer(save_api_games, totals, session_log, engine.RULES, host, port)
+    asyncio.run(server.serve())
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv:
+        import argparse
+        from rps.play_server import DEFAULT_PORT
+
+        parser = argparse.ArgumentParser(description="Serve the headless play API instead of the app")
+        parser.add_argument("--serve", action="store_true")
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+        args = parser.parse_args()
+        serve_api(args.host, args.port)
+    else:
+        ft.app(target=main, assets_dir=assets_dir)
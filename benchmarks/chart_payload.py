@@ -0,0 +1,127 @@
+"""Compare the bytes sent per statistics refresh for raster and native charts.
+
+Run from the repository root:
+
+    python benchmarks/chart_payload.py
+
+All variants show the same results pie chart and choice bar chart on a
+headless page. Each refresh records one more game and updates the charts,
+then the size of the message Flet would send to the client is recorded. Images
+served by URL are fetched separately by the client, which can cache them.
+"""
+import base64
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+
+from rps import charts
+from rps.assets import ChartAssetCache
+from rps.headless import make_page
+from rps.raster_charts import render_bar_png, render_pie_png
+
+RESULT_COLORS = ['#4CAF50', '#F44336', '#2196F3']
+CHOICE_COLORS = ['#2196F3', '#4CAF50', '#F44336']
+REFRESHES = 20
+
+
+def play(results, choices):
+    results[random.choice(list(results))] += 1
+    choices[random.choice(list(choices))] += 1
+
+
+def raster_images(results, choices):
+    pie = render_pie_png(list(results.items()), RESULT_COLORS, 'Game Results Distribution')
+    bar = render_bar_png(list(choices.items()), CHOICE_COLORS, 'Your Choice Distribution',
+                         'Choice', 'Frequency')
+    return [base64.b64encode(png).decode('utf-8') for png in (pie, bar)]
+
+
+def measure_raster(results, choices):
+    page, conn = make_page()
+    pie_src, bar_src = raster_images(results, choices)
+    pie = ft.Image(src_base64=pie_src, width=400, height=300, fit=ft.ImageFit.CONTAIN)
+    bar = ft.Image(src_base64=bar_src, width=400, height=300, fit=ft.ImageFit.CONTAIN)
+    page.add(ft.Column([pie, bar]))
+    initial = conn.bytes_sent
+
+    sizes = []
+    for _ in range(REFRESHES):
+        play(results, choices)
+        pie.src_base64, bar.src_base64 = raster_images(results, choices)
+        conn.reset_counters()
+        page.update()
+        sizes.append(conn.bytes_sent)
+    return initial, sizes
+
+
+def measure_raster_assets(results, choices):
+    page, conn = make_page()
+    cache = ChartAssetCache(tempfile.mkdtemp())
+
+    def sources():
+        pie = render_pie_png(list(results.items()), RESULT_COLORS, 'Game Results Distribution')
+        bar = render_bar_png(list(choices.items()), CHOICE_COLORS, 'Your Choice Distribution',
+                             'Choice', 'Frequency')
+        return cache.store(pie), cache.store(bar)
+
+    pie_src, bar_src = sources()
+    pie = ft.Image(src=pie_src, width=400, height=300, fit=ft.ImageFit.CONTAIN)
+    bar = ft.Image(src=bar_src, width=400, height=300, fit=ft.ImageFit.CONTAIN)
+    page.add(ft.Column([pie, bar]))
+    initial = conn.bytes_sent
+
+    sizes = []
+    for _ in range(REFRESHES):
+        play(results, choices)
+        pie.src, bar.src = sources()
+        conn.reset_counters()
+        page.update()
+        sizes.append(conn.bytes_sent)
+    return initial, sizes
+
+
+def measure_native(results, choices):
+    page, conn = make_page()
+    pie = charts.pie_chart(list(results.items()), colors=RESULT_COLORS)
+    bar = charts.bar_chart(list(choices.items()), colors=CHOICE_COLORS)
+    page.add(ft.Column([pie, bar]))
+    initial = conn.bytes_sent
+
+    sizes = []
+    for _ in range(REFRESHES):
+        play(results, choices)
+        charts.update_pie_chart(pie, list(results.items()))
+        charts.update_bar_chart(bar, list(choices.items()))
+        conn.reset_counters()
+        page.update()
+        sizes.append(conn.bytes_sent)
+    return initial, sizes
+
+
+def main():
+    random.seed(0)
+    results = {"Win": 12, "Loss": 9, "Tie": 7}
+    choices = {"rock": 10, "paper": 11, "scissors": 7}
+
+    rows = [
+        ("raster (base64 PNG)",) + measure_raster(dict(results), dict(choices)),
+        ("raster (asset URL)",) + measure_raster_assets(dict(results), dict(choices)),
+        ("native (Flet charts)",) + measure_native(dict(results), dict(choices)),
+    ]
+
+    print(f"{'variant':<22}{'initial bytes':>15}{'avg update bytes':>18}{'max update bytes':>18}")
+    for name, initial, sizes in rows:
+        print(f"{name:<22}{initial:>15,}{sum(sizes) / len(sizes):>18,.0f}{max(sizes):>18,}")
+
+    base64_avg = sum(rows[0][2]) / REFRESHES
+    print()
+    for name, _, sizes in rows[1:]:
+        print(f"{name} updates are {base64_avg / (sum(sizes) / REFRESHES):,.0f}x smaller than base64")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Event handler latency percentiles under a scripted click storm.
+
+Run from the repository root:
+
+    python benchmarks/click_latency.py [--root PATH] [--games N] [--rounds N] [--rate N]
+
+Each round clicks the three moves ``--moves`` times, opens the statistics
+view and goes back to the game. Events are dispatched through
+``page.on_event_async`` like the Flet server does it, ``--rate`` events per
+second, without waiting for earlier events to finish. The data files are
+seeded with ``--games`` games first, so saving and reading them takes a
+realistic amount of time.
+
+Latency is measured from dispatch until the handler returns. Once the storm
+is over the games found in the data files are compared with the number of
+moves played. ``--root`` points at another checkout to compare before and
+after a change.
+"""
+import argparse
+import asyncio
+import math
+import os
+import threading
+import time
+
+import flet as ft
+from flet.core.event import Event
+
+from harness import ROOT, find, find_button, load_app, sandbox, seed_games, select, settle, start_app
+
+MOVES = ["Rock", "Paper", "Scissors"]
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class Storm:
+    """Dispatches events to a page and records how long each handler takes."""
+
+    def __init__(self, page):
+        self.page = page
+        self.started = {}
+        self.latencies = {}
+        self.done = threading.Condition()
+
+    def timed(self, control, name, kind):
+        handler = control.event_handlers[name]
+
+        def finished(e):
+            ended = time.perf_counter()
+            with self.done:
+                self.latencies[int(e.data)] = (kind, ended - self.started[int(e.data)])
+                self.done.notify_all()
+
+        if asyncio.iscoroutinefunction(handler):
+            async def wrapper(e):
+                try:
+                    await handler(e)
+                finally:
+                    finished(e)
+        else:
+            def wrapper(e):
+                try:
+                    handler(e)
+                finally:
+                    finished(e)
+        control.event_handlers[name] = wrapper
+
+    def dispatch(self, control, name):
+        seq = len(self.started)
+        self.started[seq] = time.perf_counter()
+        event = Event(control.uid, name, str(seq))
+        asyncio.run_coroutine_threadsafe(self.page.on_event_async(event), self.page.loop)
+
+    def wait(self, timeout=120):
+        with self.done:
+            self.done.wait_for(lambda: len(self.latencies) == len(self.started), timeout)
+        settle(self.page)
+
+
+def run_storm(page, nav, stats_index, game_index, rounds, moves, rate):
+    buttons = [find_button(page, move) for move in MOVES]
+    storm = Storm(page)
+    for button in buttons:
+        storm.timed(button, "click", "move")
+    storm.timed(nav, "change", "view")
+
+    gap = 1 / rate
+    for _ in range(rounds):
+        for i in range(moves * 3):
+            storm.dispatch(buttons[i % 3], "click")
+            time.sleep(gap)
+        for index in (stats_index, game_index):
+            nav.selected_index = index
+            storm.dispatch(nav, "change")
+            time.sleep(gap)
+    storm.wait()
+    return storm.latencies
+
+
+def count_intermediate_games(sandbox_dir):
+    with open(os.path.join(sandbox_dir, "Intermediate", "data", "game_data.csv")) as f:
+        return sum(1 for _ in f) - 1
+
+
+def count_advanced_games(sandbox_dir):
+    from rps.excel_store import PartitionedGameStore
+
+    partitions = PartitionedGameStore(os.path.join(sandbox_dir, "Advanced", "users"))
+    return sum(partitions.partition(user_id).count_games() for user_id in partitions.user_ids())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=ROOT, help="checkout to measure (default: this one)")
+    parser.add_argument("--games", type=int, default=2000, help="games in the data files beforehand")
+    parser.add_argument("--rounds", type=int, default=10, help="storm rounds")
+    parser.add_argument("--moves", type=int, default=5, help="clicks on each move per round")
+    parser.add_argument("--rate", type=float, default=100, help="events dispatched per second")
+    args = parser.parse_args()
+
+    sandbox_dir = sandbox(os.path.abspath(args.root))
+    seed_games(sandbox_dir, args.games)
+    apps = [
+        ("Intermediate", "Intermediate/app.py", ft.Tabs, 1, 0, count_intermediate_games),
+        ("Advanced", "Advanced/app.py", ft.NavigationRail, 2, 1, count_advanced_games),
+    ]
+
+    print(f"{'app':<14}{'event':<7}{'count':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}   saved")
+    for name, path, nav_type, stats_index, game_index, count_games in apps:
+        page, conn = start_app(load_app(sandbox_dir, path))
+        nav = find(page, nav_type)
+        select(nav, game_index)
+        latencies = run_storm(page, nav, stats_index, game_index, args.rounds, args.moves, args.rate)
+
+        played = args.rounds * args.moves * 3
+        saved = count_games(sandbox_dir) - args.games
+        for kind in ("move", "view"):
+            samples = [latency * 1000 for k, latency in latencies.values() if k == kind]
+            print(f"{name:<14}{kind:<7}{len(samples):>7}{percentile(samples, 50):>9.1f}"
+                  f"{percentile(samples, 95):>9.1f}{percentile(samples, 99):>9.1f}"
+                  f"{max(samples):>9.1f}   " + (f"{saved}/{played}" if kind == "move" else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Rounds per second for the table-driven game engine, for every rule set.
+
+Run from the repository root:
+
+    python benchmarks/engine_throughput.py [--rounds N]
+
+Checks the outcome tables against the rules first: the classic and
+lizard-Spock tables against their published rules, and every rule set for
+each move beating exactly half of the others. Then times ``resolve()``
+round by round and ``resolve_batch()`` on ``--rounds`` random moves for each
+rule set, which should cost the same whatever the number of moves.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps import engine
+
+BEATS = {
+    "classic": {"rock": {"scissors"}, "paper": {"rock"}, "scissors": {"paper"}},
+    "rpsls": {
+        "rock": {"scissors", "lizard"},
+        "paper": {"rock", "spock"},
+        "scissors": {"paper", "lizard"},
+        "lizard": {"paper", "spock"},
+        "spock": {"rock", "scissors"},
+    },
+}
+
+
+def check_rules(rules):
+    beats = BEATS.get(rules.name)
+    for a, first in enumerate(rules.moves):
+        outcomes = [rules.resolve(a, b) for b in range(rules.size)]
+        assert outcomes.count(engine.WIN) == outcomes.count(engine.LOSS) == rules.size // 2, first
+        for b, second in enumerate(rules.moves):
+            assert rules.resolve(b, a) == (0, 2, 1)[outcomes[b]], (first, second)
+            assert rules.resolve_batch([a], [b])[0] == outcomes[b], (first, second)
+            if beats is not None:
+                expected = engine.TIE if a == b else engine.WIN if second in beats[first] else engine.LOSS
+                assert outcomes[b] == expected, (first, second)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10_000_000, help="rounds per batch")
+    args = parser.parse_args()
+
+    import numpy as np
+
+    print(f"{'rules':<10}{'moves':>6}{'resolve/s':>16}{'resolve_batch/s':>18}  outcome shares")
+    for rules in engine.RULE_SETS.values():
+        check_rules(rules)
+        rng = np.random.default_rng(0)
+        a = rng.integers(0, rules.size, args.rounds, dtype=np.uint8)
+        b = rng.integers(0, rules.size, args.rounds, dtype=np.uint8)
+
+        scalar_rounds = min(args.rounds, 1_000_000)
+        a_list, b_list = a[:scalar_rounds].tolist(), b[:scalar_rounds].tolist()
+        resolve = rules.resolve
+        started = time.perf_counter()
+        for x, y in zip(a_list, b_list):
+            resolve(x, y)
+        scalar = scalar_rounds / (time.perf_counter() - started)
+
+        started = time.perf_counter()
+        outcomes = rules.resolve_batch(a, b)
+        batch = args.rounds / (time.perf_counter() - started)
+
+        counts = np.bincount(outcomes, minlength=3) / args.rounds
+        shares = ", ".join(f"{name} {share:.3f}" for name, share in zip(engine.OUTCOMES, counts))
+        print(f"{rules.name:<10}{rules.size:>6}{scalar:>16,.0f}{batch:>18,.0f}  {shares}")
+
+
+if __name__ == "__main__":
+    main()
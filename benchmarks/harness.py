@@ -0,0 +1,234 @@
+"""Helpers for driving the apps on a headless page.
+
+``sandbox()`` copies the apps and the ``rps`` package into a temporary
+directory, so benchmarks never write to the data files in the repository.
+``load_app()`` imports an app from there without running ``ft.app``, and
+``start_app()`` runs its ``main`` on a headless page with the background
+warm-up done inline and logs in if the app asks for a player, so the page
+is fully built when it returns.
+
+The page's event loop runs on a daemon thread like it does under Flet, so
+``async`` handlers and the tasks they start run for real. ``click()`` and
+``select()`` return once the handler has finished, and ``settle()`` waits
+for background tasks such as saves and sends any pending page update.
+"""
+import asyncio
+import importlib.util
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIRS = ["Simple", "Intermediate", "Advanced", "rps"]
+
+_app_ids = itertools.count()
+
+
+def sandbox(root=ROOT):
+    """Copy the apps from ``root`` into a new temporary directory."""
+    target = tempfile.mkdtemp(prefix="rps-bench-")
+    for name in APP_DIRS:
+        source = os.path.join(root, name)
+        if os.path.isdir(source):
+            shutil.copytree(source, os.path.join(target, name),
+                            ignore=shutil.ignore_patterns("__pycache__", "assets", "users", "profiles.csv"))
+    return target
+
+
+SEED_PLAYER = "Prithika"
+
+
+def seed_games(sandbox_dir, games, seed=0):
+    """Write ``games`` random games to the Intermediate and Advanced data files.
+
+    In the Advanced app they are the games of ``SEED_PLAYER``, its only profile.
+    """
+    import random
+
+    import pandas as pd
+
+    if sandbox_dir not in sys.path:
+        sys.path.insert(0, sandbox_dir)
+    from rps.excel_store import PartitionedGameStore
+    from rps.profiles import Profiles
+
+    rng = random.Random(seed)
+    choices = ["rock", "paper", "scissors"]
+    rows = []
+    for i in range(games):
+        user, computer = rng.choice(choices), rng.choice(choices)
+        outcome = (choices.index(user) - choices.index(computer)) % 3
+        rows.append((f"2024-01-01 00:00:{i % 60:02d}", user, computer, outcome))
+
+    results = ["Tie", "Win", "Loss"]
+    data_dir = os.path.join(sandbox_dir, "Intermediate", "data")
+    os.makedirs(data_dir, exist_ok=True)
+    pd.DataFrame({
+        "timestamp": [r[0] for r in rows],
+        "player_choice": [r[1] for r in rows],
+        "computer_choice": [r[2] for r in rows],
+        "result": [results[r[3]] for r in rows],
+        "session_id": "seed",
+    }).to_csv(os.path.join(data_dir, "game_data.csv"), index=False)
+
+    messages = ["It's a tie!", "You win!", "Computer wins!"]
+    history = pd.DataFrame({
+        "timestamp": [r[0] for r in rows],
+        "user_choice": [r[1] for r in rows],
+        "computer_choice": [r[2] for r in rows],
+        "result": [messages[r[3]] for r in rows],
+    })
+    outcomes = [r[3] for r in rows]
+    stats = pd.DataFrame({
+        "metric": ["user_wins", "computer_wins", "ties", "total_games"],
+        "value": [outcomes.count(1), outcomes.count(2), outcomes.count(0), games],
+    })
+    profile = Profiles(os.path.join(sandbox_dir, "Advanced", "profiles.csv")).create(SEED_PLAYER)
+    path = PartitionedGameStore(os.path.join(sandbox_dir, "Advanced", "users")).path(profile["user_id"])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with pd.ExcelWriter(path) as writer:
+        history.to_excel(writer, sheet_name="history", index=False)
+        stats.to_excel(writer, sheet_name="stats", index=False)
+
+
+def load_app(sandbox_dir, app_path):
+    if sandbox_dir not in sys.path:
+        sys.path.insert(0, sandbox_dir)
+    spec = importlib.util.spec_from_file_location(
+        f"bench_app_{next(_app_ids)}", os.path.join(sandbox_dir, app_path)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_inline(*steps):
+    for step in steps:
+        if hasattr(step, "load"):
+            step.load()
+        else:
+            step()
+
+
+def start_app(module):
+    from rps.headless import make_page
+
+    if hasattr(module, "warm_up"):
+        module.warm_up = run_inline
+    page, conn = make_page()
+    threading.Thread(target=page.loop.run_forever, daemon=True).start()
+    module.main(page)
+    settle(page)
+    log_in(page)
+    return page, conn
+
+
+def walk(control):
+    yield control
+    for child in control._get_children():
+        yield from walk(child)
+
+
+def find(page, control_type, predicate=None):
+    for control in walk(page):
+        if isinstance(control, control_type) and (predicate is None or predicate(control)):
+            return control
+    raise LookupError(f"no {control_type.__name__} found")
+
+
+def texts(control):
+    import flet as ft
+
+    return [c.value for c in walk(control) if isinstance(c, ft.Text)]
+
+
+def find_button(page, label):
+    """Find the clickable container or button showing ``label``."""
+    import flet as ft
+
+    return find(
+        page,
+        (ft.Container, ft.ElevatedButton),
+        lambda c: c.on_click is not None and label in texts(c),
+    )
+
+
+def login_dialog(page):
+    """Return the open login dialog of the page, or None."""
+    import flet as ft
+
+    try:
+        return find(page, ft.AlertDialog, lambda c: c.open and c.modal)
+    except LookupError:
+        return None
+
+
+def log_in(page, name=None):
+    """Log in on the app's login dialog, if it shows one.
+
+    Logs in as ``name``, a new player unless there's one with that name,
+    or as the player picked in the dialog.
+    """
+    import flet as ft
+
+    dialog = login_dialog(page)
+    if dialog is None:
+        return
+    if name is not None:
+        find(dialog, ft.TextField).value = name
+    click(find(dialog, ft.ElevatedButton, lambda c: c.text == "Log in"))
+    settle(page)
+
+
+def fire(handler, control, data=None):
+    """Call an event handler, waiting for it on the page's loop if it's ``async``."""
+    result = handler(types.SimpleNamespace(control=control, data=data))
+    if asyncio.iscoroutine(result):
+        asyncio.run_coroutine_threadsafe(result, control.page.loop).result()
+
+
+def click(control):
+    fire(control.on_click, control)
+
+
+def select(control, index):
+    """Select a tab or navigation destination and fire ``on_change``."""
+    control.selected_index = index
+    fire(control.on_change, control, str(index))
+
+
+def settle(page):
+    """Wait for the page's background tasks, then send any pending update."""
+    try:
+        from rps.scheduler import scheduler_for
+    except ImportError:
+        scheduler_for = None
+
+    async def idle():
+        current = asyncio.current_task()
+        while True:
+            tasks = [task for task in asyncio.all_tasks() if task is not current]
+            if not tasks:
+                break
+            await asyncio.wait(tasks)
+        if scheduler_for is not None:
+            scheduler_for(page).flush()
+
+    asyncio.run_coroutine_threadsafe(idle(), page.loop).result()
+
+
+def flush_updates(conn):
+    for page in conn.sessions.values():
+        settle(page)
+
+
+def measure(conn, action):
+    """Run ``action`` and return (controls added, bytes sent) for it."""
+    conn.reset_counters()
+    action()
+    flush_updates(conn)
+    return conn.controls_added, conn.bytes_sent
@@ -0,0 +1,211 @@
+"""Time and peak memory of the save and view refresh paths as the history grows.
+
+Run from the repository root:
+
+    python benchmarks/hot_paths.py [--sizes 1000,10000,100000,1000000] [--repeat N]
+                                   [--root PATH] [--json PATH] [--compare PATH]
+
+For each size a new sandbox is seeded with that many games and the
+Intermediate and Advanced apps are started on headless pages. Every
+operation then runs ``--repeat`` times, through the same handlers a click
+or tab switch fires:
+
+- Advanced ``save_game_results``: a move and its background save
+- Advanced ``update_dashboard_view``, ``update_stats_view`` and
+  ``update_history_view``: switching to the tab
+- Intermediate ``play_game``: a move and its background save
+- Intermediate ``generate_*_chart``: switching to the stats tab, which
+  redraws both charts
+
+A move is played before each refresh so the views have new data to show.
+Reports the median and worst time and the peak resident memory above the
+level before the operation, sampled every millisecond. ``--json`` writes
+the results with the commit and machine they're from, and ``--compare``
+prints the change against such a file from an earlier run.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import threading
+import time
+
+import flet as ft
+
+from harness import ROOT, click, find, find_button, load_app, sandbox, seed_games, select, settle, start_app
+
+MOVES = ["Rock", "Paper", "Scissors"]
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return None
+
+
+class PeakRSS:
+    """Highest resident memory above the starting level while the block runs."""
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.peak = None
+
+    def __enter__(self):
+        self.start = rss_bytes()
+        self.highest = self.start
+        self.done = threading.Event()
+        if self.start is not None:
+            self.thread = threading.Thread(target=self.sample, daemon=True)
+            self.thread.start()
+        return self
+
+    def sample(self):
+        while not self.done.wait(self.interval):
+            self.highest = max(self.highest, rss_bytes())
+
+    def __exit__(self, *exc):
+        self.done.set()
+        if self.start is not None:
+            self.thread.join()
+            self.peak = max(self.highest, rss_bytes()) - self.start
+
+
+def advanced_operations(page):
+    rail = find(page, ft.NavigationRail)
+    move = iter(range(10**9))
+
+    def play():
+        select(rail, 1)
+        click(find_button(page, MOVES[next(move) % 3]))
+        settle(page)
+
+    def show(index):
+        def run():
+            select(rail, index)
+            settle(page)
+        return run
+
+    return [
+        ("save_game_results", lambda: select(rail, 1), play),
+        ("update_dashboard_view", play, show(0)),
+        ("update_stats_view", play, show(2)),
+        ("update_history_view", play, show(3)),
+    ]
+
+
+def intermediate_operations(page):
+    tabs = find(page, ft.Tabs)
+    move = iter(range(10**9))
+
+    def play():
+        select(tabs, 0)
+        click(find_button(page, MOVES[next(move) % 3]))
+        settle(page)
+
+    def show_stats():
+        select(tabs, 1)
+        settle(page)
+
+    return [
+        ("play_game", lambda: select(tabs, 0), play),
+        ("generate_*_chart", play, show_stats),
+    ]
+
+
+APPS = [
+    ("Intermediate", "Intermediate/app.py", intermediate_operations),
+    ("Advanced", "Advanced/app.py", advanced_operations),
+]
+
+
+def run_operation(prepare, operation, repeat):
+    times, peaks = [], []
+    for _ in range(repeat):
+        prepare()
+        with PeakRSS() as memory:
+            started = time.perf_counter()
+            operation()
+            times.append(time.perf_counter() - started)
+        peaks.append(memory.peak)
+    return times, peaks
+
+
+def git_commit(root):
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, path):
+    with open(path) as f:
+        earlier = {(r["app"], r["operation"], r["games"]): r for r in json.load(f)["results"]}
+    print(f"\nagainst {path}")
+    print(f"{'app':<14}{'operation':<24}{'games':>10}{'before ms':>11}{'after ms':>10}{'change':>9}")
+    for result in results:
+        before = earlier.get((result["app"], result["operation"], result["games"]))
+        if before is None:
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1 if before["median_ms"] else 0
+        print(f"{result['app']:<14}{result['operation']:<24}{result['games']:>10,}"
+              f"{before['median_ms']:>11.1f}{result['median_ms']:>10.1f}{change:>+9.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="games in the history")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each operation per size")
+    parser.add_argument("--root", default=ROOT, help="checkout to measure (default: this one)")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--compare", help="results file of an earlier run to compare with")
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.root)
+    results = []
+    print(f"{'app':<14}{'operation':<24}{'games':>10}{'median ms':>11}{'max ms':>10}{'peak MB':>9}")
+    for games in (int(n) for n in args.sizes.split(",")):
+        sandbox_dir = sandbox(root)
+        seed_games(sandbox_dir, games)
+        for app, path, operations in APPS:
+            page, _ = start_app(load_app(sandbox_dir, path))
+            for name, prepare, operation in operations(page):
+                times, peaks = run_operation(prepare, operation, args.repeat)
+                peak = None if None in peaks else max(peaks) / 2**20
+                result = {
+                    "app": app,
+                    "operation": name,
+                    "games": games,
+                    "times_ms": [t * 1e3 for t in times],
+                    "median_ms": statistics.median(times) * 1e3,
+                    "max_ms": max(times) * 1e3,
+                    "peak_mb": peak,
+                }
+                results.append(result)
+                print(f"{app:<14}{name:<24}{games:>10,}{result['median_ms']:>11.1f}{result['max_ms']:>10.1f}"
+                      + (f"{peak:>9.1f}" if peak is not None else f"{'-':>9}"))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "date": datetime.datetime.now().isoformat(timespec="seconds"),
+                "commit": git_commit(root),
+                "python": platform.python_version(),
+                "machine": platform.platform(),
+                "cpus": os.cpu_count(),
+                "repeat": args.repeat,
+                "results": results,
+            }, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Check that each app reaches its first frame without the heavy imports.
+
+Run from the repository root:
+
+    python benchmarks/import_budget.py [--budget-ms 1500]
+
+For every app a fresh interpreter is started with ``python -X importtime``.
+It imports the app, runs ``main`` on a headless page with the background
+warm-up switched off and reports which modules got loaded. The check fails
+(exit status 1) if the import time goes over the budget or if any analytics
+or charting library was imported before the first frame.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+APPS = ["Simple/app.py", "Intermediate/app.py", "Advanced/app.py"]
+
+HEAVY_MODULES = ["polars", "pandas", "numpy", "matplotlib", "plotly"]
+
+PROBE = """
+import importlib.util, sys
+sys.path.insert(0, {root!r})
+spec = importlib.util.spec_from_file_location("app_under_test", {path!r})
+app = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(app)
+app.warm_up = lambda *steps: None
+from rps.headless import make_page
+page, conn = make_page()
+app.main(page)
+heavy = sorted({{name.split(".")[0] for name in sys.modules}} & set({heavy!r}))
+print(",".join(heavy))
+"""
+
+
+def measure(app_path):
+    probe = PROBE.format(root=ROOT, path=os.path.join(ROOT, app_path), heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{app_path} failed to start:\n{proc.stderr}")
+
+    # Every "import time:" line reports self and cumulative microseconds,
+    # the sum of the self column is the total time spent importing
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us = line.split(":", 1)[1].split("|")[0]
+        total_us += int(self_us)
+
+    heavy = [name for name in proc.stdout.strip().split(",") if name]
+    return total_us / 1000, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=1500,
+                        help="maximum total import time per app (default: 1500)")
+    args = parser.parse_args()
+
+    failed = False
+    for app_path in APPS:
+        import_ms, heavy = measure(app_path)
+        problems = []
+        if import_ms > args.budget_ms:
+            problems.append(f"over budget of {args.budget_ms:.0f} ms")
+        if heavy:
+            problems.append(f"heavy imports before first frame: {', '.join(heavy)}")
+        status = "FAIL" if problems else "ok"
+        print(f"{status:<5}{app_path:<22}{import_ms:>8.0f} ms  {'; '.join(problems)}")
+        failed = failed or bool(problems)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
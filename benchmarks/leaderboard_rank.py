@@ -0,0 +1,119 @@
+"""Leaderboard updates and queries with tens of thousands of players.
+
+Run from the repository root:
+
+    python benchmarks/leaderboard_rank.py [--users N] [--games N] [--queries N]
+
+Plays ``--games`` games spread over ``--users`` players of different skill
+into a ``Leaderboard``, half of them as the history it is built from, and
+reports the build time and the time per recorded game, per top-10
+read and per rank lookup, which should grow with the log of the number of
+players. Every ranking is checked against sorting all players from
+scratch, and the query cost is compared with recomputing the win rates
+with a polars group-by over the whole history.
+"""
+import argparse
+import collections
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps import engine
+from rps.leaderboard import RANKINGS, Leaderboard
+
+
+def check(board):
+    for ranking in RANKINGS:
+        keys = sorted(key for key in (stats.sort_key(ranking) for stats in board.players.values())
+                      if key is not None)
+        assert [player["user"] for player in board.top(ranking, 10)] == [key[-1] for key in keys[:10]], ranking
+        for position in random.Random(ranking).sample(range(len(keys)), min(len(keys), 200)):
+            assert board.rank(ranking, keys[position][-1]) == (position + 1, len(keys)), ranking
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    skill = [rng.betavariate(2, 2) for _ in range(args.users)]
+    users, outcomes = [], []
+    for _ in range(args.games):
+        user = rng.randrange(args.users)
+        roll = rng.random()
+        users.append(f"player{user}")
+        outcomes.append(engine.WIN if roll < skill[user] * 0.66 else engine.TIE if roll < skill[user] * 0.66 + 0.33
+                        else engine.LOSS)
+
+    # Half the games are already in the history when the board is built,
+    # the other half are recorded one by one at the next row of their
+    # player's partition
+    games = list(zip(users, outcomes))
+    half = args.games // 2
+    board = Leaderboard(lambda: games[:half])
+    started = time.perf_counter()
+    board.top("wins", 1)
+    seed = time.perf_counter() - started
+    rows = collections.Counter(users[:half])
+    started = time.perf_counter()
+    for user, outcome in games[half:]:
+        board.extend(user, rows[user], [outcome])
+        rows[user] += 1
+    record = (time.perf_counter() - started) / (args.games - half) * 1e6
+    check(board)
+
+    names = list(board.players)
+    print(f"{len(names):,} players, {args.games:,} games: built from {half:,} games in {seed:.2f}s, "
+          f"{record:.1f} us per recorded game")
+    print(f"{'ranking':<14}{'ranked':>9}{'top-10 us':>11}{'rank us':>9}")
+    for ranking, label in RANKINGS.items():
+        started = time.perf_counter()
+        for _ in range(args.queries):
+            board.top(ranking, 10)
+        top = (time.perf_counter() - started) / args.queries * 1e6
+        lookups = [rng.choice(names) for _ in range(args.queries)]
+        started = time.perf_counter()
+        for user in lookups:
+            board.rank(ranking, user)
+        rank = (time.perf_counter() - started) / args.queries * 1e6
+        print(f"{label:<14}{board.rank(ranking, names[0])[1]:>9,}{top:>11.1f}{rank:>9.1f}")
+
+    import polars as pl
+
+    history = pl.DataFrame({"user": users, "outcome": outcomes})
+    started = time.perf_counter()
+    recomputed = (
+        history.group_by("user")
+        .agg(games=pl.len(), wins=(pl.col("outcome") == engine.WIN).sum())
+        .with_columns(win_rate=pl.col("wins") / pl.col("games"))
+        .sort(["win_rate", "games"], descending=True)
+        .head(10)
+    )
+    group_by = (time.perf_counter() - started) * 1e3
+    assert recomputed.height == 10
+    print(f"group-by over the whole history for the same top 10: {group_by:.1f} ms")
+
+    # Small boards too, the costs should grow slowly with the players
+    for players in (1_000, 10_000):
+        small = Leaderboard(lambda: [])
+        small.top("wins", 1)
+        rows = collections.Counter()
+        for _ in range(players * 20):
+            user = f"p{rng.randrange(players)}"
+            small.extend(user, rows[user], [rng.randrange(3)])
+            rows[user] += 1
+        check(small)
+        lookups = [rng.choice(list(small.players)) for _ in range(args.queries)]
+        started = time.perf_counter()
+        for user in lookups:
+            small.rank("wins", user)
+        print(f"{players:>7,} players: rank by wins {(time.perf_counter() - started) / args.queries * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Memory growth over a long session, measured with the memory profiling mode.
+
+Run from the repository root:
+
+    python benchmarks/memory_profile.py [--games N] [--moves N] [--batches N] [--frames N]
+                                       [--top N] [--out DIR]
+
+Seeds a sandbox with ``--games`` games and starts the Intermediate and
+Advanced apps on headless pages with ``rps.memprofile`` on. Each app plays
+``--moves`` moves in ``--batches`` batches, the Advanced app also opening
+its dashboard and stats after each batch, and a snapshot is taken after
+every batch. Prints the growth of process and traced memory per move, the
+dataframe sizes and the last snapshot's report, and the median move with
+and without tracing ``--frames`` frames per allocation. Reports are kept in
+``--out``. Fails if a report is missing the dataframe readings.
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import flet as ft
+
+from harness import ROOT, click, find, find_button, load_app, sandbox, seed_games, select, settle, start_app
+
+MOVES = ["Rock", "Paper", "Scissors"]
+
+
+def play(page, moves):
+    times = []
+    for i in range(moves):
+        started = time.perf_counter()
+        click(find_button(page, MOVES[i % 3]))
+        times.append(time.perf_counter() - started)
+    settle(page)
+    return times
+
+
+def intermediate_batch(page, moves):
+    return play(page, moves)
+
+
+def advanced_batch(page, moves):
+    rail = find(page, ft.NavigationRail)
+    select(rail, 1)
+    times = play(page, moves)
+    for index in (0, 2):
+        select(rail, index)
+        settle(page)
+    return times
+
+
+APPS = [
+    ("Intermediate", "Intermediate/app.py", intermediate_batch, "df"),
+    ("Advanced", "Advanced/app.py", advanced_batch, "view.stats.history"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=2_000, help="games in the seeded history")
+    parser.add_argument("--moves", type=int, default=300, help="moves played per app")
+    parser.add_argument("--batches", type=int, default=3, help="snapshots taken over the moves")
+    parser.add_argument("--frames", type=int, default=1, help="stack frames traced per allocation")
+    parser.add_argument("--top", type=int, default=10, help="lines listed per table of the reports")
+    parser.add_argument("--out", help="directory for the reports (default: a temporary one)")
+    args = parser.parse_args()
+
+    out = args.out or tempfile.mkdtemp(prefix="rps-memprofile-")
+    per_batch = max(1, args.moves // args.batches)
+    for app, path, batch, expected_frame in APPS:
+        sandbox_dir = sandbox(ROOT)
+        seed_games(sandbox_dir, args.games)
+        module = load_app(sandbox_dir, path)
+        memprofile = module.memprofile
+        page, _ = start_app(module)
+        untraced = batch(page, per_batch)
+
+        # Snapshots are taken here after each batch rather than on a timer
+        directory = os.path.join(out, app)
+        memprofile.enabled = True
+        tracemalloc.start(args.frames)
+        profiler = memprofile.Profiler(directory, interval=None, top=args.top)
+        profiler.snapshot()
+        traced = []
+        for _ in range(args.batches):
+            traced += batch(page, per_batch)
+            report = profiler.snapshot()
+        tracemalloc.stop()
+        memprofile.enabled = False
+        # Both apps share the module, the next one starts without these readings
+        memprofile._watched.clear()
+        memprofile._frames.clear()
+
+        with open(os.path.join(directory, "memory.jsonl")) as f:
+            states = [json.loads(line) for line in f]
+        first, last = states[0], states[-1]
+        moves = per_batch * args.batches
+        print(f"\n{app}: {moves:,} moves after {args.games:,} games, reports in {directory}")
+        if first["rss_bytes"] is not None:
+            print(f"process memory {(last['rss_bytes'] - first['rss_bytes']) / moves / 1024:+.1f} KB per move")
+        print(f"traced memory {(last['traced_bytes'] - first['traced_bytes']) / moves / 1024:+.1f} KB per move")
+        print(f"median move {statistics.median(untraced) * 1e3:.2f} ms untraced, "
+              f"{statistics.median(traced) * 1e3:.2f} ms traced\n")
+        with open(report) as f:
+            print(f.read())
+
+        if expected_frame not in last["frames"]:
+            raise SystemExit(f"FAIL: no {expected_frame} reading in the {app} report")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Cost of the timing spans, and a check of their exporters.
+
+Run from the repository root:
+
+    python benchmarks/metrics_overhead.py [--spans N] [--moves N] [--port N]
+
+Times ``metrics.span()`` off and on against a bare ``with`` block, then
+plays ``--moves`` moves in the Intermediate app with spans off and on and
+reports the median move. The check fails if the spans of a move cost more
+than 1% of it while they are off. With spans on, it reads the Prometheus
+text from the endpoint and the span lines from the JSONL file back.
+"""
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import tempfile
+import time
+import urllib.request
+
+from harness import ROOT, click, find_button, load_app, sandbox, seed_games, settle, start_app
+
+MOVES = ["Rock", "Paper", "Scissors"]
+SPANS_PER_MOVE = 6
+
+
+def per_call_ns(make, count):
+    started = time.perf_counter()
+    for _ in range(count):
+        with make():
+            pass
+    return (time.perf_counter() - started) / count * 1e9
+
+
+def move_times(page, moves):
+    times = []
+    for i in range(moves):
+        button = find_button(page, MOVES[i % 3])
+        started = time.perf_counter()
+        click(button)
+        times.append(time.perf_counter() - started)
+    settle(page)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=1_000_000, help="spans timed per variant")
+    parser.add_argument("--moves", type=int, default=300, help="moves played per variant")
+    parser.add_argument("--port", type=int, default=19464, help="port of the metrics endpoint")
+    args = parser.parse_args()
+
+    sandbox_dir = sandbox(ROOT)
+    seed_games(sandbox_dir, 1000)
+    module = load_app(sandbox_dir, "Intermediate/app.py")
+    metrics = module.metrics
+    page, _ = start_app(module)
+
+    bare = contextlib.nullcontext()
+    bare_ns = per_call_ns(lambda: bare, args.spans)
+    off_ns = per_call_ns(lambda: metrics.span("bench"), args.spans)
+    off_moves = move_times(page, args.moves)
+    log_path = os.path.join(tempfile.mkdtemp(prefix="rps-metrics-"), "metrics.jsonl")
+    metrics.enable(args.port, log_path)
+    on_moves = move_times(page, args.moves)
+
+    text = urllib.request.urlopen(f"http://127.0.0.1:{args.port}/metrics").read().decode()
+    counts = {line.split('"')[1]: int(line.split()[-1]) for line in text.splitlines()
+              if line.startswith("rps_span_seconds_count")}
+    print("spans served: " + ", ".join(f"{name} {count}" for name, count in sorted(counts.items())))
+    assert counts.get("move") == args.moves, counts
+    # The file is written once a second
+    time.sleep(1.5)
+    with open(log_path) as f:
+        lines = [json.loads(line) for line in f]
+    assert sum(line["span"] == "move" for line in lines) == args.moves, len(lines)
+    print(f"{len(lines):,} span lines in {log_path}")
+
+    on_ns = per_call_ns(lambda: metrics.span("bench"), args.spans)
+
+    off_move, on_move = statistics.median(off_moves) * 1e9, statistics.median(on_moves) * 1e9
+    overhead = SPANS_PER_MOVE * max(0.0, off_ns - bare_ns) / off_move
+    print(f"{'':<22}{'ns/span':>9}{'move us':>9}")
+    print(f"{'bare with':<22}{bare_ns:>9.0f}{'':>9}")
+    print(f"{'spans off':<22}{off_ns:>9.0f}{off_move / 1e3:>9.1f}")
+    print(f"{'spans on':<22}{on_ns:>9.0f}{on_move / 1e3:>9.1f}")
+    print(f"spans off cost {overhead:.3%} of a move")
+
+    if overhead > 0.01:
+        raise SystemExit(f"FAIL: spans cost {overhead:.2%} of a move while off")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Hundreds of concurrent human-vs-human matches in one server process.
+
+Run from the repository root:
+
+    python benchmarks/multiplayer_matches.py [--matches N] [--rounds N] [--think MS] [--spectators N]
+
+Builds the multiplayer view on ``2 * --matches`` headless pages that share
+one event loop and pubsub hub, like the sessions of a Flet web server. Bots
+find opponents through the lobby, then move after a random think time of
+up to twice ``--think`` milliseconds, for ``--rounds`` rounds per match.
+``--spectators`` sessions watch each match.
+
+Reports the time from the commit that completes a round until each player
+and spectator has handled the result, fails if its p99 is over 50 ms, and
+checks that no session received a message about another match. The
+messages delivered are compared with what broadcasting every message to
+every session would cost.
+"""
+import argparse
+import asyncio
+import math
+import os
+import random
+import sys
+import threading
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps.headless import make_page
+from rps.multiplayer import Lobby
+from rps.multiplayer_view import MultiplayerView
+
+LATENCY_BUDGET_MS = 50
+
+
+def percentile(values, p):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class Bot:
+    def __init__(self, bench, index):
+        self.bench = bench
+        self.page, _ = make_page(f"bot-{index}", bench.loop, bench.hub)
+        self.view = MultiplayerView(bench.lobby, self.page.pubsub, f"bot-{index}", f"Bot {index}",
+                                    lambda: None)
+        self.page.add(self.view.control)
+        self.rng = random.Random(index)
+        self.match_id = None
+        self.round = 0
+        self.received = 0
+        self.foreign = 0
+        self.view.client.on_message = self.on_message
+
+    async def on_message(self, message):
+        await self.view.on_message(message)
+        handled = time.perf_counter()
+        self.received += 1
+        if "match" in message and message["type"] != "matched" and message["match"] != self.match_id:
+            self.foreign += 1
+        kind = message["type"]
+        if kind == "matched":
+            self.match_id = message["match"]
+            self.bench.matched(self, message)
+            self.move_later()
+        elif kind == "round":
+            self.bench.round_handled(message, handled)
+            self.round = message["round"] + 1
+            if self.round < self.bench.rounds:
+                self.move_later()
+            elif self.view.client.seat == 0:
+                self.view.client.leave()
+        elif kind == "ended":
+            self.bench.ended(self)
+
+    def move_later(self):
+        if self.view.client.seat is not None:
+            self.page.loop.call_later(self.rng.uniform(0, 2 * self.bench.think), self.move)
+
+    def move(self):
+        button = self.rng.choice(self.view.move_buttons)
+        self.bench.commit_times[(self.match_id, self.round, self.view.client.seat)] = time.perf_counter()
+        asyncio.ensure_future(self.view.on_move(types.SimpleNamespace(control=button)))
+
+
+class Spectator(Bot):
+    async def on_message(self, message):
+        await self.view.on_message(message)
+        handled = time.perf_counter()
+        self.received += 1
+        if message.get("match") != self.match_id:
+            self.foreign += 1
+        if message["type"] == "round":
+            self.bench.round_handled(message, handled)
+        elif message["type"] == "ended":
+            self.bench.ended(self)
+
+
+class Bench:
+    def __init__(self, matches, rounds, think, spectators):
+        self.rounds = rounds
+        self.think = think
+        self.spectators_per_match = spectators
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        from flet.core.pubsub.pubsub_hub import PubSubHub
+
+        self.hub = PubSubHub(self.loop)
+        publish = self.hub.send_all_on_topic
+
+        def counted(topic, message):
+            self.published += 1
+            publish(topic, message)
+
+        self.hub.send_all_on_topic = counted
+        self.lobby = Lobby()
+        self.commit_times = {}
+        self.latencies = []
+        self.published = 0
+        self.matches = matches
+        self.open_sessions = 0
+        self.done = threading.Event()
+        self.bots = [Bot(self, i) for i in range(2 * matches)]
+        self.spectators = [Spectator(self, 2 * matches + i) for i in range(matches * spectators)]
+        self.idle_spectators = list(self.spectators)
+
+    def matched(self, bot, message):
+        if bot.view.client.seat == 1:
+            # Both players are subscribed once the second one is matched
+            for _ in range(self.spectators_per_match):
+                spectator = self.idle_spectators.pop()
+                spectator.match_id = message["match"]
+                spectator.view.match_dropdown.value = message["match"]
+                asyncio.ensure_future(spectator.view.on_watch(None))
+
+    def round_handled(self, message, handled):
+        committed = max(self.commit_times.get((message["match"], message["round"], seat), 0) for seat in (0, 1))
+        self.latencies.append(handled - committed)
+
+    def ended(self, session):
+        self.open_sessions -= 1
+        if self.open_sessions == 0:
+            self.done.set()
+
+    def run(self):
+        self.open_sessions = len(self.bots) + len(self.spectators)
+
+        async def enter():
+            for bot in self.bots:
+                bot.view.client.find_match()
+
+        started = time.perf_counter()
+        asyncio.run_coroutine_threadsafe(enter(), self.loop).result()
+        self.done.wait()
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--matches", type=int, default=300)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--think", type=float, default=500, help="mean milliseconds between moves")
+    parser.add_argument("--spectators", type=int, default=1, help="spectators per match")
+    args = parser.parse_args()
+
+    bench = Bench(args.matches, args.rounds, args.think / 1000, args.spectators)
+    sessions = len(bench.bots) + len(bench.spectators)
+    elapsed = bench.run()
+
+    received = sum(session.received for session in bench.bots + bench.spectators)
+    foreign = sum(session.foreign for session in bench.bots + bench.spectators)
+    latencies = [latency * 1e3 for latency in bench.latencies]
+    p99 = percentile(latencies, 99)
+
+    print(f"{args.matches} matches, {sessions} sessions, {args.matches * args.rounds:,} rounds "
+          f"in {elapsed:.1f}s: {args.matches * args.rounds * 2 / elapsed:,.0f} commits/s")
+    print(f"commit to result handled: p50 {percentile(latencies, 50):.2f} ms, p95 {percentile(latencies, 95):.2f} ms, "
+          f"p99 {p99:.2f} ms, max {max(latencies):.2f} ms")
+    print(f"messages delivered: {received:,} on player and match topics, {bench.published * sessions:,} if broadcast to every session")
+    assert foreign == 0, f"{foreign} messages reached sessions outside their match"
+    played = sum(bot.round for bot in bench.bots)
+    assert played == args.matches * args.rounds * 2, (played, args.matches * args.rounds * 2)
+    if p99 > LATENCY_BUDGET_MS:
+        sys.exit(f"FAIL: p99 {p99:.2f} ms is over {LATENCY_BUDGET_MS} ms")
+
+
+if __name__ == "__main__":
+    main()
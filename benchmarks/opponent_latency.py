@@ -0,0 +1,61 @@
+"""Time each computer opponent's decisions and fail if any are slow.
+
+Run from the repository root:
+
+    python benchmarks/opponent_latency.py [--moves N] [--budget-us US]
+
+Every opponent plays ``--moves`` rounds against a scripted player that
+mostly repeats a cycle and sometimes plays at random. Each round times one
+``choose()`` plus ``observe()``. The script exits with status 1 if the 99th
+percentile of any opponent is over ``--budget-us`` microseconds. The
+computer's win rate shows whether the opponent picked up the pattern.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps import engine
+from rps.opponents import OPPONENTS
+
+PATTERN = [engine.ROCK, engine.ROCK, engine.PAPER, engine.SCISSORS]
+
+
+def scripted_player(moves, rng):
+    for i in range(moves):
+        yield rng.randrange(3) if rng.random() < 0.2 else PATTERN[i % len(PATTERN)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=100_000, help="rounds per opponent")
+    parser.add_argument("--budget-us", type=float, default=100, help="p99 budget per decision")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'opponent':<22}{'mean us':>9}{'p99 us':>9}{'max us':>9}{'computer wins':>15}")
+    for key, strategy in OPPONENTS.items():
+        opponent = strategy(rng=random.Random(1))
+        timings = []
+        wins = 0
+        for player in scripted_player(args.moves, random.Random(0)):
+            started = time.perf_counter()
+            computer = opponent.choose()
+            opponent.observe(player, computer)
+            timings.append(time.perf_counter() - started)
+            wins += engine.resolve(computer, player) == engine.WIN
+
+        timings.sort()
+        mean = sum(timings) / len(timings) * 1e6
+        p99 = timings[int(len(timings) * 0.99)] * 1e6
+        slow = p99 > args.budget_us
+        failed |= slow
+        print(f"{key:<22}{mean:>9.2f}{p99:>9.2f}{timings[-1] * 1e6:>9.1f}"
+              f"{wins / args.moves:>15.1%}{'  over budget' if slow else ''}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Load generator for the headless play API.
+
+Run from the repository root:
+
+    python benchmarks/play_api_load.py [--clients N] [--duration S] [--games N]
+
+Starts ``Intermediate/app.py --serve`` in a sandbox seeded with ``--games``
+games, then has ``--clients`` bots each play their own session over one
+keep-alive connection for ``--duration`` seconds. Reports the sustained
+moves per second and the p50 and p99 latency of ``POST /play``, checks
+``GET /stats`` against the moves played and, after stopping the server,
+that every move reached the CSV.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import signal
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from harness import sandbox, seed_games
+
+
+async def request(reader, writer, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = int(re.search(rb"(?i)content-length:\s*(\d+)", head).group(1))
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def bot(host, port, name, moves, deadline, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random(name)
+    played = 0
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            status, reply = await request(reader, writer, "POST", "/play",
+                                          {"move": rng.choice(moves), "session": name})
+            latencies.append(time.perf_counter() - started)
+            assert status == 200, reply
+            played += 1
+        status, reply = await request(reader, writer, "GET", f"/stats?session={name}")
+        assert status == 200 and reply["games"] == played, reply
+    finally:
+        writer.close()
+    return played
+
+
+async def load(host, port, clients, duration):
+    reader, writer = await asyncio.open_connection(host, port)
+    _, before = await request(reader, writer, "GET", "/stats")
+    for method, path, payload, expected in (("POST", "/play", {"move": "dynamite"}, 400),
+                                            ("POST", "/play", [], 400),
+                                            ("GET", "/play", None, 405),
+                                            ("GET", "/scores", None, 404)):
+        status, _ = await request(reader, writer, method, path, payload)
+        assert status == expected, (method, path, status)
+    # Without a session id the server starts a new session
+    _, reply = await request(reader, writer, "POST", "/play", {"move": "rock"})
+    assert reply["session"].startswith("api-") and reply["games"] == 1, reply
+
+    latencies = []
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    played = await asyncio.gather(*(bot(host, port, f"bot-{i}", ["rock", "paper", "scissors"],
+                                        deadline, latencies) for i in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    _, after = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    assert after["games"] == before["games"] + 1 + sum(played), (before, after)
+    assert after["wins"] + after["losses"] + after["ties"] == after["games"], after
+    return sum(played), elapsed, sorted(latencies), after
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--games", type=int, default=10_000, help="games already in the data file")
+    args = parser.parse_args()
+
+    root = sandbox()
+    seed_games(root, args.games)
+    server = subprocess.Popen(
+        [sys.executable, "-u", os.path.join(root, "Intermediate", "app.py"), "--serve", "--port", "0"],
+        stdout=subprocess.PIPE, text=True, env=dict(os.environ, RPS_RULES="classic"),
+    )
+    try:
+        host, port = re.search(r"http://(.+):(\d+)", server.stdout.readline()).groups()
+        played, elapsed, latencies, stats = asyncio.run(load(host, int(port), args.clients, args.duration))
+    finally:
+        server.send_signal(signal.SIGTERM)
+        print(server.communicate(timeout=60)[0].strip())
+
+    import polars as pl
+
+    rows = pl.read_csv(os.path.join(root, "Intermediate", "data", "game_data.csv"),
+                       schema_overrides={"session_id": pl.Utf8}).shape[0]
+    assert rows == stats["games"], (rows, stats["games"])
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1e3
+
+    print(f"{args.clients} clients, {played:,} moves in {elapsed:.1f}s: {played / elapsed:,.0f} moves/s")
+    print(f"latency p50 {percentile(0.5):.2f} ms, p99 {percentile(0.99):.2f} ms")
+    print(f"{rows:,} games in the CSV after shutdown")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Time session lookups through the index and seeks on the replay timeline.
+
+Run from the repository root:
+
+    python benchmarks/replay_seek.py [--rows N] [--sessions N] [--seeks N]
+
+Builds a ``SessionIndex`` over ``--rows`` games from ``--sessions``
+interleaved sessions and compares reading one session through its row runs
+with filtering the whole table for its id. Then builds a ``SessionTimeline``
+for sessions of growing length, checks ``state_at()`` against replaying
+from the start, and reports the mean time per seek, which should grow with
+the log of the session length.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps.replay import SessionIndex, SessionTimeline, TimelineState, next_state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--sessions", type=int, default=2_000)
+    parser.add_argument("--seeks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    import polars as pl
+
+    rng = random.Random(0)
+    # Sessions play in bursts, so they interleave in runs
+    ids = []
+    while len(ids) < args.rows:
+        ids.extend([f"s{rng.randrange(args.sessions)}"] * rng.randint(1, 20))
+    ids = ids[:args.rows]
+    table = pl.DataFrame({"session_id": ids, "outcome": [rng.randrange(3) for _ in ids]})
+
+    started = time.perf_counter()
+    index = SessionIndex(lambda: ids)
+    sessions = index.sessions()
+    build = time.perf_counter() - started
+
+    targets = [rng.choice(sessions) for _ in range(50)]
+    started = time.perf_counter()
+    for session_id in targets:
+        indexed = pl.concat([table.slice(start, stop - start) for start, stop in index.runs(session_id)])
+    lookup = (time.perf_counter() - started) / len(targets)
+    started = time.perf_counter()
+    for session_id in targets:
+        scanned = table.filter(pl.col("session_id") == session_id)
+    scan = (time.perf_counter() - started) / len(targets)
+    assert indexed.equals(scanned)
+
+    print(f"index of {args.rows:,} rows, {len(sessions):,} sessions built in {build:.2f}s")
+    print(f"read a session: index {lookup * 1e3:.2f} ms, full scan {scan * 1e3:.2f} ms\n")
+
+    print(f"{'moves':>10}{'interval':>10}{'checkpoints':>13}{'us/seek':>10}")
+    for moves in (1_000, 10_000, 100_000, 1_000_000):
+        outcomes = [rng.randrange(3) for _ in range(moves)]
+        timeline = SessionTimeline(outcomes)
+        # Check seeks against a single replay from the start
+        checks = set([0, moves] + [rng.randrange(moves) for _ in range(100)])
+        state = TimelineState()
+        for move in range(moves + 1):
+            if move in checks:
+                assert timeline.state_at(move) == state, move
+            if move < moves:
+                state = next_state(state, outcomes[move])
+        positions = [rng.randrange(moves + 1) for _ in range(args.seeks)]
+        started = time.perf_counter()
+        for move in positions:
+            timeline.state_at(move)
+        seek = (time.perf_counter() - started) / args.seeks * 1e6
+        print(f"{moves:>10,}{timeline.interval:>10}{len(timeline.checkpoints):>13,}{seek:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
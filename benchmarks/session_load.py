@@ -0,0 +1,239 @@
+"""Find how many concurrent web sessions one server process can handle.
+
+Run from the repository root:
+
+    python benchmarks/session_load.py [--app Intermediate|Advanced] [--sessions 1,2,4,...]
+                                      [--rate N] [--switch-every N] [--duration S] [--json PATH]
+
+Simulates Flet web mode: one app module, one event loop and a headless
+page per session, each running the app's ``main(page)``. Sessions are added
+level by level up to each count in ``--sessions`` and keep playing while
+later ones join. Every session plays ``--rate`` moves per second on average
+and after every ``--switch-every`` moves visits the other views and comes
+back to the game, waiting for each handler like a player waits for the
+screen. In the Advanced app every session logs in as a new player.
+
+For each level it reports the moves per second offered and achieved, event
+latency percentiles, the CPU used, the resident memory and the bytes sent
+to the clients. The saturation point is the first level whose move p99 is
+over ``--slo-ms`` or which achieves less than 90% of the offered moves.
+``--json`` also writes the levels to a file.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import resource
+import threading
+import time
+
+import flet as ft
+from flet.core.event import Event
+
+from harness import ROOT, find, find_button, load_app, login_dialog, run_inline, sandbox, seed_games, settle
+
+# Navigation control, game view and the other views of each app
+APPS = {
+    "Intermediate": ("Intermediate/app.py", ft.Tabs, 0, [1, 2, 3]),
+    "Advanced": ("Advanced/app.py", ft.NavigationRail, 1, [0, 2, 3, 4]),
+}
+
+
+def percentile_ms(values, p):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] * 1e3
+
+
+def column(value, width):
+    return f"{'-':>{width}}" if value is None else f"{value:>{width}.1f}"
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current outside Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Level:
+    def __init__(self, sessions):
+        self.sessions = sessions
+        self.latencies = {"start": [], "move": [], "view": []}
+
+
+class Session:
+    def __init__(self, module, loop, name, nav_type, game_index, views):
+        from rps.headless import make_page
+
+        self.page, self.conn = make_page(name, loop)
+        started = time.perf_counter()
+        module.main(self.page)
+        # Other sessions' tasks never finish, so only wait for this page's first frame
+        asyncio.run_coroutine_threadsafe(self.first_frame(), loop).result()
+        self.start_latency = time.perf_counter() - started
+        if hasattr(module, "profiles"):
+            # Each session plays as a player of its own
+            asyncio.run_coroutine_threadsafe(self.log_in(f"Player {name}"), loop).result()
+        self.buttons = [find_button(self.page, move.capitalize()) for move in module.engine.RULES.moves]
+        self.nav = find(self.page, nav_type)
+        self.game_index = game_index
+        self.views = views
+
+    async def first_frame(self):
+        from rps.scheduler import scheduler_for
+
+        await asyncio.sleep(0)
+        scheduler_for(self.page).flush()
+
+    async def log_in(self, player):
+        while (dialog := login_dialog(self.page)) is None:
+            await asyncio.sleep(0.01)
+        find(dialog, ft.TextField).value = player
+        await self.fire(find(dialog, ft.ElevatedButton, lambda c: c.text == "Log in"), "click")
+
+    async def fire(self, control, name):
+        started = time.perf_counter()
+        handler = control.event_handlers[name]
+        event = Event(control.uid, name, str(control.selected_index) if name == "change" else "")
+        if asyncio.iscoroutinefunction(handler):
+            await self.page.on_event_async(event)
+        else:
+            # Flet runs plain handlers on a thread, wait for them the same way
+            await asyncio.to_thread(handler, ft.ControlEvent(control.uid, name, event.data, control, self.page))
+        return time.perf_counter() - started
+
+    async def show(self, index):
+        self.nav.selected_index = index
+        return await self.fire(self.nav, "change")
+
+    async def play(self, rate, switch_every, load, seed):
+        rng = random.Random(seed)
+        await self.show(self.game_index)
+        loop = asyncio.get_running_loop()
+        # Moves are due on a fixed schedule from a random phase, a session
+        # that falls behind plays its late moves right away
+        due = loop.time() + rng.random() / rate
+        moves = 0
+        while True:
+            await asyncio.sleep(due - loop.time())
+            due += 1 / rate
+            latency = await self.fire(rng.choice(self.buttons), "click")
+            load.level.latencies["move"].append(latency)
+            moves += 1
+            if moves % switch_every == 0:
+                for index in self.views + [self.game_index]:
+                    load.level.latencies["view"].append(await self.show(index))
+
+
+class Load:
+    def __init__(self, module, app):
+        self.module = module
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self.sessions = []
+        self.players = []
+        self.level = Level(0)
+
+    def add_session(self, rate, switch_every):
+        _, nav_type, game_index, views = APPS[self.app]
+        session = Session(self.module, self.loop, f"load-{len(self.sessions)}", nav_type, game_index, views)
+        self.level.latencies["start"].append(session.start_latency)
+        self.players.append(asyncio.run_coroutine_threadsafe(
+            session.play(rate, switch_every, self, len(self.sessions)), self.loop))
+        self.sessions.append(session)
+
+    def stop(self):
+        for player in self.players:
+            player.cancel()
+        # Let the handlers in progress and the saves they started finish
+        for session in self.sessions:
+            settle(session.page)
+
+    def run_level(self, sessions, rate, switch_every, duration):
+        self.level = Level(sessions)
+        while len(self.sessions) < sessions:
+            self.add_session(rate, switch_every)
+        # Measure a full window with every session of the level playing
+        starts = self.level.latencies["start"]
+        self.level = level = Level(sessions)
+        for session in self.sessions:
+            session.conn.reset_counters()
+        cpu, wall = time.process_time(), time.perf_counter()
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            time.sleep(0.1)
+        elapsed = time.perf_counter() - wall
+        sent = sum(session.conn.bytes_sent for session in self.sessions)
+        moves = level.latencies["move"]
+        return {
+            "sessions": sessions,
+            "offered_moves_per_s": sessions * rate,
+            "moves_per_s": len(moves) / elapsed,
+            "move_p50_ms": percentile_ms(moves, 50),
+            "move_p99_ms": percentile_ms(moves, 99),
+            "view_p99_ms": percentile_ms(level.latencies["view"], 99),
+            "start_p99_ms": percentile_ms(starts, 99),
+            "cpu_percent": (time.process_time() - cpu) / elapsed * 100,
+            "rss_mb": rss_bytes() / 2**20,
+            "sent_kb_per_s": sent / elapsed / 1024,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", choices=sorted(APPS), default="Intermediate")
+    parser.add_argument("--root", default=ROOT, help="checkout to measure (default: this one)")
+    parser.add_argument("--games", type=int, default=10_000, help="games in the data files beforehand")
+    parser.add_argument("--sessions", default="1,2,4,8,16,32,64,128", help="session counts to ramp through")
+    parser.add_argument("--rate", type=float, default=0.5, help="moves per second per session")
+    parser.add_argument("--switch-every", type=int, default=10, help="moves between visits to the other views")
+    parser.add_argument("--duration", type=float, default=10, help="seconds measured per level")
+    parser.add_argument("--slo-ms", type=float, default=100, help="move p99 latency target")
+    parser.add_argument("--json", help="also write the levels to this file")
+    args = parser.parse_args()
+
+    sandbox_dir = sandbox(os.path.abspath(args.root))
+    seed_games(sandbox_dir, args.games)
+    module = load_app(sandbox_dir, APPS[args.app][0])
+    if hasattr(module, "warm_up"):
+        module.warm_up = run_inline
+    load = Load(module, args.app)
+
+    print(f"{args.app}, {args.rate:g} moves/s per session, views every {args.switch_every} moves")
+    print(f"{'sessions':>8}{'offered/s':>11}{'moves/s':>9}{'p50 ms':>8}{'p99 ms':>8}{'view p99':>10}"
+          f"{'start p99':>11}{'CPU %':>7}{'RSS MB':>8}{'KB/s':>8}")
+    levels = []
+    saturation = None
+    for sessions in (int(n) for n in args.sessions.split(",")):
+        level = load.run_level(sessions, args.rate, args.switch_every, args.duration)
+        levels.append(level)
+        print(f"{sessions:>8}{level['offered_moves_per_s']:>11.1f}{level['moves_per_s']:>9.1f}"
+              + column(level["move_p50_ms"], 8) + column(level["move_p99_ms"], 8)
+              + column(level["view_p99_ms"], 10) + column(level["start_p99_ms"], 11)
+              + f"{level['cpu_percent']:>7.0f}{level['rss_mb']:>8.0f}{level['sent_kb_per_s']:>8.1f}")
+        if (level["move_p99_ms"] or 0) > args.slo_ms or level["moves_per_s"] < 0.9 * level["offered_moves_per_s"]:
+            saturation = sessions
+            break
+
+    load.stop()
+
+    if saturation is None:
+        print(f"not saturated at {levels[-1]['sessions']} sessions")
+    else:
+        good = [level["sessions"] for level in levels[:-1]]
+        print(f"saturated at {saturation} sessions, last good level: {good[-1] if good else 'none'}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"app": args.app, "rate": args.rate, "switch_every": args.switch_every,
+                       "slo_ms": args.slo_ms, "saturation": saturation, "levels": levels}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Check that sessions replay from their seed and time the computer's draws.
+
+Run from the repository root:
+
+    python benchmarks/session_rng.py [--moves N]
+
+Plays ``--moves`` moves against every opponent with a seeded
+``SessionRandom``, switching opponent part way through, then replays the
+session from its seed and checks that every computer move comes out the
+same. Also checks ``SessionRandom.draw_at()`` against the draws taken in
+order, and compares the cost of a draw with ``random.Random.randrange``.
+Exits with status 1 if anything doesn't replay.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps.opponents import OPPONENTS, make_opponent, replay
+from rps.rng import SessionRandom
+
+
+def time_draws(rng, moves):
+    started = time.perf_counter()
+    for _ in range(moves):
+        rng.randrange(3)
+    return (time.perf_counter() - started) / moves * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=100_000)
+    args = parser.parse_args()
+
+    failed = False
+    player = random.Random(0)
+    names = list(OPPONENTS)
+    for name, next_name in zip(names, names[1:] + names[:1]):
+        rng = SessionRandom()
+        segments = [(0, name), (args.moves // 2, next_name)]
+        player_moves = [player.randrange(3) for _ in range(args.moves)]
+        computer_moves = []
+        for index, move in enumerate(player_moves):
+            if index == args.moves // 2:
+                opponent = make_opponent(next_name, rng)
+            elif index == 0:
+                opponent = make_opponent(name, rng)
+            computer = opponent.choose()
+            opponent.observe(move, computer)
+            computer_moves.append(computer)
+        same = replay(rng.seed, segments, player_moves) == computer_moves
+        failed |= not same
+        print(f"{name + ' then ' + next_name:<26}{'replays' if same else 'DOES NOT REPLAY'}")
+
+    rng = SessionRandom(1234)
+    draws = [rng.randrange(3) for _ in range(5000)]
+    indexed = all(SessionRandom.draw_at(1234, i) == draws[i] for i in range(0, 5000, 37))
+    failed |= not indexed
+    print(f"{'draw_at(seed, index)':<26}{'matches' if indexed else 'DOES NOT MATCH'}")
+
+    session = time_draws(SessionRandom(), args.moves)
+    stdlib = time_draws(random.Random(), args.moves)
+    print(f"\nns per draw: SessionRandom {session:.0f}, random.Random {stdlib:.0f}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
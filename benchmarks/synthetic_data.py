@@ -0,0 +1,77 @@
+"""Generation time of a large synthetic history, and a check of its files.
+
+Run from the repository root:
+
+    python benchmarks/synthetic_data.py [--games N] [--players N] [--budget SECONDS] [--check N]
+
+Generates ``--games`` games (default 10M) with ``python -m rps.synthetic``
+into a temporary directory and fails if it takes longer than ``--budget``
+seconds. The files are then read back: the Intermediate CSV must have
+every game, the ``stats`` sheets of the players' workbooks must add up to
+its win, loss and tie counts, and for ``--check`` players the ``stats``
+sheet must match a count of the ``history`` sheet.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import polars as pl
+
+from rps import synthetic
+from rps.excel_store import ExcelGameStore, PartitionedGameStore
+from rps.profiles import Profiles
+
+# Intermediate result -> stats metric of the Advanced workbooks
+METRICS = {"Win": "user_wins", "Loss": "computer_wins", "Tie": "ties"}
+RESULTS = dict(zip(synthetic.ADVANCED_RESULTS, synthetic.INTERMEDIATE_RESULTS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10_000_000)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--budget", type=float, default=60.0, help="seconds allowed to generate and write")
+    parser.add_argument("--check", type=int, default=3, help="players whose history is counted")
+    args = parser.parse_args()
+
+    output = tempfile.mkdtemp(prefix="rps-synthetic-")
+    started = time.perf_counter()
+    synthetic.main(["--games", str(args.games), "--players", str(args.players), "--output", output])
+    elapsed = time.perf_counter() - started
+
+    csv = pl.scan_csv(os.path.join(output, "Intermediate", "data", "game_data.csv"))
+    totals = dict(csv.group_by("result").len().collect().iter_rows())
+    assert sum(totals.values()) == args.games, totals
+    expected = {METRICS[result]: count for result, count in totals.items()}
+    expected["total_games"] = args.games
+
+    partitions = PartitionedGameStore(os.path.join(output, "Advanced", "users"))
+    users = [profile["user_id"] for profile in Profiles(os.path.join(output, "Advanced", "profiles.csv")).all()]
+    summed = dict.fromkeys(expected, 0)
+    for user_id in users:
+        for metric, value in partitions.partition(user_id).read_stats().items():
+            summed[metric] += int(value)
+    assert summed == expected, (summed, expected)
+    print(f"stats of {len(users)} workbooks add up to the CSV: {summed}")
+
+    for user_id in users[:args.check]:
+        store = partitions.partition(user_id)
+        history = pl.read_excel(store.path, sheet_name="history", columns=["result"])
+        counted = dict.fromkeys(expected, 0)
+        for result, count in history.group_by("result").len().iter_rows():
+            counted[METRICS[RESULTS[result]]] = count
+        counted["total_games"] = history.height
+        stats = {metric: int(value) for metric, value in ExcelGameStore(store.path).read_stats().items()}
+        assert stats == counted, (user_id, stats, counted)
+        print(f"{user_id}: {history.height:,} history rows match the stats sheet")
+
+    print(f"{args.games:,} games generated and written in {elapsed:.1f}s")
+    if elapsed > args.budget:
+        raise SystemExit(f"FAIL: took {elapsed:.1f}s, over the {args.budget:.0f}s budget")
+
+
+if __name__ == "__main__":
+    main()
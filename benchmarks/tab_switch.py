@@ -0,0 +1,53 @@
+"""Time tab switches in the Intermediate app after the player pauses.
+
+Run from the repository root:
+
+    python benchmarks/tab_switch.py [--root PATH] [--games N] [--rounds N] [--pause S]
+
+Each round plays a move, waits ``--pause`` seconds like a player looking at
+the result, then opens the statistics and history tabs and goes back to the
+game. The time from the tab change until its handler returns is reported.
+The data file is seeded with ``--games`` games first. ``--root`` points at
+another checkout to compare before and after a change.
+"""
+import argparse
+import os
+import time
+
+import flet as ft
+
+from harness import ROOT, click, find, find_button, load_app, sandbox, seed_games, select, settle, start_app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=ROOT, help="checkout to measure (default: this one)")
+    parser.add_argument("--games", type=int, default=20000, help="games in the data file beforehand")
+    parser.add_argument("--rounds", type=int, default=10, help="moves played")
+    parser.add_argument("--pause", type=float, default=1.0, help="seconds between a move and the tab switch")
+    args = parser.parse_args()
+
+    sandbox_dir = sandbox(os.path.abspath(args.root))
+    seed_games(sandbox_dir, args.games)
+    page, conn = start_app(load_app(sandbox_dir, "Intermediate/app.py"))
+    tabs = find(page, ft.Tabs)
+
+    timings = {"Statistics": [], "History": []}
+    for i in range(args.rounds):
+        click(find_button(page, ["Rock", "Paper", "Scissors"][i % 3]))
+        time.sleep(args.pause)
+        for index, name in [(1, "Statistics"), (2, "History")]:
+            started = time.perf_counter()
+            select(tabs, index)
+            timings[name].append(time.perf_counter() - started)
+            settle(page)
+        select(tabs, 0)
+        settle(page)
+
+    print(f"{'tab':<12}{'mean ms':>10}{'max ms':>10}")
+    for name, samples in timings.items():
+        print(f"{name:<12}{sum(samples) / len(samples) * 1000:>10.1f}{max(samples) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure how tournament throughput grows with the number of worker processes.
+
+Run from the repository root:
+
+    python benchmarks/tournament_scaling.py [--rounds N] [--replicates N] [--workers 1,2,4]
+
+Plays the same round-robin tournament between all computer opponents with
+each number of workers and prints the rounds per second and the speed-up
+over one worker. Every run is seeded the same way, so the script also
+checks that the results don't depend on the number of workers.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rps import tournament
+from rps.opponents import OPPONENTS
+
+
+def main():
+    cores = os.cpu_count()
+    default_workers = sorted({1, 2, 4, cores} | {w for w in (8, 16) if w <= cores})
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=100_000, help="rounds per pair of players")
+    parser.add_argument("--replicates", type=int, default=16, help="independent games per pair")
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)),
+                        help="comma separated worker counts")
+    args = parser.parse_args()
+
+    players = list(OPPONENTS)
+    print(f"{cores} cores, {args.rounds:,} rounds per pair\n")
+    print(f"{'workers':>8}{'seconds':>10}{'rounds/s':>14}{'speed-up':>10}")
+    baseline = reference = None
+    for workers in map(int, args.workers.split(",")):
+        started = time.perf_counter()
+        totals = tournament.run(players, {}, args.rounds, args.replicates, 0, workers)
+        elapsed = time.perf_counter() - started
+        rate = sum(sum(counts) for counts in totals.values()) // 2 / elapsed
+        baseline = baseline or rate
+        if reference is None:
+            reference = totals
+        elif totals != reference:
+            sys.exit(f"results with {workers} workers differ from the first run")
+        print(f"{workers:>8}{elapsed:>10.2f}{rate:>14,.0f}{rate / baseline:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
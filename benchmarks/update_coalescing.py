@@ -0,0 +1,70 @@
+"""Count page updates sent during a burst of clicks, with and without coalescing.
+
+Run from the repository root:
+
+    python benchmarks/update_coalescing.py [--clicks N] [--gap-ms MS]
+
+Clicks are fired from a thread pool, the way Flet dispatches event
+handlers, ``--gap-ms`` apart. Each app is run once with updates sent
+immediately (frame interval 0) and once with the default frame interval,
+and the number of requested updates, sent updates, messages and bytes are
+reported.
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import flet as ft
+
+from harness import click, find, find_button, flush_updates, load_app, sandbox, select, start_app
+
+MOVES = ["Rock", "Paper", "Scissors"]
+
+
+def burst(app_path, sandbox_dir, frame_ms, clicks, gap):
+    from rps.scheduler import scheduler_for
+
+    page, conn = start_app(load_app(sandbox_dir, app_path))
+    if app_path.startswith("Advanced"):
+        select(find(page, ft.NavigationRail), 1)
+    buttons = [find_button(page, move) for move in MOVES]
+    updates = scheduler_for(page)
+    flush_updates(conn)
+    updates.interval = frame_ms / 1000
+    updates.requested = updates.flushed = 0
+    conn.reset_counters()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for i in range(clicks):
+            pool.submit(click, buttons[i % 3])
+            time.sleep(gap)
+    flush_updates(conn)
+    elapsed = time.perf_counter() - started
+    return updates.requested, updates.flushed, conn.messages_sent, conn.bytes_sent, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clicks", type=int, default=200, help="clicks per burst")
+    parser.add_argument("--gap-ms", type=float, default=2, help="time between clicks")
+    args = parser.parse_args()
+
+    sandbox_dir = sandbox()
+    sys.path.insert(0, sandbox_dir)
+    from rps.scheduler import DEFAULT_FRAME_MS
+
+    print(f"{'app':<14}{'frame ms':>10}{'requested':>11}{'sent':>7}{'messages':>10}"
+          f"{'bytes':>11}{'seconds':>9}")
+    for app_path in ("Intermediate/app.py", "Advanced/app.py"):
+        for frame_ms in (0, DEFAULT_FRAME_MS or 16):
+            requested, sent, messages, sent_bytes, elapsed = burst(
+                app_path, sandbox_dir, frame_ms, args.clicks, args.gap_ms / 1000
+            )
+            print(f"{app_path.split('/')[0]:<14}{frame_ms:>10g}{requested:>11}{sent:>7}"
+                  f"{messages:>10}{sent_bytes:>11,}{elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
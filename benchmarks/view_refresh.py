@@ -0,0 +1,75 @@
+"""Count controls created and bytes sent per UI refresh in each app.
+
+Run from the repository root:
+
+    python benchmarks/view_refresh.py [--root PATH] [--games N]
+
+Every scenario is repeated ``--games`` times on a headless page and the
+average per refresh is reported. ``--root`` points at another checkout, for
+example an older commit exported with ``git worktree add``, to compare
+before and after a change.
+"""
+import argparse
+import os
+
+import flet as ft
+
+from harness import ROOT, click, find, find_button, load_app, measure, sandbox, select, start_app
+
+MOVES = ["Rock", "Paper", "Scissors"]
+
+
+def simple_scenarios(sandbox_dir, games):
+    page, conn = start_app(load_app(sandbox_dir, "Simple/app.py"))
+    yield "Simple: play", [measure(conn, lambda i=i: click(find_button(page, MOVES[i % 3])))
+                           for i in range(games)]
+
+
+def intermediate_scenarios(sandbox_dir, games):
+    page, conn = start_app(load_app(sandbox_dir, "Intermediate/app.py"))
+    tabs = find(page, ft.Tabs)
+    yield "Intermediate: play", [measure(conn, lambda i=i: click(find_button(page, MOVES[i % 3])))
+                                 for i in range(games)]
+
+    samples = []
+    for i in range(games):
+        select(tabs, 0)
+        click(find_button(page, MOVES[i % 3]))
+        samples.append(measure(conn, lambda: select(tabs, 1)))
+    yield "Intermediate: stats refresh", samples
+
+
+def advanced_scenarios(sandbox_dir, games):
+    page, conn = start_app(load_app(sandbox_dir, "Advanced/app.py"))
+    rail = find(page, ft.NavigationRail)
+
+    select(rail, 1)
+    yield "Advanced: play", [measure(conn, lambda i=i: click(find_button(page, MOVES[i % 3])))
+                             for i in range(games)]
+
+    for tab, name in [(0, "dashboard"), (2, "stats")]:
+        samples = []
+        for i in range(games):
+            select(rail, 1)
+            click(find_button(page, MOVES[i % 3]))
+            samples.append(measure(conn, lambda: select(rail, tab)))
+        yield f"Advanced: {name} refresh", samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--root", default=ROOT, help="checkout to measure (default: this one)")
+    parser.add_argument("--games", type=int, default=10, help="refreshes per scenario")
+    args = parser.parse_args()
+
+    sandbox_dir = sandbox(os.path.abspath(args.root))
+    print(f"{'scenario':<30}{'controls/refresh':>18}{'bytes/refresh':>16}")
+    for scenarios in (simple_scenarios, intermediate_scenarios, advanced_scenarios):
+        for name, samples in scenarios(sandbox_dir, args.games):
+            controls = sum(c for c, _ in samples) / len(samples)
+            sent = sum(b for _, b in samples) / len(samples)
+            print(f"{name:<30}{controls:>18.1f}{sent:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
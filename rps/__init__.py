@@ -0,0 +1,7 @@
+"""Shared building blocks for the Rock Paper Scissors apps.
+
+The apps in ``Simple/``, ``Intermediate/`` and ``Advanced/`` are run as plain
+scripts, so each one puts the repository root on ``sys.path`` before importing
+from this package. Submodules are imported explicitly (``from rps import
+charts``) so that importing the package itself stays cheap.
+"""
@@ -0,0 +1,102 @@
+"""Content-addressed storage for rendered chart images.
+
+Images are written into the app's Flet ``assets_dir`` under a name derived
+from their SHA-256, and controls point at them with ``ft.Image(src=...)``.
+The same chart always maps to the same URL, so browsers and the Flet client
+can cache it, and an unchanged chart adds nothing to later page updates.
+
+Old files are removed by ``collect_garbage()`` once they are older than
+``max_age`` seconds or the directory grows past ``max_bytes``.
+
+Charts are rendered in worker threads, so ``store()`` can be called from
+several at once. Its counters are kept under a lock, and only the store
+that reaches ``gc_every`` runs the collection.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+
+class ChartAssetCache:
+    def __init__(self, assets_dir, subdir="charts", max_age=7 * 24 * 3600,
+                 max_bytes=20 * 1024 * 1024, gc_every=50):
+        self.assets_dir = assets_dir
+        self.subdir = subdir
+        self.directory = os.path.join(assets_dir, subdir)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.gc_every = gc_every
+        self._stores_since_gc = 0
+        # Charts stored, and how many of them were already on disk
+        self.stores = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def store(self, data, extension="png"):
+        """Save ``data`` if it is new and return the URL to use as ``src``."""
+        name = f"{hashlib.sha256(data).hexdigest()[:32]}.{extension}"
+        path = os.path.join(self.directory, name)
+
+        hit = os.path.exists(path)
+        if hit:
+            # Refresh the age so charts still in use are not collected
+            os.utime(path)
+        else:
+            # Write to a temporary file first so a half-written image is never served
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self.stores += 1
+            self.hits += hit
+            self._stores_since_gc += 1
+            collect = self._stores_since_gc >= self.gc_every
+            if collect:
+                self._stores_since_gc = 0
+        if collect:
+            self.collect_garbage()
+
+        return f"/{self.subdir}/{name}"
+
+    def collect_garbage(self):
+        """Remove expired files, then the oldest ones while over the size limit."""
+        with self._lock:
+            self._stores_since_gc = 0
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        removed = 0
+        kept = []
+        for mtime, size, path in entries:
+            if now - mtime > self.max_age:
+                removed += self._remove(path)
+            else:
+                kept.append((mtime, size, path))
+
+        total = sum(size for _, size, _ in kept)
+        for mtime, size, path in sorted(kept):
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+        return removed
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return 1
+        except FileNotFoundError:
+            return 0
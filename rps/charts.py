@@ -0,0 +1,150 @@
+"""Native Flet charts for the statistics views.
+
+The builders turn already aggregated data into ``ft.PieChart``,
+``ft.BarChart`` and ``ft.LineChart`` controls. The matching ``update_*``
+functions change an existing chart in place. Flet only sends the properties
+that changed, so a refresh costs a few bytes per data point instead of a new
+PNG.
+
+Data is passed as a list of ``(label, value)`` pairs, in display order.
+"""
+import flet as ft
+
+DEFAULT_COLORS = [ft.Colors.GREEN_500, ft.Colors.RED_500, ft.Colors.BLUE_500,
+                  ft.Colors.ORANGE_500, ft.Colors.PURPLE_500, ft.Colors.TEAL_500]
+
+
+def _color(colors, i):
+    colors = colors or DEFAULT_COLORS
+    return colors[i % len(colors)]
+
+
+def _pie_title(label, value, total):
+    share = value / total if total > 0 else 0
+    return f"{label}\n{share:.1%}"
+
+
+def pie_chart(data, colors=None, radius=100, width=400, height=300):
+    chart = ft.PieChart(
+        sections=[],
+        sections_space=2,
+        center_space_radius=0,
+        width=width,
+        height=height,
+        data={"radius": radius, "colors": colors},
+    )
+    update_pie_chart(chart, data)
+    return chart
+
+
+def update_pie_chart(chart, data):
+    total = sum(value for _, value in data)
+    radius = chart.data["radius"]
+    colors = chart.data["colors"]
+    sections = chart.sections
+
+    for i, (label, value) in enumerate(data):
+        title = _pie_title(label, value, total)
+        if i < len(sections):
+            sections[i].value = value
+            sections[i].title = title
+        else:
+            sections.append(
+                ft.PieChartSection(
+                    value,
+                    title=title,
+                    color=_color(colors, i),
+                    radius=radius,
+                    title_style=ft.TextStyle(size=13, color=ft.Colors.WHITE,
+                                             weight=ft.FontWeight.BOLD),
+                )
+            )
+    del sections[len(data):]
+
+
+def bar_chart(data, colors=None, bar_width=40, width=400, height=300):
+    chart = ft.BarChart(
+        bar_groups=[],
+        bottom_axis=ft.ChartAxis(labels=[], labels_size=32),
+        left_axis=ft.ChartAxis(labels_size=40),
+        horizontal_grid_lines=ft.ChartGridLines(color=ft.Colors.GREY_300, width=1),
+        border=ft.border.all(1, ft.Colors.GREY_400),
+        tooltip_bgcolor=ft.Colors.with_opacity(0.8, ft.Colors.GREY_300),
+        width=width,
+        height=height,
+        data={"bar_width": bar_width, "colors": colors},
+    )
+    update_bar_chart(chart, data)
+    return chart
+
+
+def update_bar_chart(chart, data):
+    bar_width = chart.data["bar_width"]
+    colors = chart.data["colors"]
+    groups = chart.bar_groups
+    labels = chart.bottom_axis.labels
+
+    for i, (label, value) in enumerate(data):
+        if i < len(groups):
+            rod = groups[i].bar_rods[0]
+            rod.to_y = value
+            rod.tooltip = f"{label}: {value}"
+            labels[i].label.value = label
+        else:
+            groups.append(
+                ft.BarChartGroup(
+                    x=i,
+                    bar_rods=[
+                        ft.BarChartRod(
+                            from_y=0,
+                            to_y=value,
+                            width=bar_width,
+                            color=_color(colors, i),
+                            tooltip=f"{label}: {value}",
+                            border_radius=4,
+                        )
+                    ],
+                )
+            )
+            labels.append(ft.ChartAxisLabel(value=i, label=ft.Text(label)))
+    del groups[len(data):]
+    del labels[len(data):]
+
+    # Keep some headroom above the tallest bar
+    max_value = max((value for _, value in data), default=0)
+    chart.max_y = max(1, max_value * 1.1)
+
+
+def line_chart(values, color=ft.Colors.BLUE_500, max_y=100, width=400, height=200):
+    chart = ft.LineChart(
+        data_series=[
+            ft.LineChartData(
+                data_points=[],
+                stroke_width=3,
+                color=color,
+                curved=True,
+                below_line_bgcolor=ft.Colors.with_opacity(0.15, color),
+            )
+        ],
+        min_y=0,
+        max_y=max_y,
+        min_x=0,
+        left_axis=ft.ChartAxis(labels_size=40),
+        horizontal_grid_lines=ft.ChartGridLines(color=ft.Colors.GREY_300, width=1),
+        border=ft.border.all(1, ft.Colors.GREY_400),
+        width=width,
+        height=height,
+    )
+    update_line_chart(chart, values)
+    return chart
+
+
+def update_line_chart(chart, values):
+    points = chart.data_series[0].data_points
+    for i, value in enumerate(values):
+        if i < len(points):
+            points[i].y = value
+        else:
+            points.append(ft.LineChartDataPoint(i, value))
+    del points[len(values):]
+    chart.max_x = max(1, len(values) - 1)
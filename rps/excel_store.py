@@ -0,0 +1,96 @@
+"""Read access to the Advanced app's workbooks.
+
+Every player's games are in a partition of their own, a workbook named
+after their user id (``PartitionedGameStore``), so a player's queries never
+touch other players' games. A workbook has a ``history`` sheet with one row
+per game (oldest first) and a small ``stats`` sheet with running totals.
+Queries here only parse the rows they need. The game count comes from the
+stats sheet, and history pages are read with ``skip_rows``/``n_rows`` so the
+rows are never all materialized.
+"""
+import os
+
+from rps.lazy import lazy_import
+
+pl = lazy_import("polars")
+
+HISTORY_COLUMNS = ["timestamp", "user_choice", "computer_choice", "result", "session_id"]
+
+
+class ExcelGameStore:
+    def __init__(self, path):
+        self.path = path
+
+    def read_stats(self):
+        """Return the stats sheet as a ``{metric: value}`` dict."""
+        if not os.path.exists(self.path):
+            return {}
+        stats_df = pl.read_excel(self.path, sheet_name="stats")
+        return dict(zip(stats_df["metric"].to_list(), stats_df["value"].to_list()))
+
+    def count_games(self):
+        return int(self.read_stats().get("total_games", 0))
+
+    def read_history_rows(self, start, count):
+        """Return ``count`` history rows starting at row ``start``, oldest first."""
+        if count <= 0 or not os.path.exists(self.path):
+            return []
+        history_df = pl.read_excel(
+            self.path,
+            sheet_name="history",
+            # Every column is text, including session ids made of digits and
+            # the empty session ids of games saved before they were recorded
+            read_options={"skip_rows": start, "n_rows": count, "dtypes": "string"},
+        )
+        return history_df.to_dicts()
+
+    def read_column(self, name):
+        """Return one history column for every row, None where it is empty.
+
+        Workbooks from before the column was added give None for every row.
+        """
+        first_rows = self.read_history_rows(0, 1)
+        if not first_rows or name not in first_rows[0]:
+            return [None] * self.count_games()
+        # Only this column is parsed, rows where it is empty are kept
+        values = pl.read_excel(
+            self.path,
+            sheet_name="history",
+            columns=[name],
+            drop_empty_rows=False,
+            read_options={"dtypes": "string"},
+        )
+        return values[name].to_list()
+
+    def read_session_ids(self):
+        """Return the session id of every history row, None where it has none."""
+        return self.read_column("session_id")
+
+    def read_history_page(self, offset, limit, total=None):
+        """Return up to ``limit`` games, newest first, skipping the ``offset`` newest."""
+        if total is None:
+            total = self.count_games()
+        end = total - offset
+        start = max(0, end - limit)
+        rows = self.read_history_rows(start, end - start)
+        rows.reverse()
+        return rows
+
+
+class PartitionedGameStore:
+    """One workbook per user id in ``directory``."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, user_id):
+        return os.path.join(self.directory, f"{user_id}.xlsx")
+
+    def partition(self, user_id):
+        return ExcelGameStore(self.path(user_id))
+
+    def user_ids(self):
+        """Return the user id of every partition."""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-len(".xlsx")] for name in os.listdir(self.directory) if name.endswith(".xlsx"))
@@ -0,0 +1,73 @@
+"""Headless Flet page for measuring what the apps send to the client.
+
+``make_page()`` returns a real ``ft.Page`` wired to a connection that keeps
+no socket open. Every batch of commands is serialized exactly like the Flet
+socket server does it, and only the size of the resulting message is kept, so
+scripts can compare the wire cost of different UI strategies without a browser.
+"""
+import asyncio
+import json
+
+import flet as ft
+from flet.core.local_connection import LocalConnection
+from flet.core.pubsub.pubsub_hub import PubSubHub
+from flet.core.protocol import (
+    ClientActions,
+    ClientMessage,
+    CommandEncoder,
+    PageCommandResponsePayload,
+    PageCommandsBatchResponsePayload,
+)
+
+
+class HeadlessConnection(LocalConnection):
+    def __init__(self):
+        super().__init__()
+        self.bytes_sent = 0
+        self.messages_sent = 0
+        self.controls_added = 0
+
+    def reset_counters(self):
+        self.bytes_sent = 0
+        self.messages_sent = 0
+        self.controls_added = 0
+
+    def send_command(self, session_id, command):
+        result, message = self._process_command(command)
+        if message:
+            self._record(message)
+        return PageCommandResponsePayload(result=result, error="")
+
+    def send_commands(self, session_id, commands):
+        results = []
+        messages = []
+        for command in commands:
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if command.name == "add" and result:
+                self.controls_added += len(result.split(" "))
+            if message:
+                messages.append(message)
+        if len(messages) > 0:
+            self._record(ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def _record(self, message):
+        payload = json.dumps(message, cls=CommandEncoder, separators=(",", ":"))
+        self.bytes_sent += len(payload.encode("utf-8"))
+        self.messages_sent += 1
+
+
+def make_page(session_id="headless", loop=None, pubsubhub=None):
+    """Create a page that can be passed to an app's ``main(page)``.
+
+    Pages given the same ``loop`` and ``pubsubhub`` share them like the
+    sessions of a Flet web server do.
+    """
+    conn = HeadlessConnection()
+    loop = loop or asyncio.new_event_loop()
+    conn.pubsubhub = pubsubhub or PubSubHub(loop)
+    page = ft.Page(conn, session_id, loop=loop)
+    conn.sessions[session_id] = page
+    return page, conn
@@ -0,0 +1,65 @@
+"""Deferred imports for the heavy analytics libraries.
+
+``lazy_import("polars")`` returns a stand-in module that imports polars the
+first time one of its attributes is used, so ``pl.col(...)`` keeps working
+while the app starts with only flet and the standard library loaded.
+``warm_up()`` does that work on a background thread after the first frame is
+on screen, so the first click on Statistics usually finds it already done.
+"""
+import importlib
+import threading
+import traceback
+import types
+
+
+class LazyModule(types.ModuleType):
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def loaded(self):
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+def warm_up(*steps):
+    """Run ``steps`` (lazy modules or callables) in order on a daemon thread.
+
+    Modules that are already loaded are skipped, so every Flet session can
+    call this without paying for the imports twice.
+    """
+    pending = [step for step in steps if not (isinstance(step, LazyModule) and step.loaded)]
+    if not pending:
+        return None
+
+    def run():
+        for step in pending:
+            try:
+                if isinstance(step, LazyModule):
+                    step.load()
+                else:
+                    step()
+            except Exception:
+                traceback.print_exc()
+
+    thread = threading.Thread(target=run, name="rps-warm-up", daemon=True)
+    thread.start()
+    return thread
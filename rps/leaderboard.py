@@ -0,0 +1,273 @@
+"""Player rankings kept up to date one game at a time.
+
+``Leaderboard`` keeps every player's totals and streaks, and one
+``RankIndex`` per ranking: win rate, total wins and longest winning
+streak. A game moves its player within each index, so recording a game,
+looking up a player's rank and reading the top k all take O(log n) for n
+players (plus k for the top k), however long the history is.
+
+Like ``SessionIndex``, it is built on first use with ``load_games()``, the
+``(user, outcome)`` of every game with each player's games in the order
+they were played, and then kept up to date with ``extend()`` as a player's
+games are written to their partition. Games without a user are skipped.
+
+    board = Leaderboard(lambda: ((user, outcome) for user in users for outcome in outcomes(user)))
+    board.extend(user, first_row, [engine.WIN, ...])
+    board.top("wins", 10)
+    board.rank("wins", user)
+"""
+import itertools
+import random
+import threading
+
+from rps import engine
+
+# Players need this many games to be ranked by win rate
+MIN_RANKED_GAMES = 10
+
+RANKINGS = {
+    "win_rate": "Win rate",
+    "wins": "Total wins",
+    "best_streak": "Longest streak",
+}
+
+
+class PlayerStats:
+    __slots__ = ("user", "games", "wins", "losses", "ties", "streak", "best_streak")
+
+    def __init__(self, user):
+        self.user = user
+        self.games = self.wins = self.losses = self.ties = 0
+        self.streak = self.best_streak = 0
+
+    @property
+    def win_rate(self):
+        return self.wins / self.games * 100 if self.games else 0.0
+
+    def record(self, outcome):
+        self.games += 1
+        if outcome == engine.WIN:
+            self.wins += 1
+            self.streak += 1
+            self.best_streak = max(self.best_streak, self.streak)
+        else:
+            self.streak = 0
+            if outcome == engine.LOSS:
+                self.losses += 1
+            else:
+                self.ties += 1
+
+    def sort_key(self, ranking):
+        """Key that sorts the best player first, or None if not ranked."""
+        if ranking == "win_rate":
+            if self.games < MIN_RANKED_GAMES:
+                return None
+            # More games wins a tie
+            return (-self.wins / self.games, -self.games, self.user)
+        if ranking == "wins":
+            return (-self.wins, self.games, self.user)
+        return (-self.best_streak, -self.wins, self.user)
+
+    def as_dict(self):
+        return {"user": self.user, "games": self.games, "wins": self.wins, "losses": self.losses,
+                "ties": self.ties, "win_rate": self.win_rate, "best_streak": self.best_streak}
+
+
+class _Node:
+    __slots__ = ("key", "priority", "left", "right", "size")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.left = self.right = None
+        self.size = 1
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _split(node, key):
+    """Split into the keys below ``key`` and the rest."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        node.size = 1 + _size(node.left) + _size(node.right)
+        return node, right
+    left, node.left = _split(node.left, key)
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return left, node
+
+
+def _merge(left, right):
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.size = 1 + _size(left.left) + _size(left.right)
+        return left
+    right.left = _merge(left, right.left)
+    right.size = 1 + _size(right.left) + _size(right.right)
+    return right
+
+
+class RankIndex:
+    """Sorted set of unique keys with positions, a treap sized per subtree.
+
+    ``add``, ``discard`` and ``rank`` take O(log n) on average and
+    ``first(k)`` O(log n + k).
+    """
+
+    def __init__(self, seed=0):
+        self._root = None
+        self._random = random.Random(seed)
+
+    def __len__(self):
+        return _size(self._root)
+
+    def fill(self, keys):
+        """Replace the contents with ``keys``, sorted and unique, in O(n)."""
+        levels = []
+
+        def build(start, stop, depth):
+            if start >= stop:
+                return None
+            middle = (start + stop) // 2
+            node = _Node(keys[middle], 0.0)
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(node)
+            node.left = build(start, middle, depth + 1)
+            node.right = build(middle + 1, stop, depth + 1)
+            node.size = stop - start
+            return node
+
+        self._root = build(0, len(keys), 0)
+        # Random priorities, the highest at the top so the heap order holds
+        priorities = sorted((self._random.random() for _ in keys), reverse=True)
+        for node, priority in zip((node for level in levels for node in level), priorities):
+            node.priority = priority
+
+    def add(self, key):
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key, self._random.random())), right)
+
+    def discard(self, key):
+        left, right = _split(self._root, key)
+        # The smallest key of ``right`` is ``key`` if it is in the set
+        node, parent = right, None
+        while node is not None and node.left is not None:
+            parent, node = node, node.left
+        if node is not None and node.key == key:
+            if parent is None:
+                right = node.right
+            else:
+                # Every node on the way down loses one key below it
+                walk = right
+                while walk is not node:
+                    walk.size -= 1
+                    walk = walk.left
+                parent.left = node.right
+        self._root = _merge(left, right)
+
+    def rank(self, key):
+        """Return the number of keys below ``key``."""
+        node, below = self._root, 0
+        while node is not None:
+            if node.key < key:
+                below += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return below
+
+    def first(self, k):
+        """Return the ``k`` smallest keys in order."""
+        keys, stack, node = [], [], self._root
+        while (stack or node is not None) and len(keys) < k:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                keys.append(node.key)
+                node = node.right
+        return keys
+
+
+class Leaderboard:
+    def __init__(self, load_games):
+        self._load_games = load_games
+        self.players = {}
+        self._indexes = {ranking: RankIndex(seed) for seed, ranking in enumerate(RANKINGS)}
+        self._seeded = False
+        self._lock = threading.Lock()
+
+    def _seed(self):
+        if not self._seeded:
+            # Totals first, then every index is built in one go
+            for user, outcome in self._load_games():
+                if user:
+                    self._record(user, outcome, indexed=False)
+            for ranking, index in self._indexes.items():
+                index.fill(sorted(key for key in (stats.sort_key(ranking) for stats in self.players.values())
+                                  if key is not None))
+            self._seeded = True
+
+    def _record(self, user, outcome, indexed=True):
+        stats = self.players.get(user)
+        if not indexed:
+            if stats is None:
+                stats = self.players[user] = PlayerStats(user)
+            stats.record(outcome)
+            return
+        if stats is None:
+            # Not in any index yet
+            stats = self.players[user] = PlayerStats(user)
+            old_keys = [(index, None) for index in self._indexes.values()]
+        else:
+            old_keys = [(index, stats.sort_key(ranking)) for ranking, index in self._indexes.items()]
+        stats.record(outcome)
+        for (index, old_key), ranking in zip(old_keys, self._indexes):
+            new_key = stats.sort_key(ranking)
+            if new_key != old_key:
+                if old_key is not None:
+                    index.discard(old_key)
+                index.add(new_key)
+
+    def extend(self, user, first_row, outcomes):
+        """Add the outcomes of ``user``'s games written from row ``first_row`` of their partition on."""
+        with self._lock:
+            if not self._seeded or not user:
+                return
+            # Games the board already has are skipped, a player's row count
+            # is their number of games
+            stats = self.players.get(user)
+            skip = max(0, (stats.games if stats else 0) - first_row)
+            for outcome in itertools.islice(outcomes, skip, None):
+                self._record(user, outcome)
+
+    def top(self, ranking, k):
+        """Return the stats of the ``k`` best players in a ranking, best first."""
+        with self._lock:
+            self._seed()
+            return [self.players[key[-1]].as_dict() for key in self._indexes[ranking].first(k)]
+
+    def rank(self, ranking, user):
+        """Return the 1-based rank of a player and the number ranked.
+
+        The rank is None for players who are not ranked yet.
+        """
+        with self._lock:
+            self._seed()
+            index = self._indexes[ranking]
+            stats = self.players.get(user)
+            key = stats.sort_key(ranking) if stats else None
+            return (None if key is None else index.rank(key) + 1), len(index)
+
+    def stats(self, user):
+        with self._lock:
+            self._seed()
+            stats = self.players.get(user)
+            return stats.as_dict() if stats else PlayerStats(user).as_dict()
@@ -0,0 +1,101 @@
+"""Leaderboard view: the best players in a ranking and the current player's rank.
+
+    board_view = LeaderboardView(leaderboard, lambda: user_id, updates.request, profiles.name)
+    page.add(board_view.control)
+    await board_view.refresh()
+
+The rows are built once, ``TOP_PLAYERS`` of them, and a refresh only
+changes their bound values. Players are shown with ``display_name(user)``,
+their id by default. Reading the board seeds it from the game data
+on first use, so that runs in a worker thread.
+"""
+import asyncio
+
+import flet as ft
+
+from rps.leaderboard import MIN_RANKED_GAMES, RANKINGS
+from rps.viewmodel import ViewModel
+
+TOP_PLAYERS = 10
+
+RANK_COLORS = {1: ft.Colors.AMBER_700, 2: ft.Colors.BLUE_GREY_400, 3: ft.Colors.BROWN_400}
+
+
+def ranking_value(ranking, player):
+    if ranking == "win_rate":
+        return f"{player['win_rate']:.1f}%"
+    if ranking == "wins":
+        return f"{player['wins']} wins"
+    return f"{player['best_streak']} in a row"
+
+
+class LeaderboardView:
+    def __init__(self, leaderboard, current_user, request_update, display_name=str):
+        self.leaderboard = leaderboard
+        self.current_user = current_user
+        self.request_update = request_update
+        self.display_name = display_name
+        self.ranking = "win_rate"
+
+        self.vm = ViewModel()
+        self.ranking_dropdown = ft.Dropdown(
+            label="Rank by",
+            value=self.ranking,
+            options=[ft.dropdown.Option(key, label) for key, label in RANKINGS.items()],
+            on_change=self.on_ranking_change,
+            width=250,
+        )
+        self.rows = []
+        for i in range(TOP_PLAYERS):
+            row = ft.Container(
+                content=ft.Row([
+                    ft.Text(f"#{i + 1}", width=50, weight=ft.FontWeight.BOLD, color=RANK_COLORS.get(i + 1)),
+                    self.vm.bind(f"user_{i}", ft.Text(expand=True)),
+                    self.vm.bind(f"value_{i}", ft.Text(width=120, weight=ft.FontWeight.BOLD)),
+                    self.vm.bind(f"games_{i}", ft.Text(width=100), format="{} games"),
+                ]),
+                padding=ft.padding.symmetric(vertical=8, horizontal=15),
+                border=ft.border.only(bottom=ft.BorderSide(1, ft.Colors.GREY_300)),
+                visible=False,
+            )
+            self.vm.bind(f"shown_{i}", row, "visible")
+            self.vm.bind(f"highlight_{i}", row, "bgcolor")
+            self.rows.append(row)
+        self.control = ft.Column([
+            self.ranking_dropdown,
+            self.vm.bind("my_rank", ft.Text(size=18, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700)),
+            self.vm.bind("empty", ft.Text("No ranked players yet", italic=True), "visible"),
+            ft.Column(self.rows, spacing=0),
+        ], spacing=15, scroll=ft.ScrollMode.AUTO)
+
+    def read_board(self, user):
+        top = self.leaderboard.top(self.ranking, TOP_PLAYERS)
+        rank, ranked = self.leaderboard.rank(self.ranking, user)
+        return top, rank, ranked
+
+    async def refresh(self):
+        user = self.current_user()
+        top, rank, ranked = await asyncio.to_thread(self.read_board, user)
+        values = {"empty": not top}
+        for i in range(TOP_PLAYERS):
+            player = top[i] if i < len(top) else None
+            values[f"shown_{i}"] = player is not None
+            if player is not None:
+                values.update({
+                    f"user_{i}": self.display_name(player["user"]),
+                    f"value_{i}": ranking_value(self.ranking, player),
+                    f"games_{i}": player["games"],
+                    f"highlight_{i}": ft.Colors.BLUE_50 if player["user"] == user else None,
+                })
+        name = self.display_name(user)
+        if rank is None:
+            needs = f", {MIN_RANKED_GAMES} games are needed" if self.ranking == "win_rate" else ""
+            values["my_rank"] = f"{name}: not ranked yet{needs}"
+        else:
+            values["my_rank"] = f"{name}: #{rank} of {ranked}"
+        self.vm.update(**values)
+        self.request_update()
+
+    async def on_ranking_change(self, e):
+        self.ranking = e.control.value
+        await self.refresh()
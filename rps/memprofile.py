@@ -0,0 +1,254 @@
+"""Memory profiling for long-running sessions.
+
+``RPS_MEMPROFILE=1`` starts ``tracemalloc`` when the module is imported,
+and a background thread that takes a snapshot every
+``RPS_MEMPROFILE_INTERVAL`` seconds (default 60) and once more at exit.
+``enable()`` does the same from code. Each snapshot is written to
+``RPS_MEMPROFILE_DIR`` (default ``memprofile``):
+
+- ``snapshot-0001.txt``, ... with the process and traced memory, the sizes
+  of the dataframes, and the lines that allocated the most since the
+  previous snapshot and since the first one
+- ``memory.jsonl`` with one line of totals per snapshot, to plot the growth
+  over a session
+
+Allocations are grouped twice: by the line that made them, often inside
+a library, and by the innermost line of the apps' own code on their
+stack (anything outside Python's and the installed packages' files),
+which is usually the one to fix. Only ``RPS_MEMPROFILE_FRAMES`` frames of
+the stack are kept (default 1), so with the default the second grouping
+only has the allocations made by the apps' own lines.
+
+Polars keeps its data outside the Python heap, where ``tracemalloc`` can't
+see it, so dataframes are measured on their own. ``watch()`` registers
+a long-lived frame, read at every snapshot. ``frame()`` notes the size of
+a frame built on the fly, such as one read for a view.
+
+    memprofile.watch("df", lambda: df)
+    memprofile.frame("stats.history", history_df)
+
+Tracing slows every allocation down, so this is off by default. Then
+``frame()`` is only a flag check. The Advanced app's saves, which build
+a whole workbook with openpyxl, take about 4 times as long traced with
+one frame and 30 times with ten.
+"""
+import atexit
+import json
+import linecache
+import os
+import sysconfig
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+from rps.metrics import rss_bytes
+
+DEFAULT_DIR = "memprofile"
+DEFAULT_INTERVAL = 60.0
+# Allocations listed per table, and stack frames kept per allocation
+TOP = 20
+FRAMES = int(os.environ.get("RPS_MEMPROFILE_FRAMES", "1"))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIBRARY_PATHS = tuple({sysconfig.get_paths()[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")})
+
+enabled = False
+_watched = {}
+# name -> (rows, bytes, chunks, copies, largest bytes) of the frames noted with frame()
+_frames = {}
+_lock = threading.Lock()
+
+
+def frame_size(data):
+    """Return ``(rows, bytes, chunks)`` of a polars or pandas frame, chunks None for pandas."""
+    if hasattr(data, "estimated_size"):
+        return data.height, data.estimated_size(), data.n_chunks()
+    return len(data), int(data.memory_usage(index=True, deep=True).sum()), None
+
+
+def watch(name, get_frame):
+    """Read the frame returned by ``get_frame()`` (None for none) at every snapshot."""
+    _watched[name] = get_frame
+
+
+def frame(name, data):
+    """Note the size of a frame that was just built."""
+    if not enabled or data is None:
+        return
+    rows, size, chunks = frame_size(data)
+    with _lock:
+        _, _, _, copies, largest = _frames.get(name, (0, 0, None, 0, 0))
+        _frames[name] = (rows, size, chunks, copies + 1, max(largest, size))
+
+
+def _is_app_code(filename):
+    return not filename.startswith(LIBRARY_PATHS) and not filename.startswith("<")
+
+
+def _group(snapshot):
+    """Return ``(by line, by app line)``, each ``{(file, line): [bytes, blocks]}``."""
+    by_line, by_app_line = {}, {}
+    for trace in snapshot.traces:
+        # Innermost frame first
+        frames = trace.traceback[::-1]
+        key = (frames[0].filename, frames[0].lineno)
+        totals = by_line.setdefault(key, [0, 0])
+        totals[0] += trace.size
+        totals[1] += 1
+        for f in frames:
+            if _is_app_code(f.filename):
+                totals = by_app_line.setdefault((f.filename, f.lineno), [0, 0])
+                totals[0] += trace.size
+                totals[1] += 1
+                break
+    return by_line, by_app_line
+
+
+def _growth(now, before):
+    """Return ``(bytes, blocks, file, line)`` for every line, most grown first."""
+    changes = []
+    for key in now.keys() | before.keys():
+        size, count = now.get(key, (0, 0))
+        old_size, old_count = before.get(key, (0, 0))
+        if size != old_size:
+            changes.append((size - old_size, count - old_count) + key)
+    changes.sort(reverse=True)
+    return changes
+
+
+def _mb(size):
+    return f"{size / 2**20:.1f} MB"
+
+
+def _signed_mb(size):
+    return f"{size / 2**20:+.2f} MB"
+
+
+class Profiler:
+    def __init__(self, directory, interval, top=TOP):
+        self.directory = directory
+        self.interval = interval
+        self.top = top
+        self.number = 0
+        self.first = None
+        self.previous = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def start(self):
+        threading.Thread(target=self._run, name="rps-memprofile", daemon=True).start()
+        atexit.register(self.snapshot)
+
+    def _run(self):
+        while True:
+            try:
+                self.snapshot()
+            except Exception as e:
+                print(f"Error writing memory profile: {e}")
+            time.sleep(self.interval)
+
+    def _frames(self):
+        frames = {}
+        for name, get_frame in list(_watched.items()):
+            try:
+                data = get_frame()
+            except Exception:
+                data = None
+            if data is not None:
+                rows, size, chunks = frame_size(data)
+                frames[name] = {"rows": rows, "bytes": size, "chunks": chunks}
+        with _lock:
+            for name, (rows, size, chunks, copies, largest) in _frames.items():
+                frames[name] = {"rows": rows, "bytes": size, "chunks": chunks,
+                                "copies": copies, "largest_bytes": largest}
+        return frames
+
+    def snapshot(self):
+        """Take a snapshot, write its report and return the report's path."""
+        with self._lock:
+            self.number += 1
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            state = {
+                "snapshot": self.number,
+                "time": time.time(),
+                "rss_bytes": rss_bytes(),
+                "traced_bytes": traced,
+                "traced_peak_bytes": traced_peak,
+                "frames": self._frames(),
+            }
+            groups = _group(tracemalloc.take_snapshot().filter_traces([
+                # The profiler's own allocations, wherever they are on the stack
+                tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+                tracemalloc.Filter(False, __file__, all_frames=True),
+                # Source lines cached for the reports
+                tracemalloc.Filter(False, linecache.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ]))
+            if self.first is None:
+                self.first = (state, groups)
+            previous = self.previous
+            self.previous = (state, groups)
+
+            path = os.path.join(self.directory, f"snapshot-{self.number:04d}.txt")
+            with open(path, "w") as f:
+                f.write(self._report(state, groups, previous))
+            with open(os.path.join(self.directory, "memory.jsonl"), "a") as f:
+                f.write(json.dumps(state) + "\n")
+            return path
+
+    def _report(self, state, groups, previous):
+        first_state, first_groups = self.first
+        when = datetime.fromtimestamp(state["time"]).strftime("%Y-%m-%d %H:%M:%S")
+        lines = [
+            f"Snapshot {state['snapshot']} at {when}, {state['time'] - first_state['time']:.0f} s after the first",
+        ]
+        if state["rss_bytes"] is not None and first_state["rss_bytes"] is not None:
+            lines.append(f"Process memory: {_mb(state['rss_bytes'])} "
+                         f"({_signed_mb(state['rss_bytes'] - first_state['rss_bytes'])} since the first)")
+        lines.append(f"Traced memory: {_mb(state['traced_bytes'])}, peak {_mb(state['traced_peak_bytes'])} "
+                     f"({_signed_mb(state['traced_bytes'] - first_state['traced_bytes'])} since the first)")
+
+        if state["frames"]:
+            lines += ["", f"{'Dataframes':<24}{'rows':>12}{'size':>12}{'chunks':>8}{'copies':>8}{'largest':>12}"]
+            for name, f in sorted(state["frames"].items()):
+                lines.append(f"{name:<24}{f['rows']:>12,}{_mb(f['bytes']):>12}"
+                             f"{'-' if f['chunks'] is None else f['chunks']:>8}{f.get('copies', '-'):>8}"
+                             f"{_mb(f['largest_bytes']) if 'largest_bytes' in f else '-':>12}")
+
+        # Growth since the previous snapshot, and since the first one after that
+        earlier = [previous] if previous else []
+        if previous and previous is not self.first:
+            earlier.append(self.first)
+        for title, index in (("lines", 0), ("app lines", 1)):
+            for before_state, before in earlier:
+                lines += ["", f"Top {self.top} {title} since snapshot {before_state['snapshot']}"]
+                for size, count, filename, lineno in _growth(groups[index], before[index])[:self.top]:
+                    name = os.path.relpath(filename, ROOT) if filename.startswith(ROOT) else filename
+                    lines.append(f"{_signed_mb(size):>12} {count:+9,} blocks  {name}:{lineno}")
+                    source = linecache.getline(filename, lineno).strip()
+                    if source:
+                        lines.append(f"{'':>31}{source}")
+        return "\n".join(lines) + "\n"
+
+
+profiler = None
+
+
+def enable(directory=DEFAULT_DIR, interval=DEFAULT_INTERVAL, top=TOP, frames=FRAMES):
+    """Start tracing and write a snapshot report to ``directory`` every ``interval`` seconds."""
+    global enabled, profiler
+    if enabled:
+        return profiler
+    enabled = True
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    profiler = Profiler(directory, interval, top)
+    profiler.start()
+    return profiler
+
+
+if os.environ.get("RPS_MEMPROFILE", "") not in ("", "0"):
+    enable(os.environ.get("RPS_MEMPROFILE_DIR", DEFAULT_DIR),
+           float(os.environ.get("RPS_MEMPROFILE_INTERVAL", DEFAULT_INTERVAL)))
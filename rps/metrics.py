@@ -0,0 +1,255 @@
+"""Timing spans around the phases of a move and of the view refreshes.
+
+    with metrics.span("move.rng"):
+        computer_choice = opponent.choose()
+
+    @metrics.timed("view.stats")
+    async def update_stats_view(): ...
+
+Every span name gets a histogram of its durations, in seconds, plus its
+last ``RECENT`` durations for percentiles. Spans are off by default:
+``span()`` then hands back one shared do-nothing context manager, so the
+instrumented code only pays for a flag check.
+
+``RPS_METRICS=1`` turns them on when the module is imported and starts
+both exporters, ``enable()`` does the same from code:
+
+- Prometheus text at ``http://127.0.0.1:<RPS_METRICS_PORT>/metrics``
+  (default 9464, ``0`` for no endpoint)
+- one JSON line per span appended to ``RPS_METRICS_FILE`` (default
+  ``rps_metrics.jsonl``), rotated at ``RPS_METRICS_MAX_MB`` (default 10)
+  with 3 older files kept
+
+Lines are written by a background thread, a span only queues its record.
+"""
+import asyncio
+import bisect
+import collections
+import functools
+import json
+import os
+import queue
+import threading
+import time
+
+# Upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RECENT = 1000
+
+DEFAULT_PORT = 9464
+DEFAULT_FILE = "rps_metrics.jsonl"
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.recent = collections.deque(maxlen=RECENT)
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+        self.recent.append(seconds)
+
+
+enabled = False
+histograms = {}
+_lock = threading.Lock()
+_records = None
+
+
+def record(name, seconds, started=None):
+    with _lock:
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = Histogram()
+        histogram.observe(seconds)
+    if _records is not None:
+        _records.put((name, time.time() if started is None else started, seconds))
+
+
+class _Span:
+    __slots__ = ("name", "started", "wall")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.time()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.started, self.wall)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name):
+    """Time the block under ``name`` if spans are on."""
+    if not enabled:
+        return _NO_SPAN
+    return _Span(name)
+
+
+def timed(name):
+    """Decorator that wraps every call of a function, ``async`` or not, in a span."""
+    def decorate(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with span(name):
+                    return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """Return ``{name: (bucket counts, sum, count, recent durations)}`` for every span."""
+    with _lock:
+        return {name: (list(h.counts), h.sum, h.count, list(h.recent)) for name, h in histograms.items()}
+
+
+def percentiles(name, ps=(50, 95, 99)):
+    """Return the percentiles of a span's recent durations, or None if it has none."""
+    with _lock:
+        histogram = histograms.get(name)
+        recent = list(histogram.recent) if histogram is not None else None
+    if not recent:
+        return None
+    recent.sort()
+    return tuple(recent[min(len(recent) - 1, int(p / 100 * len(recent)))] for p in ps)
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_bytes():
+    """Return the resident memory of the process, or None where it can't be read.
+
+    Only ``/proc`` gives the current figure. ``resource`` elsewhere only has
+    the peak, which would hide memory given back.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def prometheus_text():
+    lines = [
+        "# HELP rps_span_seconds Duration of the instrumented phases.",
+        "# TYPE rps_span_seconds histogram",
+    ]
+    for name, (counts, total, count, _) in sorted(snapshot().items()):
+        cumulative = 0
+        for bound, bucket in zip(BUCKETS + (None,), counts):
+            cumulative += bucket
+            le = "+Inf" if bound is None else repr(bound)
+            lines.append(f'rps_span_seconds_bucket{{span="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'rps_span_seconds_sum{{span="{name}"}} {total}')
+        lines.append(f'rps_span_seconds_count{{span="{name}"}} {count}')
+    return "\n".join(lines) + "\n"
+
+
+def serve(port, host="127.0.0.1"):
+    """Serve ``/metrics`` on a daemon thread and return the server."""
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="rps-metrics-http", daemon=True).start()
+    return server
+
+
+class JsonlWriter:
+    """Appends queued span records to a file, rotated at ``max_bytes``."""
+
+    def __init__(self, path, max_bytes, backups=3, interval=1.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.interval = interval
+        self.queue = queue.SimpleQueue()
+        threading.Thread(target=self._run, name="rps-metrics-file", daemon=True).start()
+
+    def _rotate(self):
+        for number in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{number}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{number + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            lines = []
+            while not self.queue.empty():
+                name, started, seconds = self.queue.get()
+                lines.append(f'{{"ts": {started:.6f}, "span": {json.dumps(name)}, "ms": {seconds * 1e3:.3f}}}')
+            if not lines:
+                continue
+            try:
+                if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                    self._rotate()
+                with open(self.path, "a") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                print(f"Error writing metrics: {e}")
+
+
+def enable(port=DEFAULT_PORT, path=DEFAULT_FILE, max_mb=10):
+    """Turn spans on, serve them on ``port`` and log them to ``path`` (None for neither)."""
+    global enabled, _records
+    with _lock:
+        if enabled:
+            return
+        enabled = True
+    if path:
+        _records = JsonlWriter(path, int(max_mb * 2**20)).queue
+    if port:
+        try:
+            serve(port)
+        except OSError as e:
+            # Another session or app already serves the port
+            print(f"Metrics endpoint not started on port {port}: {e}")
+
+
+if os.environ.get("RPS_METRICS", "") not in ("", "0"):
+    enable(int(os.environ.get("RPS_METRICS_PORT", DEFAULT_PORT)),
+           os.environ.get("RPS_METRICS_FILE", DEFAULT_FILE),
+           float(os.environ.get("RPS_METRICS_MAX_MB", "10")))
@@ -0,0 +1,38 @@
+"""Icons and button colors for the moves of every rule set in ``rps.engine``.
+
+Moves without an icon of their own get ``DEFAULT_ICON``, so a rule set from
+a JSON file still gets a full row of buttons.
+"""
+import flet as ft
+
+MOVE_ICONS = {
+    "rock": ft.Icons.SPORTS_HANDBALL,
+    "paper": ft.Icons.INSERT_DRIVE_FILE,
+    "scissors": ft.Icons.CONTENT_CUT,
+    "lizard": ft.Icons.PEST_CONTROL,
+    "spock": ft.Icons.FRONT_HAND,
+    "fire": ft.Icons.LOCAL_FIRE_DEPARTMENT,
+    "water": ft.Icons.WATER_DROP,
+    "air": ft.Icons.AIR,
+    "sponge": ft.Icons.BUBBLE_CHART,
+    "gun": ft.Icons.GPS_FIXED,
+    "lightning": ft.Icons.BOLT,
+    "devil": ft.Icons.MOOD_BAD,
+    "dragon": ft.Icons.WHATSHOT,
+    "wolf": ft.Icons.PETS,
+    "tree": ft.Icons.PARK,
+    "human": ft.Icons.PERSON,
+    "snake": ft.Icons.GESTURE,
+}
+DEFAULT_ICON = ft.Icons.CIRCLE_OUTLINED
+
+# Background of the choice buttons, in move order
+BUTTON_COLORS = [ft.Colors.BLUE_50, ft.Colors.GREEN_50, ft.Colors.ORANGE_50, ft.Colors.PURPLE_50, ft.Colors.TEAL_50]
+
+
+def move_icon(move):
+    return MOVE_ICONS.get(move, DEFAULT_ICON)
+
+
+def button_color(index):
+    return BUTTON_COLORS[index % len(BUTTON_COLORS)]
@@ -0,0 +1,205 @@
+"""Matches between two players in different sessions of one server.
+
+The ``Lobby`` is shared by every session of the process. It pairs players
+in the order they ask for a match and referees their matches: a move is
+kept hidden until both players have committed theirs for the round, then
+the round is resolved with the rule set and announced.
+
+Messages go through Flet's pubsub on narrow topics. Each player listens on
+its own topic for being matched, and everything about a match is sent on
+that match's topic, which only its two players and its spectators
+subscribe to. Other sessions never see it.
+
+    lobby = Lobby()  # module level
+    client = MatchClient(lobby, page.pubsub, player_id, name, on_message)
+    client.find_match()   # on_message({"type": "matched", ...}) follows
+    client.commit("rock")
+
+Messages are dicts with a ``type``:
+
+- ``waiting``: queued for an opponent.
+- ``matched``: ``match``, ``seat`` (0 or 1), the players' ``names`` and
+  whether the opponent has already moved (``opponent_moved``).
+- ``committed``: the player in ``seat`` has moved in ``round``.
+- ``round``: ``round``, both ``moves``, the ``outcome`` coded as in
+  ``rps.engine`` from seat 0's side and the match ``score`` as
+  ``[ties, seat 0 wins, seat 1 wins]``.
+- ``ended``: the player in ``seat`` left the match.
+
+``on_message`` must be a coroutine function; pubsub runs it on the page's
+event loop.
+"""
+import itertools
+import threading
+
+from rps import engine
+
+
+def player_topic(player_id):
+    return f"rps/player/{player_id}"
+
+
+def match_topic(match_id):
+    return f"rps/match/{match_id}"
+
+
+def outcome_for(seat, outcome):
+    """Turn an outcome from seat 0's side into the outcome for ``seat``."""
+    return outcome if seat == 0 else (engine.TIE, engine.LOSS, engine.WIN)[outcome]
+
+
+class Match:
+    def __init__(self, match_id, players, names):
+        self.match_id = match_id
+        self.players = players
+        self.names = names
+        self.round = 0
+        self.moves = [None, None]
+        self.score = [0, 0, 0]
+        self.lock = threading.Lock()
+
+    def summary(self):
+        return {"match": self.match_id, "names": list(self.names), "round": self.round,
+                "score": list(self.score)}
+
+
+class Lobby:
+    def __init__(self, rules=None):
+        self.rules = rules or engine.RULES
+        self._waiting = {}  # player id to name, in arrival order
+        self._matches = {}
+        self._player_matches = {}
+        self._match_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def enter(self, pubsub, player_id, name):
+        """Pair the player with the longest waiting one, or queue them."""
+        with self._lock:
+            if player_id in self._player_matches or player_id in self._waiting:
+                return
+            opponent_id = next(iter(self._waiting), None)
+            if opponent_id is None:
+                self._waiting[player_id] = name
+                match = None
+            else:
+                match = Match(f"m{next(self._match_ids)}", (opponent_id, player_id),
+                              (self._waiting.pop(opponent_id), name))
+                self._matches[match.match_id] = match
+                for seat_player in match.players:
+                    self._player_matches[seat_player] = match
+        if match is None:
+            pubsub.send_all_on_topic(player_topic(player_id), {"type": "waiting"})
+            return
+        for seat, seat_player in enumerate(match.players):
+            pubsub.send_all_on_topic(player_topic(seat_player), dict(match.summary(), type="matched", seat=seat))
+
+    def commit(self, pubsub, player_id, move):
+        """Commit the player's move for the current round.
+
+        Returns False if the player is not in a match or has already moved
+        this round.
+        """
+        match = self._player_matches.get(player_id)
+        if match is None:
+            return False
+        move = self.rules.move_index[move]
+        with match.lock:
+            seat = match.players.index(player_id)
+            if match.moves[seat] is not None:
+                return False
+            match.moves[seat] = move
+            if None in match.moves:
+                message = {"type": "committed", "match": match.match_id, "round": match.round, "seat": seat}
+            else:
+                outcome = self.rules.resolve(*match.moves)
+                match.score[outcome] += 1
+                message = dict(match.summary(), type="round", outcome=outcome,
+                               moves=[self.rules.moves[m] for m in match.moves])
+                match.round += 1
+                match.moves = [None, None]
+            # Sent under the match lock so the players see the rounds in order
+            pubsub.send_all_on_topic(match_topic(match.match_id), message)
+        return True
+
+    def leave(self, pubsub, player_id):
+        """Take the player out of the queue or end their match."""
+        with self._lock:
+            self._waiting.pop(player_id, None)
+            match = self._player_matches.get(player_id)
+            if match is None:
+                return
+            for seat_player in match.players:
+                self._player_matches.pop(seat_player, None)
+            self._matches.pop(match.match_id, None)
+        pubsub.send_all_on_topic(match_topic(match.match_id),
+                                 {"type": "ended", "match": match.match_id,
+                                  "seat": match.players.index(player_id)})
+
+    def live_matches(self):
+        """Return a summary of every match being played."""
+        with self._lock:
+            matches = list(self._matches.values())
+        return [match.summary() for match in matches]
+
+    def match(self, match_id):
+        return self._matches.get(match_id)
+
+
+class MatchClient:
+    """One session's view of the lobby: its queue entry, match or match it watches."""
+
+    def __init__(self, lobby, pubsub, player_id, name, on_message):
+        self.lobby = lobby
+        self.pubsub = pubsub
+        self.player_id = player_id
+        self.name = name
+        self.on_message = on_message
+        self.match_id = None
+        self.seat = None
+        pubsub.subscribe_topic(player_topic(player_id), self._on_player_message)
+
+    def find_match(self):
+        self.stop_watching()
+        self.lobby.enter(self.pubsub, self.player_id, self.name)
+
+    def commit(self, move):
+        return self.lobby.commit(self.pubsub, self.player_id, move)
+
+    def leave(self):
+        self.lobby.leave(self.pubsub, self.player_id)
+
+    def watch(self, match_id):
+        """Spectate a match, return its summary or None if it is over."""
+        self.stop_watching()
+        match = self.lobby.match(match_id)
+        if match is None or self.player_id in match.players:
+            return None
+        self.match_id = match_id
+        self.pubsub.subscribe_topic(match_topic(match_id), self._on_match_message)
+        return match.summary()
+
+    def stop_watching(self):
+        if self.match_id is not None and self.seat is None:
+            self.pubsub.unsubscribe_topic(match_topic(self.match_id))
+            self.match_id = None
+
+    def close(self):
+        self.leave()
+        self.pubsub.unsubscribe_all()
+
+    async def _on_player_message(self, topic, message):
+        if message["type"] == "matched":
+            self.match_id = message["match"]
+            self.seat = message["seat"]
+            self.pubsub.subscribe_topic(match_topic(self.match_id), self._on_match_message)
+            # The opponent may have moved before this player was subscribed
+            match = self.lobby.match(self.match_id)
+            message = dict(message, opponent_moved=match is not None and match.moves[1 - self.seat] is not None)
+        await self.on_message(message)
+
+    async def _on_match_message(self, topic, message):
+        await self.on_message(message)
+        if message["type"] == "ended":
+            self.pubsub.unsubscribe_topic(topic)
+            self.match_id = None
+            self.seat = None
@@ -0,0 +1,140 @@
+"""Multiplayer view: find a human opponent, play rounds, or watch a match.
+
+    view = MultiplayerView(lobby, page.pubsub, player_id, "Player 1", updates.request)
+    page.add(view.control)
+    page.on_close = lambda e: view.close()
+
+Matchmaking and the rounds go through ``rps.multiplayer``. The controls
+are built once and messages only change the bound values.
+"""
+import flet as ft
+
+from rps import engine
+from rps.move_icons import move_icon
+from rps.multiplayer import MatchClient, outcome_for
+from rps.viewmodel import ViewModel
+
+OUTCOME_TEXT = {engine.WIN: "You win", engine.LOSS: "You lose", engine.TIE: "Tie"}
+OUTCOME_COLORS = {engine.WIN: ft.Colors.GREEN_700, engine.LOSS: ft.Colors.RED_700, engine.TIE: ft.Colors.BLUE_700}
+
+
+class MultiplayerView:
+    def __init__(self, lobby, pubsub, player_id, name, request_update):
+        self.lobby = lobby
+        self.request_update = request_update
+        self.client = MatchClient(lobby, pubsub, player_id, name, self.on_message)
+        self.names = None
+
+        self.vm = ViewModel()
+        self.name_field = ft.TextField(label="Your name", value=name, width=240)
+        self.move_buttons = [
+            ft.ElevatedButton(move.capitalize(), icon=move_icon(move), data=move, on_click=self.on_move)
+            for move in lobby.rules.moves
+        ]
+        for button in self.move_buttons:
+            self.vm.bind("can_move", button, "disabled", format=lambda can_move: not can_move)
+        self.match_dropdown = ft.Dropdown(label="Live matches", width=320)
+        result_text = self.vm.bind("result", ft.Text(size=18))
+        self.vm.bind("result_color", result_text, "color")
+        self.control = ft.Column([
+            ft.Text("Multiplayer", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+            ft.Row([
+                self.name_field,
+                ft.ElevatedButton("Find opponent", icon=ft.Icons.PERSON_SEARCH, on_click=self.on_find),
+                ft.TextButton("Leave", on_click=self.on_leave),
+            ], wrap=True),
+            self.vm.bind("status", ft.Text(size=16, weight=ft.FontWeight.BOLD)),
+            ft.Row(self.move_buttons, wrap=True),
+            self.vm.bind("opponent_status", ft.Text(size=14, italic=True)),
+            self.vm.bind("round", ft.Text(size=16)),
+            result_text,
+            self.vm.bind("score", ft.Text(size=20, weight=ft.FontWeight.BOLD)),
+            ft.Divider(),
+            ft.Row([self.match_dropdown, ft.ElevatedButton("Watch", icon=ft.Icons.VISIBILITY,
+                                                           on_click=self.on_watch)], wrap=True),
+        ], spacing=15, scroll=ft.ScrollMode.AUTO)
+        self.vm.update(status="Not in a match", can_move=False, opponent_status="", round="",
+                       result="", result_color=None, score="")
+
+    def refresh(self):
+        """Reload the live matches offered for watching."""
+        self.match_dropdown.options = [
+            ft.dropdown.Option(match["match"], f"{match['names'][0]} vs {match['names'][1]}, round {match['round'] + 1}")
+            for match in self.lobby.live_matches()
+        ]
+        self.request_update()
+
+    def close(self):
+        self.client.close()
+
+    def show_score(self, score):
+        ties, first, second = score
+        if self.client.seat is None:
+            self.vm.update(score=f"{self.names[0]}: {first}  |  {self.names[1]}: {second}  |  Ties: {ties}")
+        else:
+            mine, theirs = (first, second) if self.client.seat == 0 else (second, first)
+            self.vm.update(score=f"You: {mine}  |  Opponent: {theirs}  |  Ties: {ties}")
+
+    async def on_message(self, message):
+        kind = message["type"]
+        seat = self.client.seat
+        if kind == "waiting":
+            self.vm.update(status="Waiting for an opponent...", can_move=False)
+        elif kind == "matched":
+            self.names = message["names"]
+            self.vm.update(
+                status=f"Playing against {self.names[1 - seat]}",
+                can_move=True,
+                round="Round 1: make your move",
+                opponent_status=f"{self.names[1 - seat]} has moved" if message["opponent_moved"] else "",
+                result="",
+                result_color=None,
+            )
+            self.show_score(message["score"])
+        elif kind == "committed":
+            if message["seat"] != seat:
+                self.vm.update(opponent_status=f"{self.names[message['seat']]} has moved")
+        elif kind == "round":
+            first, second = message["moves"]
+            if seat is None:
+                winner = {engine.WIN: f"{self.names[0]} wins", engine.LOSS: f"{self.names[1]} wins",
+                          engine.TIE: "Tie"}[message["outcome"]]
+                self.vm.update(round=f"Round {message['round'] + 1}: {first.capitalize()} vs {second.capitalize()}",
+                               result=winner, result_color=None, opponent_status="")
+            else:
+                outcome = outcome_for(seat, message["outcome"])
+                mine, theirs = (first, second) if seat == 0 else (second, first)
+                self.vm.update(round=f"Round {message['round'] + 1}: {mine.capitalize()} vs {theirs.capitalize()}",
+                               result=OUTCOME_TEXT[outcome], result_color=OUTCOME_COLORS[outcome],
+                               opponent_status="", can_move=True)
+            self.show_score(message["score"])
+        elif kind == "ended":
+            if self.names is None:
+                return
+            left = "You" if message["seat"] == seat else self.names[message["seat"]]
+            self.vm.update(status=f"{left} left the match", can_move=False, opponent_status="")
+        self.request_update()
+
+    async def on_find(self, e):
+        self.client.name = self.name_field.value.strip() or self.client.name
+        self.client.find_match()
+
+    async def on_leave(self, e):
+        self.client.leave()
+
+    async def on_move(self, e):
+        if self.client.commit(e.control.data):
+            self.vm.update(can_move=False, round=f"You chose {e.control.data.capitalize()}, waiting for your opponent")
+            self.request_update()
+
+    async def on_watch(self, e):
+        summary = self.client.watch(self.match_dropdown.value)
+        if summary is None:
+            self.vm.update(status="That match is over")
+            self.refresh()
+            return
+        self.names = summary["names"]
+        self.vm.update(status=f"Watching {self.names[0]} vs {self.names[1]}", can_move=False,
+                       round=f"Round {summary['round'] + 1}", result="", result_color=None, opponent_status="")
+        self.show_score(summary["score"])
+        self.request_update()
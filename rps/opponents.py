@@ -0,0 +1,197 @@
+"""Computer opponents that learn from the player's moves.
+
+Every opponent predicts the player's next move and plays the move that
+beats it, or a random move while it has nothing to go on. ``choose()``
+returns the computer's move and ``observe(player, computer)`` feeds back
+the round that was played, both with the integer moves of the opponent's
+``rps.engine.RuleSet`` (``engine.RULES`` unless another is given).
+Both run in constant time with a fixed amount of memory, however long the
+game goes on.
+
+    opponent = make_opponent("markov", rng=SessionRandom(seed))
+    computer = opponent.choose()
+    opponent.observe(player, computer)
+
+``choose()`` takes exactly one draw from ``rng`` per move, so with a seeded
+``rps.rng.SessionRandom`` a whole session can be played again with
+``replay()``.
+"""
+import os
+import random
+
+from rps import engine
+from rps.rng import SessionRandom
+
+# Opponent used when none is picked, set RPS_OPPONENT to change it
+DEFAULT_OPPONENT = os.environ.get("RPS_OPPONENT", "random")
+
+
+def most_likely(counts):
+    """Return the index of the largest count, or None if there's no clear one."""
+    best = max(counts)
+    if best == 0 or counts.count(best) > 1:
+        return None
+    return counts.index(best)
+
+
+class Opponent:
+    name = "Random"
+
+    def __init__(self, rng=None, rules=None):
+        self.rng = rng or random.Random()
+        self.rules = rules or engine.RULES
+        self.moves = self.rules.size
+
+    def predict(self):
+        """Return the player's most likely next move, or None."""
+        return None
+
+    def observe(self, player, computer):
+        pass
+
+    def choose(self):
+        # Draw even when it isn't used, to keep one draw per move
+        fallback = self.rng.randrange(self.moves)
+        move = self.predict()
+        if move is None:
+            return fallback
+        return self.rules.counter_move(move)
+
+
+class FrequencyOpponent(Opponent):
+    """Expects the move the player has made most often."""
+
+    name = "Frequency"
+
+    def __init__(self, rng=None, rules=None):
+        super().__init__(rng, rules)
+        self.counts = [0] * self.moves
+
+    def predict(self):
+        return most_likely(self.counts)
+
+    def observe(self, player, computer):
+        self.counts[player] += 1
+
+
+class MarkovOpponent(Opponent):
+    """Expects the move that most often followed the player's last ``order`` moves."""
+
+    name = "Markov"
+
+    def __init__(self, order=2, rng=None, rules=None):
+        super().__init__(rng, rules)
+        self.order = order
+        self.contexts = self.moves ** order
+        # Next-move counts for every sequence of the last moves, indexed by
+        # the sequence read as a number in base ``moves``
+        self.counts = [[0] * self.moves for _ in range(self.contexts)]
+        self.context = 0
+        self.seen = 0
+
+    def predict(self):
+        if self.seen < self.order:
+            return None
+        return most_likely(self.counts[self.context])
+
+    def observe(self, player, computer):
+        if self.seen >= self.order:
+            self.counts[self.context][player] += 1
+        self.context = (self.context * self.moves + player) % self.contexts
+        self.seen += 1
+
+
+class WinStayLoseShiftOpponent(Opponent):
+    """Learns how the player changes their move after a win, loss or tie.
+
+    Many players repeat a winning move and switch after losing. Rather than
+    assuming that, this counts how far the player shifts (0 stay, or that
+    many moves on around the cycle) after each outcome and expects the most
+    common shift.
+    """
+
+    name = "Win-stay/lose-shift"
+
+    def __init__(self, rng=None, rules=None):
+        super().__init__(rng, rules)
+        self.shifts = [[0] * self.moves for _ in engine.OUTCOMES]
+        self.last_move = None
+        self.last_outcome = None
+
+    def predict(self):
+        if self.last_move is None:
+            return None
+        shift = most_likely(self.shifts[self.last_outcome])
+        if shift is None:
+            return None
+        return (self.last_move + shift) % self.moves
+
+    def observe(self, player, computer):
+        if self.last_move is not None:
+            self.shifts[self.last_outcome][(player - self.last_move) % self.moves] += 1
+        self.last_move = player
+        self.last_outcome = self.rules.resolve(player, computer)
+
+
+class EnsembleOpponent(Opponent):
+    """Follows whichever of its predictors has been right most often lately."""
+
+    name = "Ensemble"
+
+    # Older hits count for less, so the ensemble follows a player who
+    # changes their strategy
+    DECAY = 0.9
+
+    def __init__(self, rng=None, rules=None):
+        super().__init__(rng, rules)
+        self.predictors = [
+            FrequencyOpponent(self.rng, self.rules),
+            MarkovOpponent(1, self.rng, self.rules),
+            MarkovOpponent(2, self.rng, self.rules),
+            WinStayLoseShiftOpponent(self.rng, self.rules),
+        ]
+        self.scores = [0.0] * len(self.predictors)
+        self.predictions = [None] * len(self.predictors)
+
+    def predict(self):
+        self.predictions = [predictor.predict() for predictor in self.predictors]
+        best = max(range(len(self.predictors)), key=self.scores.__getitem__)
+        return self.predictions[best]
+
+    def observe(self, player, computer):
+        for i, predictor in enumerate(self.predictors):
+            self.scores[i] = self.scores[i] * self.DECAY + (self.predictions[i] == player)
+            predictor.observe(player, computer)
+
+
+OPPONENTS = {
+    "random": Opponent,
+    "frequency": FrequencyOpponent,
+    "markov": MarkovOpponent,
+    "wsls": WinStayLoseShiftOpponent,
+    "ensemble": EnsembleOpponent,
+}
+
+
+def make_opponent(name=None, rng=None, rules=None):
+    return OPPONENTS[name or DEFAULT_OPPONENT](rng=rng, rules=rules)
+
+
+def replay(seed, segments, player_moves, rules=None):
+    """Return the computer's moves in a recorded session.
+
+    ``segments`` lists ``(first_move, opponent)`` for every opponent the
+    session played, starting at move 0, as read from ``rps.rng.SessionLog``.
+    """
+    rules = rules or engine.RULES
+    rng = SessionRandom(seed, choices=rules.size)
+    starts = dict(segments)
+    opponent = None
+    computer_moves = []
+    for index, player in enumerate(player_moves):
+        if index in starts:
+            opponent = make_opponent(starts[index], rng, rules)
+        computer = opponent.choose()
+        opponent.observe(player, computer)
+        computer_moves.append(computer)
+    return computer_moves
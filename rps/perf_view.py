@@ -0,0 +1,140 @@
+"""Performance panel: live timings, memory and caches of a running app.
+
+The app supplies ``read_stats()``, a plain function returning a dict with
+``rows`` (games in memory), ``frame_bytes`` (size of the game dataframe),
+``pending_writes`` (games not yet in the data file), ``last_save`` (seconds
+the last save took, or None) and ``caches``, a list of ``(name, hits,
+lookups)``. The panel adds the process memory and the percentiles of the
+recent move spans from ``rps.metrics``.
+
+    panel = PerfPanel(read_stats, updates.request)
+    panel.open(page)
+
+Opening the panel turns span recording on if ``RPS_METRICS`` hasn't, so
+the timings cover the moves played from then on. While it is open, the
+panel refreshes every ``interval`` seconds. A refresh reads counters and
+sorts at most ``metrics.RECENT`` durations per span, and only changes the
+values of controls built once.
+"""
+import asyncio
+
+import flet as ft
+
+from rps import metrics
+from rps.viewmodel import ViewModel
+
+# Phases of a move, then the page update and the save that follow it
+SPANS = ["move", "move.rng", "move.resolve", "move.controls", "move.append", "page.update", "save.write"]
+PERCENTILES = (50, 95, 99)
+# Columns of the span table after the name, and their widths
+COLUMNS = [f"p{p}" for p in PERCENTILES] + ["count"]
+NAME_WIDTH, COLUMN_WIDTH = 130, 70
+
+
+def format_ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1e3:.2f}"
+
+
+def format_mb(size):
+    return "-" if size is None else f"{size / 2**20:.1f} MB"
+
+
+def format_rate(hits, lookups):
+    return f"{hits / lookups:.0%} of {lookups:,}" if lookups else "-"
+
+
+class PerfPanel:
+    def __init__(self, read_stats, request_update, interval=1.0):
+        self.read_stats = read_stats
+        self.request_update = request_update
+        self.interval = interval
+        self.page = None
+        self._timer = None
+
+        self.vm = ViewModel()
+        bold = ft.FontWeight.BOLD
+        header = ft.Row([ft.Text("span", width=NAME_WIDTH, weight=bold)]
+                        + [ft.Text(column, width=COLUMN_WIDTH, weight=bold) for column in COLUMNS])
+        span_rows = [
+            ft.Row([ft.Text(span, width=NAME_WIDTH)]
+                   + [self.vm.bind(f"{span}.{column}", ft.Text("-", width=COLUMN_WIDTH)) for column in COLUMNS])
+            for span in SPANS
+        ]
+        self.cache_rows = ft.Column(spacing=4)
+        self.dialog = ft.AlertDialog(
+            title=ft.Text("Performance"),
+            content=ft.Column([
+                ft.Text("Recent moves (ms)", size=16, weight=ft.FontWeight.BOLD),
+                header,
+                *span_rows,
+                ft.Divider(),
+                self.vm.bind("memory", ft.Text(), format="Process memory: {}"),
+                self.vm.bind("rows", ft.Text(), format="Games in memory: {:,}"),
+                self.vm.bind("frame", ft.Text(), format="Game data size: {}"),
+                self.vm.bind("pending", ft.Text(), format="Games waiting to be saved: {:,}"),
+                self.vm.bind("last_save", ft.Text(), format="Last save: {} ms"),
+                ft.Divider(),
+                ft.Text("Cache hits", size=16, weight=ft.FontWeight.BOLD),
+                self.cache_rows,
+            ], tight=True, spacing=6, scroll=ft.ScrollMode.AUTO, width=460),
+            actions=[ft.TextButton("Close", on_click=lambda e: self.close())],
+            on_dismiss=lambda e: self._stop(),
+        )
+
+    def open(self, page):
+        if not metrics.enabled:
+            metrics.enable(port=None, path=None)
+        self.page = page
+        self.refresh()
+        page.open(self.dialog)
+        if self._timer is None:
+            self._schedule()
+
+    def close(self):
+        self._stop()
+        if self.page is not None:
+            self.page.close(self.dialog)
+
+    def _stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self):
+        # A timer on the event loop rather than a task, so the refreshes
+        # run between events and nothing waits for them to finish
+        self._timer = asyncio.get_running_loop().call_later(self.interval, self._tick)
+
+    def _tick(self):
+        if not self.dialog.open:
+            self._timer = None
+            return
+        self.refresh()
+        self.request_update()
+        self._schedule()
+
+    def refresh(self):
+        values = {}
+        for span in SPANS:
+            histogram = metrics.histograms.get(span)
+            found = metrics.percentiles(span, PERCENTILES) or (None,) * len(PERCENTILES)
+            for p, seconds in zip(PERCENTILES, found):
+                values[f"{span}.p{p}"] = format_ms(seconds)
+            values[f"{span}.count"] = f"{histogram.count if histogram else 0:,}"
+
+        stats = self.read_stats()
+        self.vm.update(
+            memory=format_mb(metrics.rss_bytes()),
+            rows=stats["rows"],
+            frame=format_mb(stats["frame_bytes"]),
+            pending=stats["pending_writes"],
+            last_save=format_ms(stats["last_save"]),
+            **values,
+        )
+
+        caches = stats["caches"]
+        if len(self.cache_rows.controls) != len(caches):
+            self.cache_rows.controls = [ft.Text() for _ in caches]
+        for text, (name, hits, lookups) in zip(self.cache_rows.controls, caches):
+            text.value = f"{name}: {format_rate(hits, lookups)}"
+
@@ -0,0 +1,270 @@
+"""Headless HTTP/JSON API for playing from scripts and bots.
+
+    POST /play   {"move": "rock", "session": "bot-1", "opponent": "markov"}
+    GET  /stats  totals over all games, or ?session=bot-1 for one session
+
+``session`` and ``opponent`` are optional. Without a session id the server
+makes one up and returns it, and clients send it back to keep playing the
+same session. Every session has its own opponent and seeded
+``SessionRandom``, logged to the app's ``SessionLog`` like a UI session.
+Only the ``max_sessions`` most recently played sessions are kept in
+memory. A session id seen again after it was dropped starts a new
+session, with a new seed logged from move 0.
+
+The server is plain ``asyncio`` streams speaking HTTP/1.1 with keep-alive,
+so a client can play thousands of moves over one connection. Moves are
+answered from memory and saved by a single background task that hands
+every move played in the last ``flush_interval`` seconds to
+``save_games(games)`` as one batch, and once more on shutdown. A game is a
+``(timestamp, session_id, player_move, computer_move, outcome)`` tuple with
+move names and an ``rps.engine`` outcome code from the player's side.
+"""
+import asyncio
+import collections
+import datetime
+import itertools
+import json
+import logging
+import signal
+import urllib.parse
+
+from rps import engine
+from rps.opponents import DEFAULT_OPPONENT, OPPONENTS, make_opponent
+from rps.rng import SessionRandom
+
+DEFAULT_PORT = 8560
+FLUSH_INTERVAL = 0.05
+MAX_SESSIONS = 10_000
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 16 * 1024
+
+log = logging.getLogger(__name__)
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class BotSession:
+    def __init__(self, session_id, rules):
+        self.session_id = session_id
+        self.rng = SessionRandom(choices=rules.size)
+        self.rules = rules
+        self.opponent_name = None
+        self.opponent = None
+        self.moves = 0
+        self.score = [0, 0, 0]  # ties, wins, losses by outcome code
+
+    def use_opponent(self, name):
+        """Switch opponent, return True if it changed."""
+        if name == self.opponent_name:
+            return False
+        self.opponent_name = name
+        self.opponent = make_opponent(name, self.rng, self.rules)
+        return True
+
+    def stats(self):
+        ties, wins, losses = self.score
+        return {"session": self.session_id, "opponent": self.opponent_name, "games": self.moves,
+                "wins": wins, "losses": losses, "ties": ties}
+
+
+class PlayServer:
+    def __init__(self, save_games, totals=None, session_log=None, rules=None,
+                 host="127.0.0.1", port=DEFAULT_PORT, flush_interval=FLUSH_INTERVAL,
+                 max_sessions=MAX_SESSIONS):
+        self.save_games = save_games
+        self.session_log = session_log
+        self.rules = rules or engine.RULES
+        self.host = host
+        self.port = port
+        self.flush_interval = flush_interval
+        self.max_sessions = max_sessions
+        # Least recently played first
+        self.sessions = collections.OrderedDict()
+        self.totals = dict({"games": 0, "wins": 0, "losses": 0, "ties": 0}, **(totals or {}))
+        self.pending = []
+        self.saved = 0
+        self._session_ids = itertools.count(1)
+        self._started = datetime.datetime.now().strftime("%Y%m%d%H%M%S%f")
+        self._wake = None
+        self._stopping = False
+        self._server = None
+
+    # Game
+
+    def play(self, request):
+        move = request.get("move")
+        if move not in self.rules.move_index:
+            raise HTTPError(400, f"move must be one of {', '.join(self.rules.moves)}")
+        opponent_name = request.get("opponent")
+        if opponent_name is not None and opponent_name not in OPPONENTS:
+            raise HTTPError(400, f"opponent must be one of {', '.join(OPPONENTS)}")
+
+        session_id = str(request.get("session") or f"api-{self._started}-{next(self._session_ids)}")
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = BotSession(session_id, self.rules)
+            if len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+        else:
+            self.sessions.move_to_end(session_id)
+        if session.use_opponent(opponent_name or session.opponent_name or DEFAULT_OPPONENT) and self.session_log:
+            self.session_log.record(session_id, session.rng.seed, session.opponent_name, session.moves,
+                                    self.rules.name)
+
+        player = self.rules.move_index[move]
+        computer = session.opponent.choose()
+        outcome = self.rules.resolve(player, computer)
+        session.opponent.observe(player, computer)
+        session.moves += 1
+        session.score[outcome] += 1
+        self.totals["games"] += 1
+        self.totals[("ties", "wins", "losses")[outcome]] += 1
+
+        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        computer_move = self.rules.moves[computer]
+        self.pending.append((timestamp, session_id, move, computer_move, outcome))
+        self._wake.set()
+        return {"session": session_id, "move_index": session.moves - 1, "player": move,
+                "computer": computer_move, "result": engine.OUTCOMES[outcome], **session.stats()}
+
+    def stats(self, query):
+        session_id = query.get("session", [None])[0]
+        if session_id is None:
+            return dict(self.totals, sessions=len(self.sessions), unsaved=len(self.pending))
+        if session_id not in self.sessions:
+            raise HTTPError(404, f"no recent session {session_id!r}")
+        return self.sessions[session_id].stats()
+
+    def route(self, method, target, body):
+        url = urllib.parse.urlsplit(target)
+        if url.path == "/play":
+            if method != "POST":
+                raise HTTPError(405, "use POST /play")
+            try:
+                request = json.loads(body or b"{}")
+            except ValueError:
+                raise HTTPError(400, "body must be JSON")
+            if not isinstance(request, dict):
+                raise HTTPError(400, "body must be a JSON object")
+            return self.play(request)
+        if url.path == "/stats":
+            if method != "GET":
+                raise HTTPError(405, "use GET /stats")
+            return self.stats(urllib.parse.parse_qs(url.query))
+        raise HTTPError(404, "not found, try POST /play or GET /stats")
+
+    # Persistence
+
+    async def flush(self):
+        """Save every pending game, keeping them pending if the save fails."""
+        while self.pending:
+            games, self.pending = self.pending, []
+            try:
+                await self.save_games(games)
+            except Exception:
+                # Ahead of the moves played during the save, to keep the order
+                self.pending[:0] = games
+                raise
+            self.saved += len(games)
+
+    async def _flush_loop(self):
+        while not self._stopping:
+            await self._wake.wait()
+            if self._stopping:
+                break
+            # Let the moves of the next few milliseconds join the batch
+            await asyncio.sleep(self.flush_interval)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                # The games are saved with the batch of the next move
+                log.exception("Error saving %d games", len(self.pending))
+
+    # HTTP
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                try:
+                    length = int(headers.get("content-length", 0))
+                    if length > MAX_BODY_BYTES:
+                        raise HTTPError(413, "request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = 200, self.route(method, target, body)
+                except HTTPError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except ValueError:
+                    status, payload = 400, {"error": "bad Content-Length"}
+                    keep_alive = False
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self._wake = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+        # The loop finishes the save it may be in the middle of rather than
+        # being cancelled, which would lose that batch, then the rest follows
+        self._stopping = True
+        self._wake.set()
+        await self._flush_task
+        await self.flush()
+
+    async def serve(self):
+        """Serve until SIGINT or SIGTERM, then save the pending games."""
+        await self.start()
+        print(f"Serving POST /play and GET /stats on http://{self.host}:{self.port}")
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, stopped.set)
+            except NotImplementedError:
+                # Windows event loops have no signal handlers
+                signal.signal(signum, lambda *_: loop.call_soon_threadsafe(stopped.set))
+        await stopped.wait()
+        await self.stop()
+        print(f"Stopped, {self.saved} games saved")
@@ -0,0 +1,88 @@
+"""Player profiles of the Advanced app.
+
+Profiles are rows of ``user_id, name, created`` in a CSV file. The user id
+is made from the name when the profile is created and never changes, it
+keys the player's partition of the game data and their leaderboard entry.
+
+    profiles = Profiles("profiles.csv")
+    profile = profiles.create("Prithika")
+    profiles.all()
+    profiles.name(profile["user_id"])
+
+The file is read once and then kept in memory, so every session of a
+server can share one ``Profiles``.
+"""
+import csv
+import os
+import re
+import threading
+from datetime import datetime
+
+
+def make_user_id(name, taken):
+    """Return a file-safe id for ``name`` that is not in ``taken``."""
+    base = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "player"
+    user_id, suffix = base, 2
+    while user_id in taken:
+        user_id = f"{base}-{suffix}"
+        suffix += 1
+    return user_id
+
+
+class Profiles:
+    COLUMNS = ["user_id", "name", "created"]
+
+    def __init__(self, path):
+        self.path = path
+        self._profiles = None
+        self._lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def _load(self):
+        if self._profiles is None:
+            self._profiles = {}
+            if os.path.exists(self.path):
+                with open(self.path, newline="") as f:
+                    for row in csv.DictReader(f):
+                        self._profiles[row["user_id"]] = row
+        return self._profiles
+
+    def all(self):
+        """Return every profile, oldest first."""
+        with self._lock:
+            return [dict(profile) for profile in self._load().values()]
+
+    def get(self, user_id):
+        with self._lock:
+            profile = self._load().get(user_id)
+            return dict(profile) if profile else None
+
+    def name(self, user_id):
+        """Return the name of a player, or the id itself if it has no profile."""
+        with self._lock:
+            profile = self._load().get(user_id)
+            return profile["name"] if profile else user_id
+
+    def create(self, name):
+        """Add a profile and return it, or return the profile that already has ``name``."""
+        name = name.strip()
+        with self._lock:
+            profiles = self._load()
+            for profile in profiles.values():
+                if profile["name"].lower() == name.lower():
+                    return dict(profile)
+            profile = {
+                "user_id": make_user_id(name, profiles),
+                "name": name,
+                "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            new_file = not os.path.exists(self.path)
+            with open(self.path, "a", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=self.COLUMNS)
+                if new_file:
+                    writer.writeheader()
+                writer.writerow(profile)
+            profiles[profile["user_id"]] = profile
+            return dict(profile)
@@ -0,0 +1,48 @@
+"""PNG chart rendering with matplotlib.
+
+Used when an app is started with ``RPS_CHARTS=raster``, for example on
+clients where the native Flet charts are not wanted. matplotlib is imported
+on first use, so nothing is paid for it while native charts are in use.
+"""
+from io import BytesIO
+
+
+def _pyplot():
+    import matplotlib
+    # Set matplotlib to use non-GUI backend to prevent thread warnings
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def preload():
+    """Import matplotlib ahead of the first render."""
+    _pyplot()
+
+
+def _to_png(plt):
+    buf = BytesIO()
+    plt.savefig(buf, format='png')
+    plt.close()
+    return buf.getvalue()
+
+
+def render_pie_png(data, colors, title):
+    plt = _pyplot()
+    plt.figure(figsize=(8, 6))
+    labels = [label for label, _ in data]
+    values = [value for _, value in data]
+    plt.pie(values, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+    plt.axis('equal')
+    plt.title(title)
+    return _to_png(plt)
+
+
+def render_bar_png(data, colors, title, xlabel, ylabel):
+    plt = _pyplot()
+    plt.figure(figsize=(8, 6))
+    plt.bar([label for label, _ in data], [value for _, value in data], color=colors)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.title(title)
+    return _to_png(plt)
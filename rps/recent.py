@@ -0,0 +1,45 @@
+"""Fixed-size buffer of the most recent games.
+
+Views that list the latest games read them from here instead of loading
+and sorting the whole history. The buffer is seeded on first use with
+``load_tail(capacity)``, which returns the last games in the store oldest
+first. After that, games are added as they are written to the store.
+
+    recent = RecentGames(50, lambda k: store.read_history_page(0, k)[::-1])
+    recent.extend(saved_rows)
+    recent.newest(5)
+
+Games must be added after they reach the store. Games added before the
+buffer is seeded are skipped, because the tail read already includes them.
+"""
+import itertools
+import threading
+from collections import deque
+
+
+class RecentGames:
+    def __init__(self, capacity, load_tail):
+        self.capacity = capacity
+        self._rows = deque(maxlen=capacity)
+        self._load_tail = load_tail
+        self._seeded = False
+        self._lock = threading.Lock()
+
+    def _seed(self):
+        if not self._seeded:
+            self._rows.extend(self._load_tail(self.capacity))
+            self._seeded = True
+
+    def append(self, row):
+        self.extend([row])
+
+    def extend(self, rows):
+        with self._lock:
+            if self._seeded:
+                self._rows.extend(rows)
+
+    def newest(self, n=None):
+        """Return up to ``n`` games (default: all of them), newest first."""
+        with self._lock:
+            self._seed()
+            return list(itertools.islice(reversed(self._rows), n))
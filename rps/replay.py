@@ -0,0 +1,118 @@
+"""Find a session's games and step through them move by move.
+
+``SessionIndex`` maps every session id to the runs of rows it occupies in
+the game data, so a session is read by row ranges instead of by scanning
+the whole history. Runs rather than one range, because sessions played at
+the same time interleave. Like ``RecentGames``, it is built on first use
+with ``load_ids()``, the session id of every row in order, and then kept up
+to date with ``extend()`` as rows are written.
+
+    index = SessionIndex(lambda: store.read_session_ids())
+    index.extend(first_row, [session_id] * len(saved_games))
+    for start, stop in index.runs(session_id):
+        ...
+
+``SessionTimeline`` replays a session's outcomes and keeps the score and
+streaks at a checkpoint every ``log2(n)`` moves. ``state_at(move)`` starts
+from the checkpoint at or before the move and replays the few moves after
+it, so seeking anywhere on the timeline costs O(log n).
+"""
+import itertools
+import math
+import threading
+from typing import NamedTuple
+
+from rps import engine
+
+
+class SessionIndex:
+    def __init__(self, load_ids):
+        self._load_ids = load_ids
+        self._runs = {}
+        self._last_row = {}
+        self.rows = 0
+        self._seeded = False
+        self._lock = threading.Lock()
+
+    def _seed(self):
+        if not self._seeded:
+            self._add(0, self._load_ids())
+            self._seeded = True
+
+    def _add(self, first_row, session_ids):
+        # Rows the index already has are skipped
+        skip = max(0, self.rows - first_row)
+        row = first_row + skip
+        for session_id, run in itertools.groupby(itertools.islice(session_ids, skip, None)):
+            stop = row + sum(1 for _ in run)
+            if session_id is not None:
+                runs = self._runs.setdefault(session_id, [])
+                if runs and runs[-1][1] == row:
+                    runs[-1] = (runs[-1][0], stop)
+                else:
+                    runs.append((row, stop))
+                self._last_row[session_id] = stop
+            row = stop
+        self.rows = max(self.rows, row)
+
+    def extend(self, first_row, session_ids):
+        """Add the session ids of the rows written from row ``first_row`` on."""
+        with self._lock:
+            if self._seeded:
+                self._add(first_row, session_ids)
+
+    def sessions(self):
+        """Return the session ids, most recently played first."""
+        with self._lock:
+            self._seed()
+            return sorted(self._last_row, key=self._last_row.__getitem__, reverse=True)
+
+    def runs(self, session_id):
+        """Return the ``(start, stop)`` row ranges of a session, in order."""
+        with self._lock:
+            self._seed()
+            return list(self._runs.get(session_id, ()))
+
+
+class TimelineState(NamedTuple):
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    # Positive while the player is on a winning streak, negative while losing
+    streak: int = 0
+    best_streak: int = 0
+
+
+def next_state(state, outcome):
+    """Return the state after one more round with the player's ``outcome``."""
+    wins, losses, ties, streak, best_streak = state
+    if outcome == engine.WIN:
+        streak = max(streak, 0) + 1
+        return TimelineState(wins + 1, losses, ties, streak, max(best_streak, streak))
+    if outcome == engine.LOSS:
+        return TimelineState(wins, losses + 1, ties, min(streak, 0) - 1, best_streak)
+    return TimelineState(wins, losses, ties + 1, 0, best_streak)
+
+
+class SessionTimeline:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.interval = max(1, math.ceil(math.log2(len(self.outcomes) + 1)))
+        self.checkpoints = [TimelineState()]
+        state = self.checkpoints[0]
+        for move, outcome in enumerate(self.outcomes, start=1):
+            state = next_state(state, outcome)
+            if move % self.interval == 0:
+                self.checkpoints.append(state)
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    def state_at(self, move):
+        """Return the state after the first ``move`` moves."""
+        move = min(max(move, 0), len(self.outcomes))
+        checkpoint = move // self.interval
+        state = self.checkpoints[checkpoint]
+        for outcome in self.outcomes[checkpoint * self.interval:move]:
+            state = next_state(state, outcome)
+        return state
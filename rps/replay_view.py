@@ -0,0 +1,114 @@
+"""Replay view: pick a session and scrub through its moves.
+
+The app supplies two coroutines. ``load_sessions()`` returns the session
+ids, newest first, and ``load_games(session_id)`` returns the session's
+games in order as ``(timestamp, player_move, computer_move, outcome)``
+tuples, with the outcome coded as in ``rps.engine`` from the player's side.
+``request_update`` is called whenever the view has changed.
+
+    replay = ReplayView(load_sessions, load_games, updates.request)
+    page.add(replay.control)
+    await replay.refresh()
+
+The controls are built once. Moving the slider looks the score up in the
+session's ``SessionTimeline`` and only changes the bound text values.
+"""
+import flet as ft
+
+from rps import engine
+from rps.replay import SessionTimeline
+from rps.viewmodel import ViewModel
+
+# Sessions offered in the picker, the most recent ones
+MAX_SESSIONS = 100
+
+OUTCOME_TEXT = {engine.WIN: "You win", engine.LOSS: "Computer wins", engine.TIE: "Tie"}
+OUTCOME_COLORS = {engine.WIN: ft.Colors.GREEN_700, engine.LOSS: ft.Colors.RED_700, engine.TIE: ft.Colors.BLUE_700}
+
+
+def streak_text(streak):
+    if streak > 0:
+        return f"Winning streak: {streak}"
+    if streak < 0:
+        return f"Losing streak: {-streak}"
+    return "No streak"
+
+
+class ReplayView:
+    def __init__(self, load_sessions, load_games, request_update):
+        self.load_sessions = load_sessions
+        self.load_games = load_games
+        self.request_update = request_update
+        self.session_id = None
+        self.games = []
+        self.timeline = SessionTimeline([])
+
+        self.vm = ViewModel()
+        self.session_dropdown = ft.Dropdown(label="Session", width=320, on_change=self.on_session_change)
+        outcome_text = self.vm.bind("outcome", ft.Text(size=18))
+        self.vm.bind("outcome_color", outcome_text, "color")
+        self.slider = ft.Slider(min=0, max=1, value=0, divisions=1, label="{value}",
+                                disabled=True, expand=True, on_change=self.on_seek)
+        self.control = ft.Column([
+            ft.Text("Session Replay", size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_700),
+            self.session_dropdown,
+            ft.Row([ft.Text("Start"), self.slider, ft.Text("End")]),
+            self.vm.bind("position", ft.Text(size=16, weight=ft.FontWeight.BOLD)),
+            self.vm.bind("move", ft.Text(size=18)),
+            outcome_text,
+            self.vm.bind("score", ft.Text(size=20, weight=ft.FontWeight.BOLD)),
+            self.vm.bind("streak", ft.Text(size=16)),
+            self.vm.bind("best_streak", ft.Text(size=16), format="Best winning streak: {}"),
+        ], spacing=15, scroll=ft.ScrollMode.AUTO)
+        self.vm.update(position="No session selected", move="", outcome="", outcome_color=None,
+                       score="", streak="", best_streak=0)
+
+    async def refresh(self):
+        """Reload the sessions and the picked one, or the newest if none is picked."""
+        sessions = (await self.load_sessions())[:MAX_SESSIONS]
+        self.session_dropdown.options = [ft.dropdown.Option(session_id) for session_id in sessions]
+        if sessions:
+            await self.show_session(self.session_id if self.session_id in sessions else sessions[0])
+        else:
+            self.request_update()
+
+    async def show_session(self, session_id):
+        self.session_id = session_id
+        self.session_dropdown.value = session_id
+        self.games = await self.load_games(session_id)
+        self.timeline = SessionTimeline(game[3] for game in self.games)
+        moves = len(self.timeline)
+        self.slider.max = max(moves, 1)
+        self.slider.divisions = max(moves, 1)
+        self.slider.disabled = moves == 0
+        self.seek(moves)
+
+    def seek(self, move):
+        """Show the score after the first ``move`` moves of the session."""
+        move = int(move)
+        self.slider.value = move
+        state = self.timeline.state_at(move)
+        values = dict(
+            position=f"Move {move} of {len(self.timeline)}",
+            score=f"You: {state.wins}  |  Computer: {state.losses}  |  Ties: {state.ties}",
+            streak=streak_text(state.streak),
+            best_streak=state.best_streak,
+            move="",
+            outcome="",
+            outcome_color=None,
+        )
+        if move > 0:
+            timestamp, player, computer, outcome = self.games[move - 1]
+            values.update(
+                move=f"{timestamp}: {player.capitalize()} vs {computer.capitalize()}",
+                outcome=OUTCOME_TEXT[outcome],
+                outcome_color=OUTCOME_COLORS[outcome],
+            )
+        self.vm.update(**values)
+        self.request_update()
+
+    async def on_session_change(self, e):
+        await self.show_session(e.control.value)
+
+    async def on_seek(self, e):
+        self.seek(e.control.value)
@@ -0,0 +1,124 @@
+"""Seeded random moves for one game session.
+
+Each session owns a ``SessionRandom`` and records its seed. The computer's
+random moves are drawn from NumPy in blocks, so a draw costs a list lookup.
+Block ``k`` comes from its own generator seeded with ``(seed, k)``, so the
+draw for any move is known from the seed and the move's index alone:
+
+    rng = SessionRandom()
+    opponent = make_opponent("markov", rng=rng)
+    ...
+    SessionRandom.draw_at(rng.seed, 41) # what move 41 drew
+
+Opponents take one draw per move, whether or not they use it, so the draw
+index is the move index within the session. NumPy is imported on the first
+draw, not when the session starts.
+
+``SessionLog`` appends the seed, the rule set and each change of opponent
+to a CSV file next to the game data, which is what
+``rps.opponents.replay()`` needs to play a session again.
+"""
+import csv
+import os
+import secrets
+import threading
+
+from rps.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+BLOCK_SIZE = 1024
+
+
+def new_seed():
+    return secrets.randbits(63)
+
+
+def draw_block(seed, block, choices, size=BLOCK_SIZE):
+    """Return the draws of block number ``block`` as a list of ints."""
+    generator = np.random.default_rng([seed, block])
+    return generator.integers(0, choices, size=size, dtype=np.uint8).tolist()
+
+
+class SessionRandom:
+    """Random moves for one session, drawn a block at a time.
+
+    Draws are taken on one thread, the session's event loop. ``fill()`` may
+    run on another, such as the warm-up thread, to draw the next block ahead.
+    """
+
+    def __init__(self, seed=None, choices=3, block_size=BLOCK_SIZE):
+        self.seed = new_seed() if seed is None else seed
+        self.choices = choices
+        self.block_size = block_size
+        self.index = 0
+        self._block = None
+        self._offset = block_size
+        self._ready = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def draw_at(cls, seed, index, choices=3, block_size=BLOCK_SIZE):
+        """Return draw number ``index`` of the session seeded with ``seed``."""
+        block, offset = divmod(index, block_size)
+        return draw_block(seed, block, choices, block_size)[offset]
+
+    def fill(self):
+        """Draw the block the next move falls in, if it isn't drawn yet."""
+        with self._lock:
+            number = self.index // self.block_size
+            if self._offset >= self.block_size and (self._ready is None or self._ready[0] != number):
+                self._ready = (number, draw_block(self.seed, number, self.choices, self.block_size))
+
+    def _next_block(self):
+        with self._lock:
+            number = self.index // self.block_size
+            if self._ready is not None and self._ready[0] == number:
+                self._block = self._ready[1]
+            else:
+                self._block = draw_block(self.seed, number, self.choices, self.block_size)
+            self._ready = None
+            self._offset = self.index - number * self.block_size
+
+    def randrange(self, n):
+        """Return the next draw, ``n`` must be the number of choices."""
+        if n != self.choices:
+            raise ValueError(f"SessionRandom draws from {self.choices} choices, not {n}")
+        if self._offset >= self.block_size:
+            self._next_block()
+        move = self._block[self._offset]
+        self._offset += 1
+        self.index += 1
+        return move
+
+
+class SessionLog:
+    """Appends ``session_id, seed, opponent, first_move, rules`` rows to a CSV file."""
+
+    COLUMNS = ["session_id", "seed", "opponent", "first_move", "rules"]
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, session_id, seed, opponent, first_move, rules="classic"):
+        with self._lock:
+            new_file = not os.path.exists(self.path)
+            with open(self.path, "a", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(self.COLUMNS)
+                writer.writerow([session_id, seed, opponent, first_move, rules])
+
+    def read(self, session_id):
+        """Return ``(seed, [(first_move, opponent), ...], rules)`` for a session, or None."""
+        if not os.path.exists(self.path):
+            return None
+        seed, segments, rules = None, [], "classic"
+        with open(self.path, newline="") as f:
+            for row in csv.DictReader(f):
+                if row["session_id"] == session_id:
+                    seed = int(row["seed"])
+                    segments.append((int(row["first_move"]), row["opponent"]))
+                    rules = row.get("rules") or rules
+        return None if seed is None else (seed, segments, rules)
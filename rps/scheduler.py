@@ -0,0 +1,97 @@
+"""Coalesce ``page.update()`` calls to at most one per frame.
+
+Handlers call ``updates.request()`` instead of ``page.update()``. The first
+request marks the page dirty and schedules a flush one frame interval
+later. Requests that arrive before the flush, such as the nested updates
+in helper functions or a burst of clicks, are folded into the same
+``page.update()``.
+
+The interval comes from ``RPS_FRAME_MS`` (default 16). ``0`` turns
+coalescing off and every request updates the page right away.
+
+Requests made from ``async`` handlers schedule the flush on the page's
+event loop, requests from threads use a timer thread.
+"""
+import asyncio
+import os
+import threading
+import weakref
+
+from rps import metrics
+
+DEFAULT_FRAME_MS = float(os.environ.get("RPS_FRAME_MS", "16"))
+
+
+class UpdateScheduler:
+    def __init__(self, page, interval_ms=DEFAULT_FRAME_MS):
+        self.page = page
+        self.interval = interval_ms / 1000
+        self.requested = 0
+        self.flushed = 0
+        self._lock = threading.Lock()
+        self._timer = None
+
+    @property
+    def coalesced(self):
+        """Number of requests that did not need their own ``page.update()``."""
+        return self.requested - self.flushed
+
+    def request(self):
+        with self._lock:
+            self.requested += 1
+            if self.interval <= 0:
+                immediate = True
+            else:
+                immediate = False
+                if self._timer is None:
+                    self._timer = self._schedule_flush()
+        if immediate:
+            self._update()
+
+    def _schedule_flush(self):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            timer = threading.Timer(self.interval, self.flush)
+            timer.daemon = True
+            timer.start()
+            return timer
+        return loop.call_later(self.interval, self.flush)
+
+    def flush(self):
+        """Send pending changes now, if there are any."""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer.cancel()
+            self._timer = None
+        self._update()
+
+    def _update(self):
+        with self._lock:
+            self.flushed += 1
+        try:
+            with metrics.span("page.update"):
+                self.page.update()
+        except Exception as e:
+            print(f"Error updating page: {e}")
+
+    def stats(self):
+        return {
+            "requested": self.requested,
+            "flushed": self.flushed,
+            "coalesced": self.coalesced,
+        }
+
+
+_schedulers = weakref.WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def scheduler_for(page):
+    """Return the page's scheduler, creating it on first use."""
+    with _schedulers_lock:
+        scheduler = _schedulers.get(page)
+        if scheduler is None:
+            scheduler = _schedulers[page] = UpdateScheduler(page)
+        return scheduler
@@ -0,0 +1,433 @@
+"""Synthetic game histories in the apps' own data files.
+
+    python -m rps.synthetic [--games N] [--players N] [--seed N] [--rules NAME]
+                            [--start YYYY-MM-DD] [--days N] [--formats csv,workbook,partitions]
+                            [--output DIR] [--force]
+
+Generates ``--games`` games with NumPy and writes them under ``--output``
+(default ``synthetic``) in the layout of the repository, so ``--output .``
+gives the apps the data directly:
+
+- ``csv``: ``Intermediate/data/game_data.csv``, the Intermediate app's history
+- ``workbook``: ``Advanced/rps_data.xlsx``, the single workbook of older
+  Advanced versions, with a ``user`` column and ``history``/``stats`` sheets
+- ``partitions``: ``Advanced/profiles.csv`` and a workbook per player in
+  ``Advanced/users/``, what the Advanced app reads now
+
+All formats hold the same games. A sheet holds at most 1,048,575 games,
+so formats that can't hold them are skipped unless they were asked for.
+
+The games come in sessions of a few to a few hundred moves, a few seconds
+apart, each with a session id made from its start time like the apps make
+them. Sessions start at random between 9:00 and 21:00 over ``--days``
+days, so in large histories they overlap and their games interleave, as
+with many players on a server. A few players play most of the sessions.
+Each player favours some moves and repeats the last one now and then, the
+computer plays uniformly at random as the apps' default opponent does.
+Every step works on whole arrays, no Python code runs per game.
+
+Workbooks are written as their XML parts, built with polars string
+expressions, rather than cell by cell, which is about 10 times faster than
+``xlsxwriter``. Ten million games take about 45 seconds, csv and
+partitions. The ``stats`` sheets are computed from the same outcome
+arrays as the history, so they always agree with it.
+"""
+import argparse
+import os
+import time
+import zipfile
+
+from rps import engine
+from rps.lazy import lazy_import
+from rps.profiles import Profiles
+
+np = lazy_import("numpy")
+pl = lazy_import("polars")
+
+# Rows of an Excel sheet, less the header
+MAX_SHEET_GAMES = 1_048_575
+
+INTERMEDIATE_RESULTS = ["Tie", "Win", "Loss"]
+ADVANCED_RESULTS = ["It's a tie!", "You win!", "Computer wins!"]
+FORMATS = ["csv", "workbook", "partitions"]
+
+NAMES = [
+    "Prithika", "Arjun", "Meera", "Liam", "Sofia", "Kenji", "Amara", "Noah", "Zara", "Mateo",
+    "Priya", "Elena", "Omar", "Hana", "Lucas", "Aisha", "Ravi", "Chloe", "Diego", "Yuki",
+]
+
+# Open hours of the kiosk, sessions start in between
+OPEN_HOUR, CLOSE_HOUR = 9, 21
+# Session lengths are log-normal around this median, in moves
+SESSION_MEDIAN = 20
+SESSION_SIGMA = 1.0
+# Seconds between moves: a minimum plus a gamma-distributed think time
+MOVE_GAP_MIN = 1.0
+MOVE_GAP_SHAPE, MOVE_GAP_SCALE = 2.0, 1.5
+
+
+def player_names(count):
+    """Return ``count`` distinct player names."""
+    return [NAMES[i % len(NAMES)] + ("" if i < len(NAMES) else f" {i // len(NAMES) + 1}") for i in range(count)]
+
+
+def popularity(count, games, rng):
+    """Return the share of sessions of each player, so no one gets more games than a sheet holds."""
+    weights = 1 / np.arange(1, count + 1) ** 0.8
+    rng.shuffle(weights)
+    weights /= weights.sum()
+    cap = 0.9 * MAX_SHEET_GAMES / max(games, 1)
+    if cap * count > 1:
+        for _ in range(count):
+            over = weights > cap
+            if not over.any():
+                break
+            spare = (weights[over] - cap).sum()
+            weights[over] = cap
+            weights[~over] += spare * weights[~over] / weights[~over].sum()
+    return weights
+
+
+def generate(games, players=50, seed=0, rules=engine.CLASSIC, start="2024-01-01", days=365):
+    """Return ``(games, names)``, a DataFrame of games in the order they were played and the player names.
+
+    The DataFrame has ``timestamp``, ``session_id``, ``player`` (index into
+    ``names``), ``player_move``/``computer_move`` (moves of ``rules`` by
+    index) and ``outcome`` from the player's side, coded as in ``rps.engine``.
+    """
+    if games < 1 or players < 1:
+        raise ValueError(f"need at least one game and one player, not {games} and {players}")
+    rng = np.random.default_rng(seed)
+
+    # Sessions, drawn until they cover the games, the last one cut short
+    lengths = np.empty(0, dtype=np.int64)
+    while lengths.sum() < games:
+        more = max(16, int((games - lengths.sum()) / (SESSION_MEDIAN * 1.5)) + 16)
+        drawn = np.maximum(1, rng.lognormal(np.log(SESSION_MEDIAN), SESSION_SIGMA, more).round()).astype(np.int64)
+        lengths = np.concatenate([lengths, drawn])
+    ends = np.cumsum(lengths)
+    sessions = int(np.searchsorted(ends, games)) + 1
+    lengths = lengths[:sessions]
+    lengths[-1] -= ends[sessions - 1] - games
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    session_of_game = np.repeat(np.arange(sessions), lengths)
+
+    # Seconds into the session of every move, and the session starts in
+    # seconds of open time
+    gaps = MOVE_GAP_MIN + rng.gamma(MOVE_GAP_SHAPE, MOVE_GAP_SCALE, games)
+    gaps[starts] = 0
+    elapsed = np.cumsum(gaps)
+    offsets = elapsed - np.repeat(elapsed[starts], lengths)
+    day_seconds = (CLOSE_HOUR - OPEN_HOUR) * 3600
+    open_starts = np.sort(rng.uniform(0, days * day_seconds, sessions))
+
+    # Open time to wall-clock time, every day opens at OPEN_HOUR
+    first_day = np.datetime64(start, "s").astype(np.int64)
+    session_starts = (first_day + (open_starts // day_seconds) * 86400 + OPEN_HOUR * 3600
+                      + open_starts % day_seconds)
+    # Session ids are unique, even if two sessions start in the same microsecond
+    step = np.arange(sessions)
+    session_starts_us = np.maximum.accumulate((session_starts * 1e6).astype(np.int64) - step) + step
+    game_times = np.repeat(session_starts, lengths) + offsets
+
+    # Players, a few of them play most sessions
+    player_of_session = rng.choice(players, size=sessions, p=popularity(players, games, rng))
+    player = player_of_session[session_of_game].astype(np.uint32)
+
+    # Every player favours some moves and sometimes repeats their last one,
+    # never across sessions
+    preferences = np.cumsum(rng.dirichlet(np.full(rules.size, 4.0), players), axis=1)
+    repeat_rate = rng.beta(2.0, 5.0, players)
+    draws = rng.random(games)
+    player_move = np.zeros(games, dtype=np.uint8)
+    for move in range(rules.size - 1):
+        player_move += draws > preferences[player, move]
+    repeats = rng.random(games) < repeat_rate[player]
+    repeats[starts] = False
+    source = np.where(repeats, 0, np.arange(games))
+    player_move = player_move[np.maximum.accumulate(source)]
+    computer_move = rng.integers(0, rules.size, games, dtype=np.uint8)
+    outcome = rules.resolve_batch(player_move, computer_move)
+
+    # Games of overlapping sessions interleave in the order they were played
+    order = np.argsort(game_times, kind="stable")
+    session_of_game, player = session_of_game[order], player[order]
+    player_move, computer_move, outcome = player_move[order], computer_move[order], outcome[order]
+    game_seconds = game_times[order].astype(np.int64)
+
+    session_ids = (pl.Series(session_starts_us).cast(pl.Datetime("us"))
+                   .dt.strftime("%Y%m%d%H%M%S%6f"))
+    frame = pl.DataFrame({
+        "timestamp": pl.from_epoch(pl.Series(game_seconds), time_unit="s").dt.strftime("%Y-%m-%d %H:%M:%S"),
+        "session_id": session_ids.gather(session_of_game),
+        "player": player,
+        "player_move": player_move,
+        "computer_move": computer_move,
+        "outcome": outcome,
+    })
+    return frame, player_names(players)
+
+
+def labels(codes, names):
+    """Map a column of integer codes to the strings in ``names``."""
+    return pl.Series(list(names), dtype=pl.String).gather(codes)
+
+
+def stats_rows(outcome):
+    """Return the ``stats`` sheet of a player with these outcomes as ``(metric, value)`` lists."""
+    counts = np.bincount(np.asarray(outcome), minlength=3)
+    return {
+        "metric": ["user_wins", "computer_wins", "ties", "total_games"],
+        "value": [int(counts[engine.WIN]), int(counts[engine.LOSS]), int(counts[engine.TIE]), int(counts.sum())],
+    }
+
+
+def intermediate_frame(frame, rules):
+    return pl.DataFrame({
+        "timestamp": frame["timestamp"],
+        "player_choice": labels(frame["player_move"], rules.moves),
+        "computer_choice": labels(frame["computer_move"], rules.moves),
+        "result": labels(frame["outcome"], INTERMEDIATE_RESULTS),
+        "session_id": frame["session_id"],
+    })
+
+
+def advanced_frame(frame, rules):
+    return pl.DataFrame({
+        "timestamp": frame["timestamp"],
+        "user_choice": labels(frame["player_move"], rules.moves),
+        "computer_choice": labels(frame["computer_move"], rules.moves),
+        "result": labels(frame["outcome"], ADVANCED_RESULTS),
+        "session_id": frame["session_id"],
+    })
+
+
+# Parts of a workbook besides its sheets, with a default style so
+# openpyxl doesn't warn about a missing one
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}</Types>'
+)
+SHEET_CONTENT_TYPE = ('<Override PartName="/xl/worksheets/sheet{n}.xml" '
+                      'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>')
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets></workbook>'
+)
+WORKBOOK_SHEET = '<sheet name="{name}" sheetId="{n}" r:id="rId{n}"/>'
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}<Relationship Id="rId{styles}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/></Relationships>'
+)
+WORKBOOK_SHEET_REL = ('<Relationship Id="rId{n}" '
+                      'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                      'Target="worksheets/sheet{n}.xml"/>')
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+SHEET_START = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+               '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+SHEET_END = '</sheetData></worksheet>'
+
+# Rows turned into XML at a time
+XML_CHUNK_ROWS = 200_000
+
+
+def column_letter(index):
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def escape_xml(expr):
+    return expr.str.replace_all("&", "&amp;", literal=True).str.replace_all(
+        "<", "&lt;", literal=True).str.replace_all(">", "&gt;", literal=True)
+
+
+def sheet_rows_xml(frame, first_row):
+    """Return the ``<row>`` elements of ``frame`` as one string, its first row numbered ``first_row``."""
+    row = pl.int_range(first_row, first_row + frame.height, eager=False).cast(pl.String)
+    parts = [pl.lit('<row r="'), row, pl.lit('">')]
+    for index, (name, dtype) in enumerate(frame.schema.items()):
+        letter = column_letter(index)
+        if dtype.is_numeric():
+            parts += [pl.lit(f'<c r="{letter}'), row, pl.lit('"><v>'), pl.col(name).cast(pl.String), pl.lit("</v></c>")]
+        else:
+            parts += [pl.lit(f'<c r="{letter}'), row, pl.lit('" t="inlineStr"><is><t>'),
+                      escape_xml(pl.col(name).cast(pl.String)), pl.lit("</t></is></c>")]
+    parts.append(pl.lit("</row>"))
+    return frame.select(pl.concat_str(parts).str.join("")).item()
+
+
+def write_sheet(stream, frame):
+    stream.write(SHEET_START.encode())
+    header = pl.DataFrame({name: [name] for name in frame.columns})
+    stream.write(sheet_rows_xml(header, 1).encode())
+    for first in range(0, frame.height, XML_CHUNK_ROWS):
+        stream.write(sheet_rows_xml(frame.slice(first, XML_CHUNK_ROWS), first + 2).encode())
+    stream.write(SHEET_END.encode())
+
+
+def write_workbook(path, sheets):
+    """Write ``{sheet name: DataFrame}`` as an xlsx workbook."""
+    for name, frame in sheets.items():
+        if frame.height > MAX_SHEET_GAMES:
+            raise ValueError(f"sheet {name!r} of {path} would have {frame.height:,} rows, "
+                             f"more than the {MAX_SHEET_GAMES:,} a sheet holds")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    numbers = range(1, len(sheets) + 1)
+    tmp_path = f"{path}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as workbook:
+        workbook.writestr("[Content_Types].xml",
+                          CONTENT_TYPES.format(sheets="".join(SHEET_CONTENT_TYPE.format(n=n) for n in numbers)))
+        workbook.writestr("_rels/.rels", ROOT_RELS)
+        workbook.writestr("xl/workbook.xml", WORKBOOK.format(sheets="".join(
+            WORKBOOK_SHEET.format(name=name, n=n) for n, name in zip(numbers, sheets))))
+        workbook.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS.format(
+            sheets="".join(WORKBOOK_SHEET_REL.format(n=n) for n in numbers), styles=len(sheets) + 1))
+        workbook.writestr("xl/styles.xml", STYLES)
+        for n, frame in zip(numbers, sheets.values()):
+            with workbook.open(f"xl/worksheets/sheet{n}.xml", "w", force_zip64=True) as stream:
+                write_sheet(stream, frame)
+    os.replace(tmp_path, path)
+
+
+def write_csv(output, frame, rules):
+    path = os.path.join(output, "Intermediate", "data", "game_data.csv")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    intermediate_frame(frame, rules).write_csv(path)
+    return [path]
+
+
+def write_legacy_workbook(output, frame, names, rules):
+    path = os.path.join(output, "Advanced", "rps_data.xlsx")
+    history = advanced_frame(frame, rules).with_columns(user=labels(frame["player"], names))
+    write_workbook(path, {"history": history, "stats": pl.DataFrame(stats_rows(frame["outcome"].to_numpy()))})
+    return [path]
+
+
+def write_partitions(output, frame, names, rules):
+    from rps.excel_store import PartitionedGameStore
+
+    os.makedirs(os.path.join(output, "Advanced"), exist_ok=True)
+    profiles = Profiles(os.path.join(output, "Advanced", "profiles.csv"))
+    partitions = PartitionedGameStore(os.path.join(output, "Advanced", "users"))
+    history = advanced_frame(frame, rules)
+    outcome = frame["outcome"].to_numpy()
+    # Every player's games next to each other, still in the order they were played
+    order = np.argsort(frame["player"].to_numpy(), kind="stable")
+    bounds = np.searchsorted(frame["player"].to_numpy()[order], np.arange(len(names) + 1))
+    paths = []
+    for player, name in enumerate(names):
+        rows = order[bounds[player]:bounds[player + 1]]
+        if not len(rows):
+            continue
+        user_id = profiles.create(name)["user_id"]
+        path = partitions.path(user_id)
+        write_workbook(path, {"history": history[rows], "stats": pl.DataFrame(stats_rows(outcome[rows]))})
+        paths.append(path)
+    return paths
+
+
+def existing_files(output, formats):
+    candidates = {
+        "csv": [os.path.join(output, "Intermediate", "data", "game_data.csv")],
+        "workbook": [os.path.join(output, "Advanced", "rps_data.xlsx")],
+        "partitions": [os.path.join(output, "Advanced", "profiles.csv"), os.path.join(output, "Advanced", "users")],
+    }
+    return [path for name in formats for path in candidates[name] if os.path.exists(path)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic game histories in the apps' data files.")
+    parser.add_argument("--games", type=int, default=1_000_000, help="games to generate")
+    parser.add_argument("--players", type=int, default=50, help="players in the Advanced app")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rules", default="classic", help="rule set name or JSON file")
+    parser.add_argument("--start", default="2024-01-01", help="day of the first session")
+    parser.add_argument("--days", type=int, default=365, help="days the sessions are spread over")
+    parser.add_argument("--formats", help=f"comma separated, of {', '.join(FORMATS)} (default: all that fit)")
+    parser.add_argument("--output", default="synthetic", help="directory laid out like the repository")
+    parser.add_argument("--force", action="store_true", help="replace data files that exist")
+    args = parser.parse_args(argv)
+
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.players < 1:
+        parser.error("--players must be at least 1")
+    formats = args.formats.split(",") if args.formats else list(FORMATS)
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"unknown formats {', '.join(sorted(unknown))}, expected {', '.join(FORMATS)}")
+    if args.games > MAX_SHEET_GAMES and "workbook" in formats:
+        if args.formats:
+            parser.error(f"the workbook holds at most {MAX_SHEET_GAMES:,} games")
+        formats.remove("workbook")
+        print(f"Skipping the single workbook, it holds at most {MAX_SHEET_GAMES:,} games")
+    if args.games > MAX_SHEET_GAMES * args.players * 0.9 and "partitions" in formats:
+        parser.error(f"{args.players} players can't hold {args.games:,} games in their workbooks, "
+                     f"add --players or leave out partitions")
+    existing = existing_files(args.output, formats)
+    if existing and not args.force:
+        parser.error(f"{', '.join(existing)} already exist, pass --force to replace them")
+    if args.force:
+        for path in existing:
+            if os.path.isdir(path):
+                for name in os.listdir(path):
+                    if name.endswith(".xlsx"):
+                        os.remove(os.path.join(path, name))
+            else:
+                os.remove(path)
+
+    rules = engine.rule_set(args.rules)
+    started = time.perf_counter()
+    frame, names = generate(args.games, args.players, args.seed, rules, args.start, args.days)
+    print(f"{args.games:,} games in {frame['session_id'].n_unique():,} sessions from "
+          f"{frame['timestamp'][0]} to {frame['timestamp'][-1]}, generated in {time.perf_counter() - started:.1f}s")
+
+    writers = {
+        "csv": lambda: write_csv(args.output, frame, rules),
+        "workbook": lambda: write_legacy_workbook(args.output, frame, names, rules),
+        "partitions": lambda: write_partitions(args.output, frame, names, rules),
+    }
+    for name in formats:
+        step = time.perf_counter()
+        paths = writers[name]()
+        size = sum(os.path.getsize(path) for path in paths)
+        print(f"{name}: {len(paths)} file{'s' * (len(paths) != 1)}, {size / 2**20:,.0f} MB "
+              f"in {time.perf_counter() - step:.1f}s")
+    print(f"Done in {time.perf_counter() - started:.1f}s, written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
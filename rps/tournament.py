@@ -0,0 +1,213 @@
+"""Round-robin tournament between computer opponents and recorded players.
+
+    python -m rps.tournament [--rounds N] [--replicates N] [--workers N]
+                             [--players a,b,...] [--human FILE ...]
+                             [--rules NAME] [--seed N] [--output FILE]
+
+Every pair of players plays ``--rounds`` rounds, split into
+``--replicates`` independent games that each start with fresh opponents.
+The games are spread over a process pool, so throughput grows with the
+number of cores. Every game is seeded from ``--seed`` and the names of its
+players, so a run is reproducible whatever the number of workers.
+
+``--human`` adds the moves recorded in an app's data file, the Intermediate
+CSV or the Advanced workbook, as a player that replays them in order.
+``--rules`` plays another rule set from ``rps.engine``, such as ``rpsls``.
+
+The results are written to a Parquet file with one row per player and
+opponent: rounds, wins, losses and ties, and each rate with a 95% Wilson
+score interval. ``load_results()`` reads it back as a polars DataFrame,
+and ``standings()`` sums it up per player for the Advanced app's stats.
+"""
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from rps import engine
+from rps.lazy import lazy_import
+from rps.opponents import OPPONENTS, Opponent
+
+pl = lazy_import("polars")
+
+Z_95 = 1.959964
+
+
+class RecordedPlayer(Opponent):
+    """Replays a recorded sequence of moves, whatever the other side plays."""
+
+    name = "Recorded"
+
+    def __init__(self, recorded, rng=None, rules=None):
+        super().__init__(rng, rules)
+        self.recorded = recorded
+        self.index = 0
+
+    def choose(self):
+        move = self.recorded[self.index % len(self.recorded)]
+        self.index += 1
+        return move
+
+
+def read_recorded_moves(path, rules=engine.CLASSIC):
+    """Return the player's moves from an app's data file, oldest first.
+
+    Raises ValueError if the file has no moves of the rule set.
+    """
+    if path.endswith(".xlsx"):
+        column = pl.read_excel(path, sheet_name="history")["user_choice"]
+    else:
+        column = pl.read_csv(path, columns=["player_choice"])["player_choice"]
+    moves = [rules.move_index[move] for move in column.to_list() if move in rules.move_index]
+    if not moves:
+        raise ValueError(f"{path} has no recorded moves of the {rules.name} rules")
+    return moves
+
+
+def make_player(name, recorded, rng, rules):
+    if name in recorded:
+        return RecordedPlayer(recorded[name], rng, rules)
+    return OPPONENTS[name](rng=rng, rules=rules)
+
+
+def play_game(task):
+    """Play one game and return (first, second, first wins, second wins, ties)."""
+    first, second, rounds, seed, replicate, recorded, rules_name = task
+    rules = engine.rule_set(rules_name)
+    a = make_player(first, recorded, random.Random(f"{seed}/{first}/{second}/{replicate}/0"), rules)
+    b = make_player(second, recorded, random.Random(f"{seed}/{first}/{second}/{replicate}/1"), rules)
+    table = rules.outcome_table
+    counts = [0, 0, 0]
+    for _ in range(rounds):
+        move_a = a.choose()
+        move_b = b.choose()
+        a.observe(move_b, move_a)
+        b.observe(move_a, move_b)
+        counts[table[move_a][move_b]] += 1
+    return first, second, counts[engine.WIN], counts[engine.LOSS], counts[engine.TIE]
+
+
+def wilson_interval(successes, trials, z=Z_95):
+    if trials == 0:
+        return 0.0, 0.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return centre - margin, centre + margin
+
+
+def schedule(players, recorded, rounds, replicates, seed, rules_name="classic"):
+    """Return one task per game, every pair of players playing ``rounds`` rounds."""
+    per_game, extra = divmod(rounds, replicates)
+    tasks = []
+    for i, first in enumerate(players):
+        for second in players[i + 1:]:
+            if first in recorded and second in recorded:
+                continue
+            pair_recorded = {name: recorded[name] for name in (first, second) if name in recorded}
+            for replicate in range(replicates):
+                game_rounds = per_game + (replicate < extra)
+                if game_rounds:
+                    tasks.append((first, second, game_rounds, seed, replicate, pair_recorded, rules_name))
+    return tasks
+
+
+def run(players, recorded, rounds, replicates, seed, workers, rules_name="classic"):
+    """Play the tournament and return ``{(player, opponent): [wins, losses, ties]}``."""
+    totals = {}
+    tasks = schedule(players, recorded, rounds, replicates, seed, rules_name)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for first, second, wins, losses, ties in pool.map(play_game, tasks):
+            for key, result in [((first, second), (wins, losses, ties)), ((second, first), (losses, wins, ties))]:
+                total = totals.setdefault(key, [0, 0, 0])
+                for k in range(3):
+                    total[k] += result[k]
+    return totals
+
+
+def results_frame(totals, seed, rules_name="classic"):
+    rows = []
+    for (player, opponent), (wins, losses, ties) in sorted(totals.items()):
+        rounds = wins + losses + ties
+        row = {"player": player, "opponent": opponent, "rounds": rounds,
+               "wins": wins, "losses": losses, "ties": ties, "seed": seed, "rules": rules_name}
+        for name, count in [("win", wins), ("loss", losses), ("tie", ties)]:
+            low, high = wilson_interval(count, rounds)
+            row[f"{name}_rate"] = count / rounds
+            row[f"{name}_low"] = low
+            row[f"{name}_high"] = high
+        rows.append(row)
+    return pl.DataFrame(rows)
+
+
+def load_results(path):
+    return pl.read_parquet(path)
+
+
+def standings(results):
+    """Return each player's rounds and win rate over all opponents, with its 95% interval, best first."""
+    totals = results.group_by("player").agg(pl.col("rounds", "wins").sum())
+    rows = []
+    for row in totals.iter_rows(named=True):
+        low, high = wilson_interval(row["wins"], row["rounds"])
+        rows.append(dict(row, win_rate=row["wins"] / row["rounds"], win_low=low, win_high=high))
+    return sorted(rows, key=lambda row: row["win_rate"], reverse=True)
+
+
+def print_matrix(results, players):
+    rates = {(r["player"], r["opponent"]): r for r in results.iter_rows(named=True)}
+    width = max(len(p) for p in players) + 2
+    print("Win rate of the row player (95% interval)")
+    print(" " * width + "".join(f"{p:>22}" for p in players))
+    for player in players:
+        cells = []
+        for opponent in players:
+            r = rates.get((player, opponent))
+            cells.append(f"{'-':>22}" if r is None else
+                         f"{r['win_rate']:>8.1%} ({r['win_low']:.3f}-{r['win_high']:.3f})")
+        print(f"{player:<{width}}" + "".join(cells))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Round-robin tournament between computer opponents.")
+    parser.add_argument("--rounds", type=int, default=1_000_000, help="rounds per pair of players")
+    parser.add_argument("--replicates", type=int, default=16, help="independent games per pair")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--players", default=",".join(OPPONENTS), help="comma separated opponents")
+    parser.add_argument("--human", action="append", default=[], help="data file with recorded moves")
+    parser.add_argument("--rules", default="classic", help="rule set name or JSON file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="tournament.parquet", help="Parquet file for the results")
+    args = parser.parse_args(argv)
+
+    rules = engine.rule_set(args.rules)
+    players = args.players.split(",")
+    unknown = [name for name in players if name not in OPPONENTS]
+    if unknown:
+        parser.error(f"unknown players {', '.join(unknown)}, expected {', '.join(OPPONENTS)}")
+    recorded = {}
+    for path in args.human:
+        name = f"human:{os.path.basename(path)}"
+        try:
+            recorded[name] = read_recorded_moves(path, rules)
+        except ValueError as e:
+            parser.error(str(e))
+        players.append(name)
+
+    started = time.perf_counter()
+    totals = run(players, recorded, args.rounds, args.replicates, args.seed, args.workers, args.rules)
+    elapsed = time.perf_counter() - started
+    played = sum(sum(counts) for counts in totals.values()) // 2
+
+    results = results_frame(totals, args.seed, args.rules)
+    results.write_parquet(args.output)
+    print_matrix(results, players)
+    print(f"\n{played:,} rounds in {elapsed:.1f}s with {args.workers} workers "
+          f"({played / elapsed:,.0f} rounds/s), results in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Bind display values to controls that are built once.
+
+A view creates its controls a single time, then binds named values to
+control attributes. ``update(**values)`` only assigns attributes, and Flet
+already skips attributes whose value did not change, so a refresh sends
+just the properties that actually differ and creates no new controls.
+
+    vm = ViewModel()
+    vm.bind("total", total_text, format="Total Games: {}")
+    vm.bind("win_rate", win_rate_text, "color",
+            format=lambda rate: ft.Colors.GREEN if rate > 50 else ft.Colors.RED)
+    vm.update(total=12, win_rate=58.3)
+"""
+
+
+class ViewModel:
+    def __init__(self):
+        self._bindings = {}
+        self.values = {}
+
+    def bind(self, name, control, attr="value", format=None):
+        if isinstance(format, str):
+            format = format.format
+        self._bindings.setdefault(name, []).append((control, attr, format))
+        return control
+
+    def update(self, **values):
+        for name, value in values.items():
+            self.values[name] = value
+            for control, attr, format in self._bindings.get(name, ()):
+                setattr(control, attr, format(value) if format else value)